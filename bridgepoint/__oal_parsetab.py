@@ -0,0 +1,245 @@
+
+# __oal_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftORleftANDnonassocLESSTHANLEDOUBLEEQUALGTGENOTEQUALleftPLUSMINUSPIPEleftTIMESDIVAMPCARETleftMODrightUNARYACROSS AMP AND ANY ARROW ASSIGN ASSIGNER BREAK BRIDGE BY CARDINALITY CARET CLASS COLON COMMA COMMENT CONTINUE CONTROL CREATE CREATOR DELETE DIV DOT DOUBLECOLON DOUBLEEQUAL EACH ELIF ELSE EMPTY END_FOR END_IF END_WHILE EQUAL EVENT FALSE FOR FRACTION FROM GE GENERATE GT ID IF IN INSTANCE INSTANCES LE LESSTHAN LPAREN LSQBR MANY MINUS MOD NAMESPACE NOT NOTEQUAL NOT_EMPTY NUMBER OBJECT OF ONE OR PARAM PIPE PLUS QMARK RCVD_EVT RELATE RELATED RETURN RPAREN RSQBR SELECT SELECTED SELF SEMICOLON SEND SL_STRING STOP STRING TICKED_PHRASE TIMES TO TRANSFORM TRUE UNRELATE USING WHERE WHILEaction : action_bodyaction_body : block\n        expression : expression PLUS  expression\n                   | expression MINUS expression\n                   | expression PIPE  expression\n                   | expression TIMES expression\n                   | expression DIV   expression\n                   | expression MOD   expression\n                   | expression AMP   expression\n                   | expression CARET expression\n        array : variable_nameblock : statement_list\n        expression : expression LE          expression\n                   | expression LESSTHAN    expression\n                   | expression DOUBLEEQUAL expression\n                   | expression NOTEQUAL    expression\n                   | expression GE          expression\n                   | expression GT          expression\n                   | expression AND         expression\n                   | expression OR          expression\n        statement : BREAKstatement : BRIDGE variable_access EQUAL implicit_invocationstatement : BRIDGE implicit_invocationstatement : TRANSFORM variable_access EQUAL implicit_invocationstatement : TRANSFORM implicit_invocation\n        constant : TRUE\n                 | FALSE\n        constant : namespace DOUBLECOLON identifierconstant : FRACTIONconstant : NUMBERconstant : STRINGstatement : CONTINUEstatement : CONTROL STOPstatement : CREATE EVENT INSTANCE variable_name OF event_specification TO identifier ASSIGNERstatement : CREATE EVENT INSTANCE variable_name OF event_specification TO identifier CLASSstatement : CREATE EVENT INSTANCE variable_name OF event_specification TO identifier CREATORstatement : CREATE EVENT INSTANCE variable_name OF event_specification TO variable_accessstatement : CREATE EVENT INSTANCE variable_name OF event_specification TO self_accessstatement : CREATE OBJECT INSTANCE OF identifierstatement : CREATE OBJECT INSTANCE variable_name OF identifierstatement : DELETE OBJECT INSTANCE instance_nameelif_clause : expression blockelif_list : elif_list : ELIF elif_clause elif_listelse_clause : ELSE blockelse_clause : block : statement : event_data : LPAREN event_parameter_list RPARENevent_data : event_meaning : COLON phraseevent_meaning : event_parameter : identifier COLON expressionevent_parameter_list : event_parameterevent_parameter_list : event_parameter COMMA event_parameter_listevent_parameter_list : event_specification : identifier event_meaning event_datastatement : ASSIGN variable_access EQUAL expressionexpression : constantexpression : variable_accessexpression : self_accessexpression : selected_access\n        field_access : structure    DOT identifier\n                     | index_access DOT identifier\n                     | field_access DOT identifier\n                     | param_access DOT identifier\n        statement : FOR EACH variable_name IN variable_name block END_FORfunction_invocation : DOUBLECOLON identifier LPAREN parameter_list RPARENstatement : invocationstatement : GENERATE event_specification TO identifier ASSIGNERstatement : GENERATE event_specification TO identifier CLASSstatement : GENERATE event_specification TO identifier CREATORstatement : GENERATE event_specification TO variable_accessstatement : GENERATE event_specification TO self_accessstatement : GENERATE variable_accessexpression : LPAREN expression RPAREN\n        identifier : limited_identifier\n              | kw_as_identifier_2\n              | kw_as_identifier_3\n              | kw_as_identifier_4\n        statement : IF expression block elif_list else_clause END_IFstatement : variable_access EQUAL expressionimplicit_invocation : namespace DOUBLECOLON identifier LPAREN parameter_list RPARENindex_access : array        LSQBR expression RSQBR\n                        | index_access LSQBR expression RSQBR\n                        | field_access LSQBR expression RSQBR\n                        | param_access LSQBR expression RSQBR\n        statement : TRANSFORM variable_access EQUAL instance_invocationstatement : TRANSFORM instance_invocationinstance_name : variable_name\n                         | SELF\n        \n        invocation : implicit_invocation\n                   | function_invocation\n                   | instance_invocation\n        expression : invocationkw_as_identifier_1 : ACROSS\n                              | ANY\n                              | ASSIGN\n                              | ASSIGNER\n                              | BREAK\n                              | BY\n                              | CLASS\n                              | CONTINUE\n                              | CONTROL\n                              | CREATE\n                              | CREATOR\n                              | DELETE\n                              | EACH\n                              | EVENT\n                              | FOR\n                              | FROM\n                              | GENERATE\n                              | IN\n                              | INSTANCES\n                              | INSTANCE\n                              | MANY\n                              | OBJECT\n                              | ONE\n                              | RELATED\n                              | RELATE\n                              | SELECT\n                              | STOP\n                              | TO\n                              | WHERE\n                              | UNRELATE\n                              | USING\n        \n        kw_as_identifier_2 : BRIDGE\n                           | CARDINALITY\n                           | EMPTY\n                           | FALSE\n                           | NOT\n                           | NOT_EMPTY\n                           | SEND\n                           | TRANSFORM\n                           | TRUE\n                           | OF\n        \n        kw_as_identifier_3 : PARAM\n                           | RCVD_EVT\n                           | SELECTED\n                           | SELF\n        \n        kw_as_identifier_4 : AND\n                           | ELIF\n                           | ELSE\n                           | IF\n                           | OR\n                           | RETURN\n                           | WHILE\n        \n        limited_identifier : ID\n                           | kw_as_identifier_1\n        \n        namespace : NAMESPACE\n        navigation_chain : navigation_stepnavigation_chain : navigation_step navigation_chainnavigation_step : ARROW identifier LSQBR identifier RSQBRnavigation_step : ARROW identifier LSQBR identifier DOT phrase RSQBRinstance_invocation : structure DOT identifier LPAREN parameter_list RPAREN\n        param : PARAM\n              | RCVD_EVT\n        param_access : param DOT variable_nameparameter : identifier COLON expressionparameter_list : parameterparameter_list : parameter COMMA parameter_listparameter_list : event_specification : identifier TIMES event_meaning event_datastatement : SEND namespace DOUBLECOLON identifier LPAREN parameter_list RPAREN TO expressionstatement : SEND variable_access EQUAL implicit_invocationstatement : SEND implicit_invocationstatement : RELATE instance_name TO instance_name ACROSS rel_idstatement : RELATE instance_name TO instance_name ACROSS rel_id DOT phrasestatement : RELATE instance_name TO instance_name ACROSS rel_id USING instance_namestatement : RELATE instance_name TO instance_name ACROSS rel_id DOT phrase USING instance_namestatement : RETURN expressionstatement : RETURN\n        statement : SELECT ANY variable_name FROM INSTANCES OF identifier\n                  | SELECT MANY variable_name FROM INSTANCES OF identifier\n        \n        statement : SELECT ANY variable_name FROM identifier\n                  | SELECT MANY variable_name FROM identifier\n        \n        statement : SELECT ANY variable_name FROM INSTANCES OF identifier WHERE expression\n                  | SELECT MANY variable_name FROM INSTANCES OF identifier WHERE expression\n        \n        statement : SELECT ANY variable_name FROM identifier WHERE expression\n                  | SELECT MANY variable_name FROM identifier WHERE expression\n        \n        statement : SELECT ONE  variable_name RELATED BY navigation_hook navigation_chain\n                  | SELECT ANY  variable_name RELATED BY navigation_hook navigation_chain\n                  | SELECT MANY variable_name RELATED BY navigation_hook navigation_chain\n        \n        statement : SELECT ONE  variable_name RELATED BY navigation_hook navigation_chain WHERE expression\n                  | SELECT ANY  variable_name RELATED BY navigation_hook navigation_chain WHERE expression\n                  | SELECT MANY variable_name RELATED BY navigation_hook navigation_chain WHERE expression\n        selected_access : SELECTEDself_access : SELFstatement_list : statement SEMICOLON statement_liststatement_list : statement SEMICOLONstructure : variable_namestructure : SELFstructure : SELECTEDexpression : unary_operator expression %prec UNARY\n        unary_operator : NOT\n                       | EMPTY\n                       | NOT_EMPTY\n                       | CARDINALITY\n                       | PLUS\n                       | MINUS\n        statement : UNRELATE instance_name FROM instance_name ACROSS rel_idstatement : UNRELATE instance_name FROM instance_name ACROSS rel_id DOT phrasestatement : UNRELATE instance_name FROM instance_name ACROSS rel_id USING instance_namestatement : UNRELATE instance_name FROM instance_name ACROSS rel_id DOT phrase USING instance_namevariable_access : variable_namevariable_access : field_accessvariable_access : index_accessvariable_access : param_accessvariable_name : limited_identifierstatement : WHILE expression block END_WHILEphrase : TICKED_PHRASEphrase : identifierrel_id : limited_identifier\n        navigation_hook : variable_access\n                        | self_access\n        '
+    
+_lr_action_items = {'NOTEQUAL':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,178,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,178,178,-158,178,-64,-194,178,178,-65,178,178,-66,178,178,-85,-10,None,None,178,None,None,178,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,178,178,-83,-155,178,178,178,178,178,178,178,178,178,]),'OBJECT':([0,1,2,3,4,7,9,10,11,12,13,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,49,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[1,-117,-101,-106,-116,-99,-124,1,1,-207,84,1,-94,1,1,-115,1,-206,1,1,-93,-97,-92,-122,1,-149,-119,-209,-205,-96,-208,-108,-126,-109,1,163,-118,-123,-102,-113,-148,1,-111,-114,1,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,1,1,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,1,-31,-62,1,-188,-61,1,1,1,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,1,1,1,1,1,1,1,1,1,1,1,1,-158,1,1,1,-64,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,-194,1,1,1,1,-65,1,1,1,-66,1,1,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,1,1,-86,1,1,-84,-87,1,1,1,1,1,1,1,1,1,1,1,1,-68,1,1,1,1,1,1,1,1,1,1,1,1,-83,-155,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'TRUE':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[85,124,124,85,85,85,124,-200,-199,-197,-196,-195,-198,85,85,85,124,85,85,124,124,85,124,124,124,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,124,124,124,124,124,124,124,124,124,124,124,85,124,124,124,85,124,124,85,124,85,124,124,85,124,124,124,124,85,85,85,85,85,85,124,124,]),'MINUS':([1,2,3,4,7,9,12,14,15,20,22,27,30,32,33,34,36,37,38,39,40,43,44,45,46,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,155,156,158,166,168,169,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,283,296,297,313,323,326,330,335,338,339,350,353,360,362,365,368,369,370,371,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,86,-94,-115,-206,-93,-97,-92,-122,86,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,86,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,86,-26,-200,-199,-95,-197,-196,-29,-195,191,-27,-198,-59,-30,-187,-60,86,-31,-62,86,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,86,191,86,86,86,191,-158,86,191,-64,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-194,191,191,-65,191,191,-66,191,191,-85,-10,191,191,191,191,191,191,-6,-5,191,191,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,86,86,-68,191,86,86,191,86,-83,-155,191,191,191,86,86,86,86,86,86,191,191,191,191,191,191,]),'RPAREN':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,169,175,194,195,202,204,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,258,260,261,269,275,276,281,282,285,295,297,304,305,310,311,316,329,330,333,338,339,359,360,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-158,-64,-194,246,-162,-65,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-160,297,-86,-56,-84,-87,-162,-162,-162,-162,-68,-54,334,338,339,344,-161,-159,-56,-83,-155,-55,-53,]),'CREATOR':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,148,150,151,152,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,265,266,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,376,378,380,385,392,],[3,-117,-101,-106,-116,-99,-124,3,3,-207,3,-94,3,3,-115,3,-206,3,3,-93,-97,-92,-122,3,-149,-119,-209,-205,-96,-208,-108,-126,-109,3,-118,-123,-102,-113,-148,3,-111,-114,3,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,3,3,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,3,-31,-62,3,-188,-61,3,3,3,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,3,3,3,-139,-77,-138,-137,3,3,3,3,3,3,3,3,3,-158,3,3,3,-64,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,-194,3,3,3,3,-65,3,3,3,-66,3,3,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,3,3,-86,3,301,-140,3,-84,-87,3,3,3,3,3,3,3,3,3,3,3,3,-68,3,3,3,3,3,3,3,3,3,3,3,3,-83,-155,3,3,3,3,3,3,3,3,3,3,3,3,387,3,3,3,3,]),'MANY':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,18,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[4,-117,-101,-106,-116,-99,-124,4,4,-207,4,-94,4,4,115,-115,4,-206,4,4,-93,-97,-92,-122,4,-149,-119,-209,-205,-96,-208,-108,-126,-109,4,-118,-123,-102,-113,-148,4,-111,-114,4,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,4,4,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,4,-31,-62,4,-188,-61,4,4,4,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,4,4,4,4,4,4,4,4,4,4,4,4,-158,4,4,4,-64,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,-194,4,4,4,4,-65,4,4,4,-66,4,4,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,4,4,-86,4,4,-84,-87,4,4,4,4,4,4,4,4,4,4,4,4,-68,4,4,4,4,4,4,4,4,4,4,4,4,-83,-155,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'PLUS':([1,2,3,4,7,9,12,14,15,20,22,27,30,32,33,34,36,37,38,39,40,43,44,45,46,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,85,86,87,88,89,90,91,92,93,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,155,156,158,166,168,169,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,283,296,297,313,323,326,330,335,338,339,350,353,360,362,365,368,369,370,371,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,87,-94,-115,-206,-93,-97,-92,-122,87,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,87,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,87,-26,-200,-199,-95,-197,-196,-29,-195,188,-27,-198,-59,-30,-187,-60,87,-31,-62,87,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,87,188,87,87,87,188,-158,87,188,-64,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-194,188,188,-65,188,188,-66,188,188,-85,-10,188,188,188,188,188,188,-6,-5,188,188,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,87,87,-68,188,87,87,188,87,-83,-155,188,188,188,87,87,87,87,87,87,188,188,188,188,188,188,]),'GT':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,187,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,187,187,-158,187,-64,-194,187,187,-65,187,187,-66,187,187,-85,-10,None,None,187,None,None,187,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,187,187,-83,-155,187,187,187,187,187,187,187,187,187,]),'ASSIGNER':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,148,150,151,152,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,265,266,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,376,378,380,385,392,],[7,-117,-101,-106,-116,-99,-124,7,7,-207,7,-94,7,7,-115,7,-206,7,7,-93,-97,-92,-122,7,-149,-119,-209,-205,-96,-208,-108,-126,-109,7,-118,-123,-102,-113,-148,7,-111,-114,7,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,7,7,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,7,-31,-62,7,-188,-61,7,7,7,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,7,7,7,-139,-77,-138,-137,7,7,7,7,7,7,7,7,7,-158,7,7,7,-64,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,-194,7,7,7,7,-65,7,7,7,-66,7,7,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,7,7,-86,7,300,-140,7,-84,-87,7,7,7,7,7,7,7,7,7,7,7,7,-68,7,7,7,7,7,7,7,7,7,7,7,7,-83,-155,7,7,7,7,7,7,7,7,7,7,7,7,386,7,7,7,7,]),'NAMESPACE':([0,1,2,3,4,7,9,10,12,14,15,17,20,22,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,155,156,157,158,166,168,169,171,173,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,198,204,215,216,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,283,296,297,299,313,314,323,326,335,338,339,362,365,368,369,370,371,],[8,-117,-101,-106,-116,-99,-124,8,-207,8,-94,8,-115,-206,-93,-97,-92,-122,8,-149,-119,-209,-205,-96,-208,-108,-126,-109,8,-118,-123,-102,-113,-148,8,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,8,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,8,-31,-62,8,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,8,8,8,8,8,8,8,-158,8,8,-64,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-194,8,-65,-66,8,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,8,8,-68,8,8,8,8,8,8,-83,-155,8,8,8,8,8,8,]),'GE':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,182,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,182,182,-158,182,-64,-194,182,182,-65,182,182,-66,182,182,-85,-10,None,None,182,None,None,182,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,182,182,-83,-155,182,182,182,182,182,182,182,182,182,]),'ARROW':([1,2,3,4,7,9,12,20,22,30,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,106,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,169,175,204,215,225,227,261,275,276,320,321,322,325,328,349,393,395,],[-117,-101,-106,-116,-99,-124,-207,-115,-206,-97,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-188,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-158,-64,-65,-66,-63,-85,-86,-84,-87,348,-214,-215,348,348,348,-153,-154,]),'TICKED_PHRASE':([210,346,357,392,],[272,272,272,272,]),'WHERE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,347,348,349,351,352,354,355,356,357,361,362,365,367,368,369,370,371,378,380,385,392,393,395,],[9,-117,-101,-106,-116,-99,-124,9,9,-207,9,-94,9,9,-115,9,-206,9,9,-93,-97,-92,-122,9,-149,-119,-209,-205,-96,-208,-108,-126,-109,9,-118,-123,-102,-113,-148,9,-111,-114,9,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,9,9,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,9,-31,-62,9,-188,-61,9,9,9,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,9,9,9,9,9,9,9,9,9,9,9,9,-158,9,9,9,-64,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,-194,9,9,9,9,-65,9,9,9,-66,9,9,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,9,9,-86,9,9,-84,-87,9,9,9,9,9,9,9,9,323,-114,9,326,-114,9,9,9,-68,9,9,9,9,9,9,9,9,9,9,9,9,-83,-155,9,9,365,9,-151,368,369,370,371,9,9,9,9,9,-152,9,9,9,9,9,9,9,9,-153,-154,]),'OF':([1,2,3,4,7,9,20,21,26,30,33,36,37,38,40,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,144,159,165,167,170,172,193,196,202,207,210,217,254,256,269,278,279,280,281,282,285,287,290,293,295,307,309,324,327,333,346,348,357,361,380,392,],[-117,-101,-106,-116,-99,-124,-115,137,137,-97,-122,-149,-119,-209,-96,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,137,137,137,137,137,137,137,137,137,137,137,137,279,137,137,137,307,137,309,137,137,137,137,324,327,137,137,137,137,137,137,137,137,137,137,137,137,]),'SEND':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[10,-117,-101,-106,-116,-99,-124,-207,-94,-115,139,-206,139,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,139,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,139,10,10,139,139,139,10,-158,139,139,-64,139,-194,139,139,-65,139,139,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,139,139,-86,139,-84,-87,139,139,139,139,139,139,-68,10,139,139,10,10,139,139,139,-83,-155,139,139,139,139,139,139,]),'CLASS':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,148,150,151,152,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,265,266,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,376,378,380,385,392,],[55,-117,-101,-106,-116,-99,-124,55,55,-207,55,-94,55,55,-115,55,-206,55,55,-93,-97,-92,-122,55,-149,-119,-209,-205,-96,-208,-108,-126,-109,55,-118,-123,-102,-113,-148,55,-111,-114,55,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,55,55,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,55,-31,-62,55,-188,-61,55,55,55,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,55,55,55,-139,-77,-138,-137,55,55,55,55,55,55,55,55,55,-158,55,55,55,-64,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-194,55,55,55,55,-65,55,55,55,-66,55,55,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,55,55,-86,55,302,-140,55,-84,-87,55,55,55,55,55,55,55,55,55,55,55,55,-68,55,55,55,55,55,55,55,55,55,55,55,55,-83,-155,55,55,55,55,55,55,55,55,55,55,55,55,388,55,55,55,55,]),'INSTANCE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,84,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,163,164,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[20,-117,-101,-106,-116,-99,-124,20,20,-207,20,-94,20,20,-115,20,-206,20,20,-93,-97,-92,-122,20,-149,-119,-209,-205,-96,-208,-108,-126,-109,20,-118,-123,-102,-113,-148,20,-111,-114,20,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,20,20,176,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,20,-31,-62,20,-188,-61,20,20,20,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,20,20,20,20,20,20,20,20,217,218,20,20,20,20,-158,20,20,20,-64,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-194,20,20,20,20,-65,20,20,20,-66,20,20,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,20,20,-86,20,20,-84,-87,20,20,20,20,20,20,20,20,20,20,20,20,-68,20,20,20,20,20,20,20,20,20,20,20,20,-83,-155,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'OR':([1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,159,165,167,168,169,170,172,174,175,193,194,195,196,202,203,204,207,210,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,307,309,313,324,327,330,333,338,339,346,348,350,353,357,360,361,377,379,380,381,382,383,384,392,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,142,-206,142,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,142,-26,-95,-29,183,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,142,183,142,142,142,183,-158,142,142,183,-64,142,-194,183,142,142,183,-65,142,142,183,183,-66,183,183,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,142,142,-86,142,-84,-87,142,142,142,142,142,142,-68,142,142,183,142,142,183,142,-83,-155,142,142,183,183,142,183,142,183,183,142,183,183,183,183,142,]),'DELETE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[13,-117,-101,-106,-116,-99,-124,75,75,-207,75,-94,75,75,-115,75,-206,75,75,-93,-97,-92,-122,75,-149,-119,-209,-205,-96,-208,-108,-126,-109,75,-118,-123,-102,-113,-148,75,-111,-114,75,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,75,75,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,75,-31,-62,75,-188,-61,75,75,75,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,75,75,75,13,75,13,75,75,75,75,75,13,-158,75,75,75,-64,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-194,75,75,75,75,-65,75,75,75,-66,75,75,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,75,75,-86,75,75,-84,-87,75,75,75,75,75,75,75,75,75,75,75,75,-68,75,13,75,75,13,13,75,75,75,75,75,75,-83,-155,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'CARET':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,177,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,177,177,-158,177,-64,-194,177,177,-65,177,177,-66,177,177,-85,-10,177,177,177,177,177,177,-6,177,177,177,177,-9,-7,177,-8,-28,-76,-63,-86,-84,-87,-68,177,177,-83,-155,177,177,177,177,177,177,177,177,177,]),'RETURN':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[14,-117,-101,-106,-116,-99,-124,-207,-94,-115,119,-206,119,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,119,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,119,14,14,119,119,119,14,-158,119,119,-64,119,-194,119,119,-65,119,119,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,119,119,-86,119,-84,-87,119,119,119,119,119,119,-68,14,119,119,14,14,119,119,119,-83,-155,119,119,119,119,119,119,]),'RELATE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[16,-117,-101,-106,-116,-99,-124,67,67,-207,67,-94,67,67,-115,67,-206,67,67,-93,-97,-92,-122,67,-149,-119,-209,-205,-96,-208,-108,-126,-109,67,-118,-123,-102,-113,-148,67,-111,-114,67,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,67,67,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,67,-31,-62,67,-188,-61,67,67,67,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,67,67,67,16,67,16,67,67,67,67,67,16,-158,67,67,67,-64,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-194,67,67,67,67,-65,67,67,67,-66,67,67,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,67,67,-86,67,67,-84,-87,67,67,67,67,67,67,67,67,67,67,67,67,-68,67,16,67,67,16,16,67,67,67,67,67,67,-83,-155,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'TRANSFORM':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[17,-117,-101,-106,-116,-99,-124,-207,-94,-115,120,-206,120,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,120,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,120,17,17,120,120,120,17,-158,120,120,-64,120,-194,120,120,-65,120,120,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,120,120,-86,120,-84,-87,120,120,120,120,120,120,-68,17,120,120,17,17,120,120,120,-83,-155,120,120,120,120,120,120,]),'NOT_EMPTY':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[89,126,126,89,89,89,126,-200,-199,-197,-196,-195,-198,89,89,89,126,89,89,126,126,89,126,126,126,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,126,126,126,126,126,126,126,126,126,126,126,89,126,126,126,89,126,126,89,126,89,126,126,89,126,126,126,126,89,89,89,89,89,89,126,126,]),'SELECT':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[18,-117,-101,-106,-116,-99,-124,74,74,-207,74,-94,74,74,-115,74,-206,74,74,-93,-97,-92,-122,74,-149,-119,-209,-205,-96,-208,-108,-126,-109,74,-118,-123,-102,-113,-148,74,-111,-114,74,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,74,74,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,74,-31,-62,74,-188,-61,74,74,74,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,74,74,74,18,74,18,74,74,74,74,74,18,-158,74,74,74,-64,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-194,74,74,74,74,-65,74,74,74,-66,74,74,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,74,74,-86,74,74,-84,-87,74,74,74,74,74,74,74,74,74,74,74,74,-68,74,18,74,74,18,18,74,74,74,74,74,74,-83,-155,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'BY':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,253,254,255,256,257,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[2,-117,-101,-106,-116,-99,-124,2,2,-207,2,-94,2,2,-115,2,-206,2,2,-93,-97,-92,-122,2,-149,-119,-209,-205,-96,-208,-108,-126,-109,2,-118,-123,-102,-113,-148,2,-111,-114,2,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,2,2,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,2,-31,-62,2,-188,-61,2,2,2,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,2,2,2,2,2,2,2,2,2,2,2,2,-158,2,2,2,-64,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,-194,2,2,2,2,-65,2,2,2,-66,2,2,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,288,2,291,2,294,-86,2,2,-84,-87,2,2,2,2,2,2,2,2,2,2,2,2,-68,2,2,2,2,2,2,2,2,2,2,2,2,-83,-155,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'COLON':([1,2,3,4,7,9,20,30,33,36,37,40,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,148,150,151,152,153,154,208,259,306,],[-117,-101,-106,-116,-99,-124,-115,-97,-122,-149,-119,-96,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-139,-77,-138,-137,-140,210,210,296,335,]),'FRACTION':([14,34,61,82,86,87,89,90,92,95,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[91,91,91,91,-200,-199,-197,-196,-195,-198,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,]),'DOUBLECOLON':([0,1,2,3,4,7,8,9,12,14,15,20,22,27,30,32,33,34,36,37,38,39,40,43,44,45,46,51,53,54,55,58,59,61,62,64,67,68,69,70,71,73,74,75,76,78,79,80,82,85,86,87,88,89,90,91,92,94,95,96,97,98,99,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,155,156,157,158,166,168,169,173,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,204,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,283,296,297,299,313,314,323,326,335,338,339,362,365,368,369,370,371,],[21,-117,-101,-106,-116,-99,-150,-124,-207,21,-94,-115,-206,-93,-97,-92,-122,21,-149,-119,-209,-205,-96,-208,-108,-126,-109,165,-118,-123,-102,-113,-148,21,-111,-114,-120,-104,-110,-105,170,-112,-121,-107,-125,-98,-100,-103,21,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,193,-60,21,-31,-62,21,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,21,21,21,21,21,21,21,-158,21,-64,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-194,-65,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,21,21,-68,21,21,21,21,21,21,-83,-155,21,21,21,21,21,21,]),'AMP':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,189,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,189,189,-158,189,-64,-194,189,189,-65,189,189,-66,189,189,-85,-10,189,189,189,189,189,189,-6,189,189,189,189,-9,-7,189,-8,-28,-76,-63,-86,-84,-87,-68,189,189,-83,-155,189,189,189,189,189,189,189,189,189,]),'$end':([0,29,31,56,57,157,213,],[-47,0,-2,-1,-12,-190,-189,]),'UNRELATE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[23,-117,-101,-106,-116,-99,-124,76,76,-207,76,-94,76,76,-115,76,-206,76,76,-93,-97,-92,-122,76,-149,-119,-209,-205,-96,-208,-108,-126,-109,76,-118,-123,-102,-113,-148,76,-111,-114,76,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,76,76,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,76,-31,-62,76,-188,-61,76,76,76,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,76,76,76,23,76,23,76,76,76,76,76,23,-158,76,76,76,-64,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-194,76,76,76,76,-65,76,76,76,-66,76,76,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,76,76,-86,76,76,-84,-87,76,76,76,76,76,76,76,76,76,76,76,76,-68,76,23,76,76,23,23,76,76,76,76,76,76,-83,-155,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'FOR':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[24,-117,-101,-106,-116,-99,-124,69,69,-207,69,-94,69,69,-115,69,-206,69,69,-93,-97,-92,-122,69,-149,-119,-209,-205,-96,-208,-108,-126,-109,69,-118,-123,-102,-113,-148,69,-111,-114,69,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,69,69,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,69,-31,-62,69,-188,-61,69,69,69,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,69,69,69,24,69,24,69,69,69,69,69,24,-158,69,69,69,-64,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-194,69,69,69,69,-65,69,69,69,-66,69,69,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,69,69,-86,69,69,-84,-87,69,69,69,69,69,69,69,69,69,69,69,69,-68,69,24,69,69,24,24,69,69,69,69,69,69,-83,-155,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'PARAM':([0,1,2,3,4,7,9,10,11,12,14,15,17,20,21,22,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,155,156,157,158,159,165,166,167,168,169,170,172,173,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,283,285,287,288,291,294,295,296,297,299,307,309,313,314,323,324,326,327,333,335,338,339,346,348,357,361,362,365,368,369,370,371,380,392,],[25,-117,-101,-106,-116,-99,-124,25,25,-207,25,-94,25,-115,131,-206,152,-93,-97,-92,-122,25,-149,-119,-209,-205,-96,-208,-108,-126,-109,25,-118,-123,-102,-113,-148,25,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,25,131,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,25,-31,-62,25,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,25,131,25,25,25,25,131,131,25,131,25,-158,131,131,25,-64,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,131,-194,131,131,-65,152,131,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,131,131,-86,131,-84,-87,131,131,131,25,131,131,25,25,25,131,25,-68,25,131,131,25,25,25,131,25,131,131,25,-83,-155,131,131,131,152,25,25,25,25,25,25,131,131,]),'ELSE':([1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,57,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,213,215,222,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,284,285,287,295,297,307,309,312,313,324,327,333,338,339,340,341,346,348,357,361,380,392,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,132,-206,132,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-12,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,132,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,132,-190,132,132,132,-47,-158,132,132,-64,132,-194,132,132,-65,132,132,-189,-66,-43,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,132,132,-86,132,-84,-87,132,132,132,314,132,132,132,-68,132,132,-43,-47,132,132,132,-83,-155,-44,-42,132,132,132,132,132,132,]),'GENERATE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[26,-117,-101,-106,-116,-99,-124,73,73,-207,73,-94,73,73,-115,73,-206,73,73,-93,-97,-92,-122,73,-149,-119,-209,-205,-96,-208,-108,-126,-109,73,-118,-123,-102,-113,-148,73,-111,-114,73,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,73,73,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,73,-31,-62,73,-188,-61,73,73,73,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,73,73,73,26,73,26,73,73,73,73,73,26,-158,73,73,73,-64,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-194,73,73,73,73,-65,73,73,73,-66,73,73,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,73,73,-86,73,73,-84,-87,73,73,73,73,73,73,73,73,73,73,73,73,-68,73,26,73,73,26,26,73,73,73,73,73,73,-83,-155,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'AND':([1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,159,165,167,168,169,170,172,174,175,193,194,195,196,202,203,204,207,210,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,307,309,313,324,327,330,333,338,339,346,348,350,353,357,360,361,377,379,380,381,382,383,384,392,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,134,-206,134,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,134,-26,-95,-29,180,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,134,180,134,134,134,180,-158,134,134,180,-64,134,-194,180,134,134,180,-65,134,134,180,180,-66,180,180,-85,-10,-16,-13,-19,-15,-17,180,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,134,134,-86,134,-84,-87,134,134,134,134,134,134,-68,134,134,180,134,134,180,134,-83,-155,134,134,180,180,134,180,134,180,180,134,180,180,180,180,134,]),'CONTINUE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[28,-117,-101,-106,-116,-99,-124,80,80,-207,80,-94,80,80,-115,80,-206,80,80,-93,-97,-92,-122,80,-149,-119,-209,-205,-96,-208,-108,-126,-109,80,-118,-123,-102,-113,-148,80,-111,-114,80,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,80,80,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,80,-31,-62,80,-188,-61,80,80,80,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,80,80,80,28,80,28,80,80,80,80,80,28,-158,80,80,80,-64,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-194,80,80,80,80,-65,80,80,80,-66,80,80,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,80,80,-86,80,80,-84,-87,80,80,80,80,80,80,80,80,80,80,80,80,-68,80,28,80,80,28,28,80,80,80,80,80,80,-83,-155,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'NOT':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[92,140,140,92,92,92,140,-200,-199,-197,-196,-195,-198,92,92,92,140,92,92,140,140,92,140,140,140,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,140,140,140,140,140,140,140,140,140,140,140,92,140,140,140,92,140,140,92,140,92,140,140,92,140,140,140,140,92,92,92,92,92,92,140,140,]),'ANY':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,18,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[30,-117,-101,-106,-116,-99,-124,30,30,-207,30,-94,30,30,116,-115,30,-206,30,30,-93,-97,-92,-122,30,-149,-119,-209,-205,-96,-208,-108,-126,-109,30,-118,-123,-102,-113,-148,30,-111,-114,30,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,30,30,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,30,-31,-62,30,-188,-61,30,30,30,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,30,30,30,30,30,30,30,30,30,30,30,30,-158,30,30,30,-64,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-194,30,30,30,30,-65,30,30,30,-66,30,30,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,30,30,-86,30,30,-84,-87,30,30,30,30,30,30,30,30,30,30,30,30,-68,30,30,30,30,30,30,30,30,30,30,30,30,-83,-155,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'MOD':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,192,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,192,192,-158,192,-64,-194,192,192,-65,192,192,-66,192,192,-85,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,-8,-28,-76,-63,-86,-84,-87,-68,192,192,-83,-155,192,192,192,192,192,192,192,192,192,]),'END_FOR':([1,2,3,4,7,9,20,30,33,36,37,38,40,44,45,46,53,54,55,57,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,157,213,299,332,],[-117,-101,-106,-116,-99,-124,-115,-97,-122,-149,-119,-209,-96,-108,-126,-109,-118,-123,-102,-12,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-190,-189,-47,358,]),'STOP':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,48,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[33,-117,-101,-106,-116,-99,-124,33,33,-207,33,-94,33,33,-115,33,-206,33,33,-93,-97,-92,-122,33,-149,-119,-209,-205,-96,-208,-108,-126,-109,33,162,-118,-123,-102,-113,-148,33,-111,-114,33,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,33,33,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,33,-31,-62,33,-188,-61,33,33,33,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,33,33,33,33,33,33,33,33,33,33,33,33,-158,33,33,33,-64,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-194,33,33,33,33,-65,33,33,33,-66,33,33,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,33,33,-86,33,33,-84,-87,33,33,33,33,33,33,33,33,33,33,33,33,-68,33,33,33,33,33,33,33,33,33,33,33,33,-83,-155,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'WHILE':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[34,-117,-101,-106,-116,-99,-124,-207,-94,-115,121,-206,121,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,121,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,121,34,34,121,121,121,34,-158,121,121,-64,121,-194,121,121,-65,121,121,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,121,121,-86,121,-84,-87,121,121,121,121,121,121,-68,34,121,121,34,34,121,121,121,-83,-155,121,121,121,121,121,121,]),'DOT':([1,2,3,4,5,7,9,11,12,13,16,18,19,20,22,23,24,25,26,28,30,33,36,37,38,39,40,41,43,44,45,46,48,49,50,53,54,55,58,59,60,62,63,64,67,68,69,70,73,74,75,76,77,78,79,80,98,105,106,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,148,150,151,152,153,169,175,204,215,221,225,227,247,251,252,261,266,275,276,317,318,331,390,],[-117,-101,-106,-116,65,-99,-124,-98,83,-107,-120,-121,-100,-115,144,-125,-110,-156,-112,-103,-97,-122,-149,-119,-209,-191,-96,-157,159,-108,-126,-109,-104,-105,-193,-118,-123,-102,-113,-148,167,-111,-192,-114,-120,-104,-110,-105,-112,-121,-107,-125,172,-98,-100,-103,-193,196,-192,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-193,-209,-157,-156,-192,-158,-64,-65,-66,-63,-63,-85,-63,-191,287,-86,-192,-84,-87,346,-213,357,392,]),'SEMICOLON':([0,1,2,3,4,6,7,9,12,14,15,19,20,22,27,28,30,32,33,36,37,38,39,40,42,43,44,45,46,53,54,55,58,59,62,64,66,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,109,110,111,112,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,149,150,155,157,160,162,168,169,175,194,204,215,220,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,249,250,261,264,266,267,272,273,274,275,276,277,289,290,292,293,297,299,300,301,302,308,313,314,317,318,331,336,338,339,343,344,347,349,350,351,352,353,354,355,358,363,364,367,372,373,374,375,377,379,381,382,383,384,386,387,388,389,391,393,395,],[-48,-117,-101,-106,-116,-69,-99,-124,-207,-172,-94,-21,-115,-206,-93,-32,-97,-92,-122,-149,-119,-209,-205,-96,157,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-166,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-171,-27,-59,-30,-187,-60,-31,-62,-188,-61,-90,-91,-25,-89,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-75,-209,-48,-48,-23,-33,-48,-158,-64,-194,-65,-66,-82,-165,-63,-58,-85,-41,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-24,-88,-86,-73,-188,-74,-211,-212,-210,-84,-87,-22,-176,-114,-175,-114,-68,-48,-70,-72,-71,-39,-48,-48,-167,-213,-201,-40,-83,-155,-81,-83,-181,-151,-180,-174,-183,-179,-173,-182,-67,-169,-168,-152,-203,-202,-37,-38,-164,-184,-178,-186,-177,-185,-34,-36,-35,-170,-204,-153,-154,]),'RELATED':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,199,200,201,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[37,-117,-101,-106,-116,-99,-124,37,37,-207,37,-94,37,37,-115,37,-206,37,37,-93,-97,-92,-122,37,-149,-119,-209,-205,-96,-208,-108,-126,-109,37,-118,-123,-102,-113,-148,37,-111,-114,37,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,37,37,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,37,-31,-62,37,-188,-61,37,37,37,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,37,37,37,37,37,37,37,37,37,37,37,37,-158,37,37,37,-64,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-194,37,37,37,253,255,257,37,-65,37,37,37,-66,37,37,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,37,37,-86,37,37,-84,-87,37,37,37,37,37,37,37,37,37,37,37,37,-68,37,37,37,37,37,37,37,37,37,37,37,37,-83,-155,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'PIPE':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,185,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,185,185,-158,185,-64,-194,185,185,-65,185,185,-66,185,185,-85,-10,185,185,185,185,185,185,-6,-5,185,185,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,185,185,-83,-155,185,185,185,185,185,185,185,185,185,]),'ACROSS':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,109,110,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,254,256,261,262,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[40,-117,-101,-106,-116,-99,-124,40,40,-207,40,-94,40,40,-115,40,-206,40,40,-93,-97,-92,-122,40,-149,-119,-209,-205,-96,-208,-108,-126,-109,40,-118,-123,-102,-113,-148,40,-111,-114,40,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,40,40,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,40,-31,-62,40,-188,-61,-90,-91,40,40,40,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,40,40,40,40,40,40,40,40,40,40,40,40,-158,40,40,40,-64,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-194,40,40,40,40,-65,40,40,40,-66,40,40,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,286,40,40,-86,298,40,40,-84,-87,40,40,40,40,40,40,40,40,40,40,40,40,-68,40,40,40,40,40,40,40,40,40,40,40,40,-83,-155,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'RCVD_EVT':([0,1,2,3,4,7,9,10,11,12,14,15,17,20,21,22,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,155,156,157,158,159,165,166,167,168,169,170,172,173,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,283,285,287,288,291,294,295,296,297,299,307,309,313,314,323,324,326,327,333,335,338,339,346,348,357,361,362,365,368,369,370,371,380,392,],[41,-117,-101,-106,-116,-99,-124,41,41,-207,41,-94,41,-115,130,-206,151,-93,-97,-92,-122,41,-149,-119,-209,-205,-96,-208,-108,-126,-109,41,-118,-123,-102,-113,-148,41,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,41,130,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,41,-31,-62,41,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,41,130,41,41,41,41,130,130,41,130,41,-158,130,130,41,-64,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,130,-194,130,130,-65,151,130,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,130,130,-86,130,-84,-87,130,130,130,41,130,130,41,41,41,130,41,-68,41,130,130,41,41,41,130,41,130,130,41,-83,-155,130,130,130,151,41,41,41,41,41,41,130,130,]),'END_IF':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,57,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,157,168,169,175,194,204,213,215,222,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,284,297,312,313,314,315,338,339,340,341,342,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-12,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-190,-47,-158,-64,-194,-65,-189,-66,-43,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-46,-68,-43,-47,-47,343,-83,-155,-44,-42,-45,]),'DOUBLEEQUAL':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,181,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,181,181,-158,181,-64,-194,181,181,-65,181,181,-66,181,181,-85,-10,None,None,181,None,None,181,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,181,181,-83,-155,181,181,181,181,181,181,181,181,181,]),'EQUAL':([1,2,3,4,7,9,11,12,13,16,18,19,20,22,23,24,26,28,30,33,36,37,38,39,40,43,44,45,46,48,49,52,53,54,55,58,59,62,64,67,68,69,70,72,73,74,75,76,78,79,80,81,113,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,161,169,175,204,215,221,225,227,261,275,276,],[-117,-101,-106,-116,-99,-124,-98,-207,-107,-120,-121,-100,-115,-206,-125,-110,-112,-103,-97,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-104,-105,166,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,171,-112,-121,-107,-125,-98,-100,-103,173,198,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,216,-158,-64,-65,-66,-63,-63,-85,-86,-84,-87,]),'END_WHILE':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,57,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,157,169,175,194,204,211,213,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,338,339,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-12,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-47,-190,-158,-64,-194,-65,274,-189,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,-83,-155,]),'FALSE':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[94,136,136,94,94,94,136,-200,-199,-197,-196,-195,-198,94,94,94,136,94,94,136,136,94,136,136,136,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,136,136,136,136,136,136,136,136,136,136,136,94,136,136,136,94,136,136,94,136,94,136,136,94,136,136,136,136,94,94,94,94,94,94,136,136,]),'BREAK':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[19,-117,-101,-106,-116,-99,-124,79,79,-207,79,-94,79,79,-115,79,-206,79,79,-93,-97,-92,-122,79,-149,-119,-209,-205,-96,-208,-108,-126,-109,79,-118,-123,-102,-113,-148,79,-111,-114,79,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,79,79,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,79,-31,-62,79,-188,-61,79,79,79,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,79,79,79,19,79,19,79,79,79,79,79,19,-158,79,79,79,-64,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-194,79,79,79,79,-65,79,79,79,-66,79,79,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,79,79,-86,79,79,-84,-87,79,79,79,79,79,79,79,79,79,79,79,79,-68,79,19,79,79,19,19,79,79,79,79,79,79,-83,-155,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'EACH':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,24,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[44,-117,-101,-106,-116,-99,-124,44,44,-207,44,-94,44,44,-115,44,-206,44,146,44,-93,-97,-92,-122,44,-149,-119,-209,-205,-96,-208,-108,-126,-109,44,-118,-123,-102,-113,-148,44,-111,-114,44,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,44,44,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,44,-31,-62,44,-188,-61,44,44,44,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,44,44,44,44,44,44,44,44,44,44,44,44,-158,44,44,44,-64,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-194,44,44,44,44,-65,44,44,44,-66,44,44,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,44,44,-86,44,44,-84,-87,44,44,44,44,44,44,44,44,44,44,44,44,-68,44,44,44,44,44,44,44,44,44,44,44,44,-83,-155,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'USING':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,272,273,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,317,318,323,324,326,327,331,333,335,338,339,345,346,348,356,357,361,362,364,365,368,369,370,371,373,378,380,385,392,],[45,-117,-101,-106,-116,-99,-124,45,45,-207,45,-94,45,45,-115,45,-206,45,45,-93,-97,-92,-122,45,-149,-119,-209,-205,-96,-208,-108,-126,-109,45,-118,-123,-102,-113,-148,45,-111,-114,45,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,45,45,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,45,-31,-62,45,-188,-61,45,45,45,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,45,45,45,45,45,45,45,45,45,45,45,45,-158,45,45,45,-64,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-194,45,45,45,45,-65,45,45,45,-66,45,45,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,45,45,-86,45,45,-211,-212,-84,-87,45,45,45,45,45,45,45,45,45,45,45,45,-68,45,45,45,45,45,45,345,-213,45,45,45,45,356,45,45,-83,-155,45,45,45,45,45,45,45,378,45,45,45,45,45,385,45,45,45,45,]),'CARDINALITY':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[95,141,141,95,95,95,141,-200,-199,-197,-196,-195,-198,95,95,95,141,95,95,141,141,95,141,141,141,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,141,141,141,141,141,141,141,141,141,141,141,95,141,141,141,95,141,141,95,141,95,141,141,95,141,141,141,141,95,95,95,95,95,95,141,141,]),'EVENT':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,49,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[46,-117,-101,-106,-116,-99,-124,46,46,-207,46,-94,46,46,-115,46,-206,46,46,-93,-97,-92,-122,46,-149,-119,-209,-205,-96,-208,-108,-126,-109,46,164,-118,-123,-102,-113,-148,46,-111,-114,46,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,46,46,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,46,-31,-62,46,-188,-61,46,46,46,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,46,46,46,46,46,46,46,46,46,46,46,46,-158,46,46,46,-64,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-194,46,46,46,46,-65,46,46,46,-66,46,46,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,46,46,-86,46,46,-84,-87,46,46,46,46,46,46,46,46,46,46,46,46,-68,46,46,46,46,46,46,46,46,46,46,46,46,-83,-155,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'BRIDGE':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[47,-117,-101,-106,-116,-99,-124,-207,-94,-115,117,-206,117,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,117,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,117,47,47,117,117,117,47,-158,117,117,-64,117,-194,117,117,-65,117,117,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,117,117,-86,117,-84,-87,117,117,117,117,117,117,-68,47,117,117,47,47,117,117,117,-83,-155,117,117,117,117,117,117,]),'ELIF':([1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,57,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,213,215,222,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,307,309,312,313,324,327,333,338,339,341,346,348,357,361,380,392,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,118,-206,118,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-12,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,118,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,118,-190,118,118,118,-47,-158,118,118,-64,118,-194,118,118,-65,118,118,-189,-66,283,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,118,118,-86,118,-84,-87,118,118,118,118,118,118,-68,118,118,283,-47,118,118,118,-83,-155,-42,118,118,118,118,118,118,]),'NUMBER':([14,34,61,82,86,87,89,90,92,95,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[97,97,97,97,-200,-199,-197,-196,-195,-198,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'LESSTHAN':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,186,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,186,186,-158,186,-64,-194,186,186,-65,186,186,-66,186,186,-85,-10,None,None,186,None,None,186,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,186,186,-83,-155,186,186,186,186,186,186,186,186,186,]),'DIV':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,190,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,190,190,-158,190,-64,-194,190,190,-65,190,190,-66,190,190,-85,-10,190,190,190,190,190,190,-6,190,190,190,190,-9,-7,190,-8,-28,-76,-63,-86,-84,-87,-68,190,190,-83,-155,190,190,190,190,190,190,190,190,190,]),'CONTROL':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[48,-117,-101,-106,-116,-99,-124,68,68,-207,68,-94,68,68,-115,68,-206,68,68,-93,-97,-92,-122,68,-149,-119,-209,-205,-96,-208,-108,-126,-109,68,-118,-123,-102,-113,-148,68,-111,-114,68,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,68,68,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,68,-31,-62,68,-188,-61,68,68,68,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,68,68,68,48,68,48,68,68,68,68,68,48,-158,68,68,68,-64,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-194,68,68,68,68,-65,68,68,68,-66,68,68,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,68,68,-86,68,68,-84,-87,68,68,68,68,68,68,68,68,68,68,68,68,-68,68,48,68,68,48,48,68,68,68,68,68,68,-83,-155,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'LE':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,179,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,179,179,-158,179,-64,-194,179,179,-65,179,179,-66,179,179,-85,-10,None,None,179,None,None,179,-6,-5,None,None,-3,-9,-7,-4,-8,-28,-76,-63,-86,-84,-87,-68,179,179,-83,-155,179,179,179,179,179,179,179,179,179,]),'CREATE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[49,-117,-101,-106,-116,-99,-124,70,70,-207,70,-94,70,70,-115,70,-206,70,70,-93,-97,-92,-122,70,-149,-119,-209,-205,-96,-208,-108,-126,-109,70,-118,-123,-102,-113,-148,70,-111,-114,70,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,70,70,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,70,-31,-62,70,-188,-61,70,70,70,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,70,70,70,49,70,49,70,70,70,70,70,49,-158,70,70,70,-64,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-194,70,70,70,70,-65,70,70,70,-66,70,70,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,70,70,-86,70,70,-84,-87,70,70,70,70,70,70,70,70,70,70,70,70,-68,70,49,70,70,49,49,70,70,70,70,70,70,-83,-155,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'SELECTED':([0,1,2,3,4,7,9,10,11,12,14,15,17,20,21,22,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,155,156,157,158,159,165,166,167,168,169,170,172,173,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,198,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,283,285,287,288,291,294,295,296,297,299,307,309,313,314,323,324,326,327,333,335,338,339,346,348,357,361,362,365,368,369,370,371,380,392,],[50,-117,-101,-106,-116,-99,-124,50,50,-207,98,-94,50,-115,127,-206,148,-93,-97,-92,-122,98,-149,-119,-209,-205,-96,-208,-108,-126,-109,50,-118,-123,-102,-113,-148,98,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,98,127,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,98,-31,-62,98,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,98,127,50,98,50,98,127,127,98,127,50,-158,127,127,98,-64,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,127,-194,127,50,127,-65,148,127,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,127,127,-86,127,-84,-87,127,127,127,98,127,127,50,50,50,127,98,-68,50,127,127,50,50,98,127,98,127,127,98,-83,-155,127,127,127,148,98,98,98,98,98,98,127,127,]),'ONE':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,18,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[53,-117,-101,-106,-116,-99,-124,53,53,-207,53,-94,53,53,114,-115,53,-206,53,53,-93,-97,-92,-122,53,-149,-119,-209,-205,-96,-208,-108,-126,-109,53,-118,-123,-102,-113,-148,53,-111,-114,53,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,53,53,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,53,-31,-62,53,-188,-61,53,53,53,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,53,53,53,53,53,53,53,53,53,53,53,53,-158,53,53,53,-64,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-194,53,53,53,53,-65,53,53,53,-66,53,53,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,53,53,-86,53,53,-84,-87,53,53,53,53,53,53,53,53,53,53,53,53,-68,53,53,53,53,53,53,53,53,53,53,53,53,-83,-155,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'TO':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,108,109,110,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,147,148,150,151,152,153,154,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,208,209,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,268,269,270,271,272,273,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,303,307,309,313,314,323,324,326,327,333,334,335,337,338,339,344,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[54,-117,-101,-106,-116,-99,-124,54,54,-207,54,-94,54,54,-115,54,-206,54,54,-93,-97,-92,-122,54,-149,-119,-209,-205,-96,-208,-108,-126,-109,54,-118,-123,-102,-113,-148,54,-111,-114,54,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,54,54,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,54,-31,-62,54,-188,-61,197,-90,-91,54,54,54,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,54,54,54,207,-139,-77,-138,-137,-140,-52,54,54,54,54,54,54,54,54,54,-158,54,54,54,-64,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-194,54,54,54,54,-65,54,54,-52,-50,54,-66,54,54,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,54,54,-86,54,-50,54,-57,-51,-211,-212,-84,-87,54,54,54,54,54,54,54,54,54,54,54,54,-68,54,54,-163,54,54,54,54,54,54,54,54,54,-49,54,361,-83,-155,362,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'COMMA':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,169,175,194,204,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,258,261,275,276,297,304,330,338,339,360,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-158,-64,-194,-65,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,295,-86,-84,-87,-68,333,-159,-83,-155,-53,]),'EMPTY':([14,21,26,34,61,82,83,86,87,89,90,92,95,101,104,143,144,156,158,159,165,166,167,170,172,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,202,207,210,254,256,269,279,281,282,283,285,287,295,296,307,309,323,324,326,327,333,335,346,348,357,361,362,365,368,369,370,371,380,392,],[90,125,125,90,90,90,125,-200,-199,-197,-196,-195,-198,90,90,90,125,90,90,125,125,90,125,125,125,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,125,125,125,125,125,125,125,125,125,125,125,90,125,125,125,90,125,125,90,125,90,125,125,90,125,125,125,125,90,90,90,90,90,90,125,125,]),'ASSIGN':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[11,-117,-101,-106,-116,-99,-124,78,78,-207,78,-94,78,78,-115,78,-206,78,78,-93,-97,-92,-122,78,-149,-119,-209,-205,-96,-208,-108,-126,-109,78,-118,-123,-102,-113,-148,78,-111,-114,78,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,78,78,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,78,-31,-62,78,-188,-61,78,78,78,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,78,78,78,11,78,11,78,78,78,78,78,11,-158,78,78,78,-64,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-194,78,78,78,78,-65,78,78,78,-66,78,78,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,78,78,-86,78,78,-84,-87,78,78,78,78,78,78,78,78,78,78,78,78,-68,78,11,78,78,11,11,78,78,78,78,78,78,-83,-155,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'STRING':([14,34,61,82,86,87,89,90,92,95,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[102,102,102,102,-200,-199,-197,-196,-195,-198,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'LSQBR':([1,2,3,4,7,9,11,12,13,16,18,19,20,22,23,24,26,28,30,33,35,36,37,38,39,40,43,44,45,46,48,49,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,150,169,175,204,215,221,225,227,247,261,275,276,366,],[-117,-101,-106,-116,-99,-124,-98,82,-107,-120,-121,-100,-115,143,-125,-110,-112,-103,-97,-122,156,-149,-119,-209,-11,-96,158,-108,-126,-109,-104,-105,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-209,-158,-64,-65,-66,-63,-63,-85,-63,-86,-84,-87,380,]),'TIMES':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,93,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,148,150,151,152,153,154,155,168,169,174,175,194,195,203,204,212,214,215,220,226,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,275,276,297,313,330,338,339,350,353,360,377,379,381,382,383,384,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,184,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-139,-77,-138,-137,-140,208,184,184,-158,184,-64,-194,184,184,-65,184,184,-66,184,184,-85,-10,184,184,184,184,184,184,-6,184,184,184,184,-9,-7,184,-8,-28,-76,-63,-86,-84,-87,-68,184,184,-83,-155,184,184,184,184,184,184,184,184,184,]),'LPAREN':([1,2,3,4,7,9,14,20,30,33,34,36,37,40,44,45,46,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,86,87,89,90,92,95,101,104,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,148,150,151,152,153,154,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,208,209,219,221,223,245,247,268,271,272,273,283,296,319,323,326,335,362,365,368,369,370,371,],[-117,-101,-106,-116,-99,-124,104,-115,-97,-122,104,-149,-119,-96,-108,-126,-109,-118,-123,-102,-113,-148,104,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,104,-200,-199,-197,-196,-195,-198,104,104,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,202,-130,-136,-140,-133,-131,-128,-145,104,-139,-77,-138,-137,-140,-52,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,-52,269,281,282,285,281,282,269,-51,-211,-212,104,104,282,104,104,104,104,104,104,104,104,104,]),'IN':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,206,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[58,-117,-101,-106,-116,-99,-124,58,58,-207,58,-94,58,58,-115,58,-206,58,58,-93,-97,-92,-122,58,-149,-119,-209,-205,-96,-208,-108,-126,-109,58,-118,-123,-102,-113,-148,58,-111,-114,58,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,58,58,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,58,-31,-62,58,-188,-61,58,58,58,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,58,58,58,58,58,58,58,58,58,58,58,58,-158,58,58,58,-64,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-194,58,58,58,58,-65,58,263,58,58,-66,58,58,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,58,58,-86,58,58,-84,-87,58,58,58,58,58,58,58,58,58,58,58,58,-68,58,58,58,58,58,58,58,58,58,58,58,58,-83,-155,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'ID':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[59,-117,-101,-106,-116,-99,-124,59,59,-207,59,-94,59,59,-115,59,-206,59,59,-93,-97,-92,-122,59,-149,-119,-209,-205,-96,-208,-108,-126,-109,59,-118,-123,-102,-113,-148,59,-111,-114,59,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,59,59,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,59,-31,-62,59,-188,-61,59,59,59,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,59,59,59,59,59,59,59,59,59,59,59,59,-158,59,59,59,-64,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-194,59,59,59,59,-65,59,59,59,-66,59,59,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,59,59,-86,59,59,-84,-87,59,59,59,59,59,59,59,59,59,59,59,59,-68,59,59,59,59,59,59,59,59,59,59,59,59,-83,-155,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'IF':([0,1,2,3,4,7,9,12,15,20,21,22,26,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,83,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,144,155,157,159,165,167,168,169,170,172,175,193,194,196,202,204,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,285,287,295,297,299,307,309,313,314,324,327,333,338,339,346,348,357,361,380,392,],[61,-117,-101,-106,-116,-99,-124,-207,-94,-115,133,-206,133,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,133,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,133,61,61,133,133,133,61,-158,133,133,-64,133,-194,133,133,-65,133,133,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,133,133,-86,133,-84,-87,133,133,133,133,133,133,-68,61,133,133,61,61,133,133,133,-83,-155,133,133,133,133,133,133,]),'FROM':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,109,110,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,145,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,200,201,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[62,-117,-101,-106,-116,-99,-124,62,62,-207,62,-94,62,62,-115,62,-206,62,62,-93,-97,-92,-122,62,-149,-119,-209,-205,-96,-208,-108,-126,-109,62,-118,-123,-102,-113,-148,62,-111,-114,62,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,62,62,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,62,-31,-62,62,-188,-61,-90,-91,62,62,62,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,62,62,205,62,62,62,62,62,62,62,62,62,62,-158,62,62,62,-64,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-194,62,62,62,254,256,62,-65,62,62,62,-66,62,62,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,62,62,-86,62,62,-84,-87,62,62,62,62,62,62,62,62,62,62,62,62,-68,62,62,62,62,62,62,62,62,62,62,62,62,-83,-155,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'SELF':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,269,275,276,279,281,282,283,285,287,288,291,294,295,296,297,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[63,-117,-101,-106,-116,-99,-124,63,63,-207,106,-94,110,63,-115,138,-206,110,153,-93,-97,-92,-122,106,-149,-119,-209,-205,-96,-208,-108,-126,-109,63,-118,-123,-102,-113,-148,106,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,106,138,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,106,-31,-62,106,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,106,138,63,106,63,106,138,138,106,138,63,-158,138,138,106,-64,110,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,138,-194,138,110,63,138,-65,110,266,138,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,138,138,-86,138,-84,-87,138,138,138,106,138,138,106,106,106,138,106,-68,63,138,138,63,63,106,138,106,138,138,106,-83,-155,110,138,138,110,138,266,106,106,106,106,106,106,110,138,110,138,]),'INSTANCES':([0,1,2,3,4,7,9,10,11,12,14,15,16,17,20,21,22,23,26,27,30,32,33,34,36,37,38,39,40,43,44,45,46,47,53,54,55,58,59,61,62,64,65,67,68,69,70,73,74,75,76,78,79,80,82,83,85,86,87,88,89,90,91,92,94,95,96,97,98,100,101,102,103,104,106,107,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,143,144,146,155,156,157,158,159,165,166,167,168,169,170,172,173,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,196,197,198,202,204,205,207,210,215,217,218,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,254,256,261,263,269,275,276,279,281,282,283,285,286,287,288,291,294,295,296,297,298,299,307,309,313,314,323,324,326,327,333,335,338,339,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[64,-117,-101,-106,-116,-99,-124,64,64,-207,64,-94,64,64,-115,64,-206,64,64,-93,-97,-92,-122,64,-149,-119,-209,-205,-96,-208,-108,-126,-109,64,-118,-123,-102,-113,-148,64,-111,-114,64,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,64,64,-26,-200,-199,-95,-197,-196,-29,-195,-27,-198,-59,-30,-187,-60,64,-31,-62,64,-188,-61,64,64,64,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,64,64,64,64,64,64,64,64,64,64,64,64,-158,64,64,64,-64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-194,64,64,64,64,-65,64,64,64,-66,64,64,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,290,293,-86,64,64,-84,-87,64,64,64,64,64,64,64,64,64,64,64,64,-68,64,64,64,64,64,64,64,64,64,64,64,64,-83,-155,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'RSQBR':([1,2,3,4,7,9,12,15,20,22,27,30,32,33,36,37,38,39,40,43,44,45,46,53,54,55,58,59,62,64,67,68,69,70,73,74,75,76,78,79,80,85,88,91,94,96,97,98,100,102,103,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,137,138,139,140,141,142,169,174,175,194,203,204,212,214,215,227,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,261,272,273,275,276,297,338,339,390,394,],[-117,-101,-106,-116,-99,-124,-207,-94,-115,-206,-93,-97,-92,-122,-149,-119,-209,-205,-96,-208,-108,-126,-109,-118,-123,-102,-113,-148,-111,-114,-120,-104,-110,-105,-112,-121,-107,-125,-98,-100,-103,-26,-95,-29,-27,-59,-30,-187,-60,-31,-62,-188,-61,-127,-142,-146,-134,-147,-78,-79,-135,-129,-132,-139,-80,-77,-138,-137,-143,-144,-141,-130,-136,-140,-133,-131,-128,-145,-158,227,-64,-194,261,-65,275,276,-66,-85,-10,-16,-13,-19,-15,-17,-20,-6,-5,-14,-18,-3,-9,-7,-4,-8,-28,-76,-63,-86,-211,-212,-84,-87,-68,-83,-155,393,395,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'implicit_invocation':([0,10,14,17,34,47,61,82,101,104,143,155,156,157,158,166,168,171,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,216,283,296,299,313,314,323,326,335,362,365,368,369,370,371,],[32,66,32,111,32,160,32,32,32,32,32,32,32,32,32,32,32,224,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,249,277,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'constant':([14,34,61,82,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,]),'instance_invocation':([0,14,17,34,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,283,296,299,313,314,323,326,335,362,365,368,369,370,371,],[15,15,112,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,250,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'navigation_hook':([288,291,294,],[320,325,328,]),'navigation_step':([320,325,328,349,],[349,349,349,349,]),'navigation_chain':([320,325,328,349,],[347,352,355,367,]),'param':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'phrase':([210,346,357,392,],[271,364,373,394,]),'kw_as_identifier_2':([21,26,83,144,159,165,167,170,172,193,196,202,207,210,254,256,269,279,281,282,285,287,295,307,309,324,327,333,346,348,357,361,380,392,],[122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,]),'kw_as_identifier_3':([21,26,83,144,159,165,167,170,172,193,196,202,207,210,254,256,269,279,281,282,285,287,295,307,309,324,327,333,346,348,357,361,380,392,],[123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'array':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'kw_as_identifier_1':([0,10,11,14,16,17,21,23,26,34,47,61,65,82,83,101,104,114,115,116,143,144,146,155,156,157,158,159,165,166,167,168,170,172,173,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,197,198,202,205,207,210,217,218,254,256,263,269,279,281,282,283,285,286,287,288,291,294,295,296,298,299,307,309,313,314,323,324,326,327,333,335,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'kw_as_identifier_4':([21,26,83,144,159,165,167,170,172,193,196,202,207,210,254,256,269,279,281,282,285,287,295,307,309,324,327,333,346,348,357,361,380,392,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'namespace':([0,10,14,17,34,47,61,82,101,104,143,155,156,157,158,166,168,171,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,216,283,296,299,313,314,323,326,335,362,365,368,369,370,371,],[51,71,99,51,99,51,99,99,99,99,99,51,99,51,99,99,51,51,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,51,51,99,99,51,51,51,99,99,99,99,99,99,99,99,99,]),'variable_access':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[52,72,81,100,113,149,100,161,100,100,100,100,100,52,100,52,100,100,52,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,264,100,321,321,321,100,52,52,52,100,100,100,374,100,100,100,100,100,100,]),'event_meaning':([154,208,],[209,268,]),'statement':([0,155,157,168,299,313,314,],[42,42,42,42,42,42,42,]),'variable_name':([0,10,11,14,16,17,23,26,34,47,61,65,82,101,104,114,115,116,143,146,155,156,157,158,166,168,173,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,197,198,205,207,217,218,263,283,288,291,294,296,299,313,314,323,326,335,345,356,361,362,365,368,369,370,371,378,385,],[39,39,39,39,109,39,109,39,39,39,39,169,39,39,39,199,200,201,39,206,39,39,39,39,39,39,39,109,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,109,251,109,39,278,280,299,39,39,39,39,39,39,39,39,39,39,39,109,109,39,39,39,39,39,39,39,109,109,]),'invocation':([0,14,34,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,299,313,314,323,326,335,362,365,368,369,370,371,],[6,88,88,88,88,88,88,88,6,88,6,88,88,6,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,6,6,6,88,88,88,88,88,88,88,88,88,]),'parameter':([202,281,282,285,295,],[258,258,258,258,258,]),'event_data':([209,268,],[270,303,]),'unary_operator':([14,34,61,82,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'event_parameter':([269,333,],[304,304,]),'field_access':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'limited_identifier':([0,10,11,14,16,17,21,23,26,34,47,61,65,82,83,101,104,114,115,116,143,144,146,155,156,157,158,159,165,166,167,168,170,172,173,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,196,197,198,202,205,207,210,217,218,254,256,263,269,279,281,282,283,285,286,287,288,291,294,295,296,298,299,307,309,313,314,323,324,326,327,333,335,345,346,348,356,357,361,362,365,368,369,370,371,378,380,385,392,],[38,38,38,38,38,38,129,38,150,38,38,38,38,38,129,38,38,38,38,38,38,129,38,38,38,38,38,129,129,38,129,38,129,129,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,129,129,38,38,129,38,150,129,38,38,129,129,38,129,129,129,129,38,129,318,129,38,38,38,129,38,318,38,129,129,38,38,38,129,38,129,129,38,38,129,129,38,129,150,38,38,38,38,38,38,38,129,38,129,]),'action_body':([0,],[56,]),'event_parameter_list':([269,333,],[305,359,]),'param_access':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'statement_list':([0,155,157,168,299,313,314,],[57,57,213,57,57,57,57,]),'selected_access':([14,34,61,82,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'rel_id':([286,298,],[317,331,]),'else_clause':([284,],[315,]),'elif_clause':([283,],[312,]),'structure':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[60,77,77,105,60,77,105,77,105,105,105,105,105,60,105,60,105,105,60,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,252,77,105,77,77,77,105,60,60,60,105,105,105,77,105,105,105,105,105,105,]),'function_invocation':([0,14,34,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,299,313,314,323,326,335,362,365,368,369,370,371,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'parameter_list':([202,281,282,285,295,],[260,310,311,316,329,]),'elif_list':([222,312,],[284,340,]),'instance_name':([16,23,176,197,205,345,356,378,385,],[108,145,228,248,262,363,372,389,391,]),'index_access':([0,10,11,14,17,26,34,47,61,82,101,104,143,155,156,157,158,166,168,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,299,313,314,323,326,335,361,362,365,368,369,370,371,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'self_access':([14,34,61,82,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,207,283,288,291,294,296,323,326,335,361,362,365,368,369,370,371,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,267,107,322,322,322,107,107,107,107,375,107,107,107,107,107,107,]),'action':([0,],[29,]),'identifier':([21,26,83,144,159,165,167,170,172,193,196,202,207,210,254,256,269,279,281,282,285,287,295,307,309,324,327,333,346,348,357,361,380,392,],[135,154,175,204,215,219,221,223,225,245,247,259,265,273,289,292,306,308,259,259,259,319,259,336,154,351,354,306,273,366,273,376,390,273,]),'expression':([14,34,61,82,101,104,143,156,158,166,173,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,283,296,323,326,335,362,365,368,369,370,371,],[93,155,168,174,194,195,203,212,214,220,226,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,313,330,350,353,360,377,379,381,382,383,384,]),'block':([0,155,168,299,313,314,],[31,211,222,332,341,342,]),'event_specification':([26,309,],[147,337,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> action","S'",1,None,None,None),
+  ('action -> action_body','action',1,'p_action','oal.py',805),
+  ('action_body -> block','action_body',1,'p_action_body','oal.py',805),
+  ('expression -> expression PLUS expression','expression',3,'p_arithmetic_expression','oal.py',806),
+  ('expression -> expression MINUS expression','expression',3,'p_arithmetic_expression','oal.py',807),
+  ('expression -> expression PIPE expression','expression',3,'p_arithmetic_expression','oal.py',808),
+  ('expression -> expression TIMES expression','expression',3,'p_arithmetic_expression','oal.py',809),
+  ('expression -> expression DIV expression','expression',3,'p_arithmetic_expression','oal.py',810),
+  ('expression -> expression MOD expression','expression',3,'p_arithmetic_expression','oal.py',811),
+  ('expression -> expression AMP expression','expression',3,'p_arithmetic_expression','oal.py',812),
+  ('expression -> expression CARET expression','expression',3,'p_arithmetic_expression','oal.py',813),
+  ('array -> variable_name','array',1,'p_array','oal.py',805),
+  ('block -> statement_list','block',1,'p_block','oal.py',805),
+  ('expression -> expression LE expression','expression',3,'p_boolean_expression','oal.py',806),
+  ('expression -> expression LESSTHAN expression','expression',3,'p_boolean_expression','oal.py',807),
+  ('expression -> expression DOUBLEEQUAL expression','expression',3,'p_boolean_expression','oal.py',808),
+  ('expression -> expression NOTEQUAL expression','expression',3,'p_boolean_expression','oal.py',809),
+  ('expression -> expression GE expression','expression',3,'p_boolean_expression','oal.py',810),
+  ('expression -> expression GT expression','expression',3,'p_boolean_expression','oal.py',811),
+  ('expression -> expression AND expression','expression',3,'p_boolean_expression','oal.py',812),
+  ('expression -> expression OR expression','expression',3,'p_boolean_expression','oal.py',813),
+  ('statement -> BREAK','statement',1,'p_break_statement','oal.py',805),
+  ('statement -> BRIDGE variable_access EQUAL implicit_invocation','statement',4,'p_bridge_assignment_statement','oal.py',805),
+  ('statement -> BRIDGE implicit_invocation','statement',2,'p_bridge_invocation_statement','oal.py',805),
+  ('statement -> TRANSFORM variable_access EQUAL implicit_invocation','statement',4,'p_class_invocation_assignment_statement','oal.py',805),
+  ('statement -> TRANSFORM implicit_invocation','statement',2,'p_class_invocation_statement','oal.py',805),
+  ('constant -> TRUE','constant',1,'p_constant_boolean','oal.py',806),
+  ('constant -> FALSE','constant',1,'p_constant_boolean','oal.py',807),
+  ('constant -> namespace DOUBLECOLON identifier','constant',3,'p_constant_enum','oal.py',805),
+  ('constant -> FRACTION','constant',1,'p_constant_fraction','oal.py',805),
+  ('constant -> NUMBER','constant',1,'p_constant_number','oal.py',805),
+  ('constant -> STRING','constant',1,'p_constant_string','oal.py',805),
+  ('statement -> CONTINUE','statement',1,'p_continue_statement','oal.py',805),
+  ('statement -> CONTROL STOP','statement',2,'p_control_statement','oal.py',805),
+  ('statement -> CREATE EVENT INSTANCE variable_name OF event_specification TO identifier ASSIGNER','statement',9,'p_create_assigner_event_statement','oal.py',805),
+  ('statement -> CREATE EVENT INSTANCE variable_name OF event_specification TO identifier CLASS','statement',9,'p_create_class_event_statement','oal.py',805),
+  ('statement -> CREATE EVENT INSTANCE variable_name OF event_specification TO identifier CREATOR','statement',9,'p_create_creator_event_statement','oal.py',805),
+  ('statement -> CREATE EVENT INSTANCE variable_name OF event_specification TO variable_access','statement',8,'p_create_instance_event_statement_1','oal.py',805),
+  ('statement -> CREATE EVENT INSTANCE variable_name OF event_specification TO self_access','statement',8,'p_create_instance_event_statement_2','oal.py',805),
+  ('statement -> CREATE OBJECT INSTANCE OF identifier','statement',5,'p_create_object_no_variable_statement','oal.py',805),
+  ('statement -> CREATE OBJECT INSTANCE variable_name OF identifier','statement',6,'p_create_object_statement','oal.py',805),
+  ('statement -> DELETE OBJECT INSTANCE instance_name','statement',4,'p_delete_statement','oal.py',805),
+  ('elif_clause -> expression block','elif_clause',2,'p_elif_clause','oal.py',805),
+  ('elif_list -> <empty>','elif_list',0,'p_elif_list_1','oal.py',805),
+  ('elif_list -> ELIF elif_clause elif_list','elif_list',3,'p_elif_list_2','oal.py',805),
+  ('else_clause -> ELSE block','else_clause',2,'p_else_clause_1','oal.py',805),
+  ('else_clause -> <empty>','else_clause',0,'p_else_clause_2','oal.py',805),
+  ('block -> <empty>','block',0,'p_empty_block','oal.py',805),
+  ('statement -> <empty>','statement',0,'p_empty_statement','oal.py',805),
+  ('event_data -> LPAREN event_parameter_list RPAREN','event_data',3,'p_event_data_1','oal.py',805),
+  ('event_data -> <empty>','event_data',0,'p_event_data_2','oal.py',805),
+  ('event_meaning -> COLON phrase','event_meaning',2,'p_event_meaning','oal.py',805),
+  ('event_meaning -> <empty>','event_meaning',0,'p_event_meaning_4','oal.py',805),
+  ('event_parameter -> identifier COLON expression','event_parameter',3,'p_event_parameter','oal.py',805),
+  ('event_parameter_list -> event_parameter','event_parameter_list',1,'p_event_parameter_list_1','oal.py',805),
+  ('event_parameter_list -> event_parameter COMMA event_parameter_list','event_parameter_list',3,'p_event_parameter_list_2','oal.py',805),
+  ('event_parameter_list -> <empty>','event_parameter_list',0,'p_event_parameter_list_3','oal.py',805),
+  ('event_specification -> identifier event_meaning event_data','event_specification',3,'p_event_specification','oal.py',805),
+  ('statement -> ASSIGN variable_access EQUAL expression','statement',4,'p_explicit_assignment_statement','oal.py',805),
+  ('expression -> constant','expression',1,'p_expression_1','oal.py',805),
+  ('expression -> variable_access','expression',1,'p_expression_2','oal.py',805),
+  ('expression -> self_access','expression',1,'p_expression_4','oal.py',805),
+  ('expression -> selected_access','expression',1,'p_expression_5','oal.py',805),
+  ('field_access -> structure DOT identifier','field_access',3,'p_field_access','oal.py',806),
+  ('field_access -> index_access DOT identifier','field_access',3,'p_field_access','oal.py',807),
+  ('field_access -> field_access DOT identifier','field_access',3,'p_field_access','oal.py',808),
+  ('field_access -> param_access DOT identifier','field_access',3,'p_field_access','oal.py',809),
+  ('statement -> FOR EACH variable_name IN variable_name block END_FOR','statement',7,'p_for_statement','oal.py',805),
+  ('function_invocation -> DOUBLECOLON identifier LPAREN parameter_list RPAREN','function_invocation',5,'p_function_invocation','oal.py',805),
+  ('statement -> invocation','statement',1,'p_function_invocation_statement','oal.py',805),
+  ('statement -> GENERATE event_specification TO identifier ASSIGNER','statement',5,'p_generate_assigner_event_statement','oal.py',805),
+  ('statement -> GENERATE event_specification TO identifier CLASS','statement',5,'p_generate_class_event_statement','oal.py',805),
+  ('statement -> GENERATE event_specification TO identifier CREATOR','statement',5,'p_generate_creator_event_statement','oal.py',805),
+  ('statement -> GENERATE event_specification TO variable_access','statement',4,'p_generate_instance_event_statement_1','oal.py',805),
+  ('statement -> GENERATE event_specification TO self_access','statement',4,'p_generate_instance_event_statement_2','oal.py',805),
+  ('statement -> GENERATE variable_access','statement',2,'p_generate_preexisting_event_statement','oal.py',805),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_grouped_expression','oal.py',805),
+  ('identifier -> limited_identifier','identifier',1,'p_identifier','oal.py',806),
+  ('identifier -> kw_as_identifier_2','identifier',1,'p_identifier','oal.py',807),
+  ('identifier -> kw_as_identifier_3','identifier',1,'p_identifier','oal.py',808),
+  ('identifier -> kw_as_identifier_4','identifier',1,'p_identifier','oal.py',809),
+  ('statement -> IF expression block elif_list else_clause END_IF','statement',6,'p_if_statement','oal.py',805),
+  ('statement -> variable_access EQUAL expression','statement',3,'p_implicit_assignment_statement','oal.py',805),
+  ('implicit_invocation -> namespace DOUBLECOLON identifier LPAREN parameter_list RPAREN','implicit_invocation',6,'p_implicit_invocation','oal.py',805),
+  ('index_access -> array LSQBR expression RSQBR','index_access',4,'p_index_access','oal.py',805),
+  ('index_access -> index_access LSQBR expression RSQBR','index_access',4,'p_index_access','oal.py',806),
+  ('index_access -> field_access LSQBR expression RSQBR','index_access',4,'p_index_access','oal.py',807),
+  ('index_access -> param_access LSQBR expression RSQBR','index_access',4,'p_index_access','oal.py',808),
+  ('statement -> TRANSFORM variable_access EQUAL instance_invocation','statement',4,'p_instance_invocation_assignment_statement','oal.py',805),
+  ('statement -> TRANSFORM instance_invocation','statement',2,'p_instance_invocation_statement','oal.py',805),
+  ('instance_name -> variable_name','instance_name',1,'p_instance_name','oal.py',805),
+  ('instance_name -> SELF','instance_name',1,'p_instance_name','oal.py',806),
+  ('invocation -> implicit_invocation','invocation',1,'p_invocation','oal.py',806),
+  ('invocation -> function_invocation','invocation',1,'p_invocation','oal.py',807),
+  ('invocation -> instance_invocation','invocation',1,'p_invocation','oal.py',808),
+  ('expression -> invocation','expression',1,'p_invocation_expression','oal.py',805),
+  ('kw_as_identifier_1 -> ACROSS','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',805),
+  ('kw_as_identifier_1 -> ANY','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',806),
+  ('kw_as_identifier_1 -> ASSIGN','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',807),
+  ('kw_as_identifier_1 -> ASSIGNER','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',808),
+  ('kw_as_identifier_1 -> BREAK','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',809),
+  ('kw_as_identifier_1 -> BY','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',810),
+  ('kw_as_identifier_1 -> CLASS','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',811),
+  ('kw_as_identifier_1 -> CONTINUE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',812),
+  ('kw_as_identifier_1 -> CONTROL','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',813),
+  ('kw_as_identifier_1 -> CREATE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',814),
+  ('kw_as_identifier_1 -> CREATOR','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',815),
+  ('kw_as_identifier_1 -> DELETE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',816),
+  ('kw_as_identifier_1 -> EACH','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',817),
+  ('kw_as_identifier_1 -> EVENT','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',818),
+  ('kw_as_identifier_1 -> FOR','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',819),
+  ('kw_as_identifier_1 -> FROM','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',820),
+  ('kw_as_identifier_1 -> GENERATE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',821),
+  ('kw_as_identifier_1 -> IN','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',822),
+  ('kw_as_identifier_1 -> INSTANCES','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',823),
+  ('kw_as_identifier_1 -> INSTANCE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',824),
+  ('kw_as_identifier_1 -> MANY','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',825),
+  ('kw_as_identifier_1 -> OBJECT','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',826),
+  ('kw_as_identifier_1 -> ONE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',827),
+  ('kw_as_identifier_1 -> RELATED','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',828),
+  ('kw_as_identifier_1 -> RELATE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',829),
+  ('kw_as_identifier_1 -> SELECT','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',830),
+  ('kw_as_identifier_1 -> STOP','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',831),
+  ('kw_as_identifier_1 -> TO','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',832),
+  ('kw_as_identifier_1 -> WHERE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',833),
+  ('kw_as_identifier_1 -> UNRELATE','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',834),
+  ('kw_as_identifier_1 -> USING','kw_as_identifier_1',1,'p_kw_as_identifier_1','oal.py',835),
+  ('kw_as_identifier_2 -> BRIDGE','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',806),
+  ('kw_as_identifier_2 -> CARDINALITY','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',807),
+  ('kw_as_identifier_2 -> EMPTY','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',808),
+  ('kw_as_identifier_2 -> FALSE','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',809),
+  ('kw_as_identifier_2 -> NOT','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',810),
+  ('kw_as_identifier_2 -> NOT_EMPTY','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',811),
+  ('kw_as_identifier_2 -> SEND','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',812),
+  ('kw_as_identifier_2 -> TRANSFORM','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',813),
+  ('kw_as_identifier_2 -> TRUE','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',814),
+  ('kw_as_identifier_2 -> OF','kw_as_identifier_2',1,'p_kw_as_identifier_2','oal.py',815),
+  ('kw_as_identifier_3 -> PARAM','kw_as_identifier_3',1,'p_kw_as_identifier_3','oal.py',806),
+  ('kw_as_identifier_3 -> RCVD_EVT','kw_as_identifier_3',1,'p_kw_as_identifier_3','oal.py',807),
+  ('kw_as_identifier_3 -> SELECTED','kw_as_identifier_3',1,'p_kw_as_identifier_3','oal.py',808),
+  ('kw_as_identifier_3 -> SELF','kw_as_identifier_3',1,'p_kw_as_identifier_3','oal.py',809),
+  ('kw_as_identifier_4 -> AND','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',806),
+  ('kw_as_identifier_4 -> ELIF','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',807),
+  ('kw_as_identifier_4 -> ELSE','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',808),
+  ('kw_as_identifier_4 -> IF','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',809),
+  ('kw_as_identifier_4 -> OR','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',810),
+  ('kw_as_identifier_4 -> RETURN','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',811),
+  ('kw_as_identifier_4 -> WHILE','kw_as_identifier_4',1,'p_kw_as_identifier_4','oal.py',812),
+  ('limited_identifier -> ID','limited_identifier',1,'p_limited_identifier','oal.py',806),
+  ('limited_identifier -> kw_as_identifier_1','limited_identifier',1,'p_limited_identifier','oal.py',807),
+  ('namespace -> NAMESPACE','namespace',1,'p_namespace','oal.py',806),
+  ('navigation_chain -> navigation_step','navigation_chain',1,'p_navigation_chain_1','oal.py',805),
+  ('navigation_chain -> navigation_step navigation_chain','navigation_chain',2,'p_navigation_chain_2','oal.py',805),
+  ('navigation_step -> ARROW identifier LSQBR identifier RSQBR','navigation_step',5,'p_navigation_step_1','oal.py',805),
+  ('navigation_step -> ARROW identifier LSQBR identifier DOT phrase RSQBR','navigation_step',7,'p_navigation_step_2','oal.py',805),
+  ('instance_invocation -> structure DOT identifier LPAREN parameter_list RPAREN','instance_invocation',6,'p_operation_invocation_1','oal.py',805),
+  ('param -> PARAM','param',1,'p_param','oal.py',806),
+  ('param -> RCVD_EVT','param',1,'p_param','oal.py',807),
+  ('param_access -> param DOT variable_name','param_access',3,'p_param_access_1','oal.py',805),
+  ('parameter -> identifier COLON expression','parameter',3,'p_parameter','oal.py',805),
+  ('parameter_list -> parameter','parameter_list',1,'p_parameter_list_1','oal.py',805),
+  ('parameter_list -> parameter COMMA parameter_list','parameter_list',3,'p_parameter_list_2','oal.py',805),
+  ('parameter_list -> <empty>','parameter_list',0,'p_parameter_list_3','oal.py',805),
+  ('event_specification -> identifier TIMES event_meaning event_data','event_specification',4,'p_ploymorphic_event_spec','oal.py',805),
+  ('statement -> SEND namespace DOUBLECOLON identifier LPAREN parameter_list RPAREN TO expression','statement',9,'p_port_event_generation','oal.py',805),
+  ('statement -> SEND variable_access EQUAL implicit_invocation','statement',4,'p_port_invocation_assignment_statement','oal.py',805),
+  ('statement -> SEND implicit_invocation','statement',2,'p_port_invocation_statement','oal.py',805),
+  ('statement -> RELATE instance_name TO instance_name ACROSS rel_id','statement',6,'p_relate_statement_1','oal.py',805),
+  ('statement -> RELATE instance_name TO instance_name ACROSS rel_id DOT phrase','statement',8,'p_relate_statement_2','oal.py',805),
+  ('statement -> RELATE instance_name TO instance_name ACROSS rel_id USING instance_name','statement',8,'p_relate_using_statement_1','oal.py',805),
+  ('statement -> RELATE instance_name TO instance_name ACROSS rel_id DOT phrase USING instance_name','statement',10,'p_relate_using_statement_2','oal.py',805),
+  ('statement -> RETURN expression','statement',2,'p_return_statement_1','oal.py',805),
+  ('statement -> RETURN','statement',1,'p_return_statement_2','oal.py',805),
+  ('statement -> SELECT ANY variable_name FROM INSTANCES OF identifier','statement',7,'p_select_from_statement_1','oal.py',806),
+  ('statement -> SELECT MANY variable_name FROM INSTANCES OF identifier','statement',7,'p_select_from_statement_1','oal.py',807),
+  ('statement -> SELECT ANY variable_name FROM identifier','statement',5,'p_select_from_statement_2','oal.py',806),
+  ('statement -> SELECT MANY variable_name FROM identifier','statement',5,'p_select_from_statement_2','oal.py',807),
+  ('statement -> SELECT ANY variable_name FROM INSTANCES OF identifier WHERE expression','statement',9,'p_select_from_where_statement_1','oal.py',806),
+  ('statement -> SELECT MANY variable_name FROM INSTANCES OF identifier WHERE expression','statement',9,'p_select_from_where_statement_1','oal.py',807),
+  ('statement -> SELECT ANY variable_name FROM identifier WHERE expression','statement',7,'p_select_from_where_statement_2','oal.py',806),
+  ('statement -> SELECT MANY variable_name FROM identifier WHERE expression','statement',7,'p_select_from_where_statement_2','oal.py',807),
+  ('statement -> SELECT ONE variable_name RELATED BY navigation_hook navigation_chain','statement',7,'p_select_related_statement','oal.py',806),
+  ('statement -> SELECT ANY variable_name RELATED BY navigation_hook navigation_chain','statement',7,'p_select_related_statement','oal.py',807),
+  ('statement -> SELECT MANY variable_name RELATED BY navigation_hook navigation_chain','statement',7,'p_select_related_statement','oal.py',808),
+  ('statement -> SELECT ONE variable_name RELATED BY navigation_hook navigation_chain WHERE expression','statement',9,'p_select_related_where_statement','oal.py',806),
+  ('statement -> SELECT ANY variable_name RELATED BY navigation_hook navigation_chain WHERE expression','statement',9,'p_select_related_where_statement','oal.py',807),
+  ('statement -> SELECT MANY variable_name RELATED BY navigation_hook navigation_chain WHERE expression','statement',9,'p_select_related_where_statement','oal.py',808),
+  ('selected_access -> SELECTED','selected_access',1,'p_selected_access_1','oal.py',805),
+  ('self_access -> SELF','self_access',1,'p_self_access_1','oal.py',805),
+  ('statement_list -> statement SEMICOLON statement_list','statement_list',3,'p_statement_list_1','oal.py',805),
+  ('statement_list -> statement SEMICOLON','statement_list',2,'p_statement_list_2','oal.py',805),
+  ('structure -> variable_name','structure',1,'p_structure_1','oal.py',805),
+  ('structure -> SELF','structure',1,'p_structure_2','oal.py',805),
+  ('structure -> SELECTED','structure',1,'p_structure_3','oal.py',805),
+  ('expression -> unary_operator expression','expression',2,'p_unary_expression','oal.py',805),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','oal.py',806),
+  ('unary_operator -> EMPTY','unary_operator',1,'p_unary_operator','oal.py',807),
+  ('unary_operator -> NOT_EMPTY','unary_operator',1,'p_unary_operator','oal.py',808),
+  ('unary_operator -> CARDINALITY','unary_operator',1,'p_unary_operator','oal.py',809),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','oal.py',810),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','oal.py',811),
+  ('statement -> UNRELATE instance_name FROM instance_name ACROSS rel_id','statement',6,'p_unrelate_statement_1','oal.py',805),
+  ('statement -> UNRELATE instance_name FROM instance_name ACROSS rel_id DOT phrase','statement',8,'p_unrelate_statement_2','oal.py',805),
+  ('statement -> UNRELATE instance_name FROM instance_name ACROSS rel_id USING instance_name','statement',8,'p_unrelate_statement_using_1','oal.py',805),
+  ('statement -> UNRELATE instance_name FROM instance_name ACROSS rel_id DOT phrase USING instance_name','statement',10,'p_unrelate_statement_using_2','oal.py',805),
+  ('variable_access -> variable_name','variable_access',1,'p_variable_access_1','oal.py',805),
+  ('variable_access -> field_access','variable_access',1,'p_variable_access_2','oal.py',805),
+  ('variable_access -> index_access','variable_access',1,'p_variable_access_3','oal.py',805),
+  ('variable_access -> param_access','variable_access',1,'p_variable_access_4','oal.py',805),
+  ('variable_name -> limited_identifier','variable_name',1,'p_variable_name','oal.py',805),
+  ('statement -> WHILE expression block END_WHILE','statement',4,'p_while_statement','oal.py',805),
+  ('phrase -> TICKED_PHRASE','phrase',1,'p_phrase_1','oal.py',1372),
+  ('phrase -> identifier','phrase',1,'p_phrase_2','oal.py',1376),
+  ('rel_id -> limited_identifier','rel_id',1,'p_rel_id','oal.py',1487),
+  ('navigation_hook -> variable_access','navigation_hook',1,'p_navigation_hook','oal.py',1602),
+  ('navigation_hook -> self_access','navigation_hook',1,'p_navigation_hook','oal.py',1603),
+]
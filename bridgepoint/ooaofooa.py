@@ -20,10 +20,14 @@ import collections
 import functools
 import os
 import logging
+import multiprocessing
 import zipfile
 import keyword
 import xtuml
 import io
+import marshal
+import sys
+import tempfile
 
 from xtuml import navigate_one as one
 from xtuml import navigate_many as many
@@ -492,18 +496,210 @@ def mk_component(bp_model, c_c=None, derived_attributes=False):
     return target
 
 
+# Classes that mk_component() selects instances from, and the numbers of the
+# associations that it, or the functions it calls, navigates across.
+_component_kinds = ('C_C', 'EP_PKG', 'PE_PE', 'O_OBJ', 'R_REL', 'S_SYNC',
+                    'S_DT', 'CNST_CSP', 'S_EE')
+_component_rel_ids = (17, 18, 19, 27, 102, 103, 104, 105, 106, 107, 108, 110,
+                      111, 113, 114, 115, 201, 203, 204, 205, 206, 207, 208,
+                      209, 210, 211, 212, 213, 1500, 1502, 1503, 1504, 8000,
+                      8001, 8003)
+
+
+def kinds_closure(kinds, rel_ids=None):
+    '''
+    Compute the transitive closure of ooaofooa classes reachable from some
+    *kinds* across associations in the schema. Optionally, only follow
+    associations with some numbers, i.e. *rel_ids*.
+    '''
+    closure = set(kind.upper() for kind in kinds)
+    neighbours = collections.defaultdict(set)
+    for stmt in schema_statements('associations'):
+        if rel_ids is not None and int(stmt.rel_id[1:]) not in rel_ids:
+            continue
+        
+        source_kind = stmt.source_kind.upper()
+        target_kind = stmt.target_kind.upper()
+        neighbours[source_kind].add(target_kind)
+        neighbours[target_kind].add(source_kind)
+
+    stack = list(closure)
+    while stack:
+        for kind in neighbours[stack.pop()]:
+            if kind not in closure:
+                closure.add(kind)
+                stack.append(kind)
+
+    return closure
+
+
+def component_kinds():
+    '''
+    Get the kinds of ooaofooa classes that *mk_component()* needs instances
+    of, e.g. to restrict what a loader loads before a component is built.
+    The default loaders load all kinds, so callers have to opt in.
+    
+    Usage example:
+    
+    >>> loader = ooaofooa.Loader(kinds=ooaofooa.component_kinds())
+    '''
+    return kinds_closure(_component_kinds, _component_rel_ids)
+
+
+_schema_parts = ('classes', 'associations', 'indices', 'globals')
+_schema_names = {
+    'classes': 'ooaofooa classes (v%02.1f)',
+    'associations': 'ooaofooa associations (v%02.1f)',
+    'indices': 'ooaofooa indices (v%02.1f)',
+    'globals': 'predefined ooaofooa globals (v%02.1f)'
+}
+_schema_filename = os.path.join(os.path.dirname(__file__),
+                                '__ooaofooa_schema.marshal')
+_schema_statements = dict()
+
+
+def _schema_signature():
+    '''
+    Compute a signature of the ooaofooa schema and globals, used to detect
+    when a precompiled schema is out of date.
+    '''
+    text = ''.join(getattr(schema, part) for part in _schema_parts)
+    return (xtuml.ParseCache.magic, sys.version_info[:2], schema.__version__,
+            xtuml.ParseCache.digest(text))
+
+
+def _compile_schema_records():
+    '''
+    Parse the ooaofooa schema and globals text, and encode the statements as
+    records grouped by schema part.
+    '''
+    records = dict()
+    for part in _schema_parts:
+        name = _schema_names[part] % schema.__version__
+        statements = xtuml.StatementParser(getattr(schema, part), name).parse()
+        records[part] = [xtuml.load.encode_statement(stmt)
+                         for stmt in statements]
+        
+    return records
+
+
+def precompile_schema(filename=None):
+    '''
+    Precompile the ooaofooa schema and globals, and write the records to a
+    *filename*, by default located next to this module. Used by the build_py
+    command when the package is built.
+    '''
+    filename = filename or _schema_filename
+    signature = _schema_signature()
+    records = _compile_schema_records()
+    fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(filename))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump((signature, records), f)
+        # readable by others, like a file created by open()
+        os.chmod(tmp, 0o644)
+        getattr(os, 'replace', os.rename)(tmp, filename)
+    except:
+        os.remove(tmp)
+        raise
+
+
+def _load_schema_records():
+    '''
+    Load precompiled records of the ooaofooa schema and globals, grouped by
+    schema part. The records are parsed from the schema text when no
+    precompiled records are available, but never written to disk.
+    '''
+    signature = _schema_signature()
+    try:
+        with open(_schema_filename, 'rb') as f:
+            data = marshal.load(f)
+        if data[0] == signature:
+            return data[1]
+        logger.debug('%s is out of date' % _schema_filename)
+    except (IOError, OSError, EOFError, ValueError, TypeError, IndexError) as e:
+        logger.debug("couldn't load %s: %s" % (_schema_filename, e))
+
+    return _compile_schema_records()
+
+
+def schema_statements(part):
+    '''
+    Get the statements of a *part* of the ooaofooa schema, i.e. classes,
+    associations, indices or globals. The statements are decoded on first
+    use, preferably from records precompiled when the package was built, so
+    that the schema need not be parsed every time a loader is created.
+    '''
+    if not _schema_statements:
+        records = _load_schema_records()
+        for key in _schema_parts:
+            name = _schema_names[key] % schema.__version__
+            _schema_statements[key] = [xtuml.load.decode_statement(record, name)
+                                       for record in records[key]]
+            
+    return _schema_statements[part]
+
+
+def _parse_file(task):
+    '''
+    Read and parse a file described by a *task*, i.e. a tuple containing a
+    filename, optionally the name of a member in a zip archive, and
+    optionally a cache directory, and the kinds of classes to include or
+    exclude instances of. Used by worker processes when several files are
+    loaded in parallel.
+    '''
+    filename, member, cache_dir, kinds, exclude_kinds = task
+    accept = xtuml.load.kind_filter(kinds, exclude_kinds)
+    if member is None and cache_dir:
+        cache = xtuml.ParseCache(cache_dir, max_size=None)
+        statements = cache.load(filename, lambda data:
+                                xtuml.StatementParser(data, filename).parse())
+        if accept is None:
+            return statements
+        
+        return [stmt for stmt in statements
+                if not isinstance(stmt, (xtuml.load.CreateInstanceStmt,
+                                         xtuml.load.DeleteInstanceStmt)) or
+                accept(stmt.kind)]
+
+    if member is None:
+        with open(filename, 'r') as f:
+            return xtuml.StatementParser(f.read(), filename,
+                                         accept=accept).parse()
+
+    with zipfile.ZipFile(filename) as zipinput:
+        with zipinput.open(member) as f:
+            f = io.TextIOWrapper(f, encoding='UTF-8')
+            return xtuml.StatementParser(f.read(), f.name,
+                                         accept=accept).parse()
+
+
 class ModelLoader(xtuml.ModelLoader):
     '''
     A *xtuml.MetaModel* loader with ooaofooa schema and globals pre-defined.
-    '''
     
-    def __init__(self, load_globals=True):
-        xtuml.ModelLoader.__init__(self)
-        self.input(schema.classes, 'ooaofooa classes (v%02.1f)' % schema.__version__)
-        self.input(schema.associations, 'ooaofooa associations (v%02.1f)' % schema.__version__)
-        self.input(schema.indices, 'ooaofooa indices (v%02.1f)' % schema.__version__)
+    When several files are loaded from a path or a zip archive, they are
+    parsed in parallel by a number of worker *processes*, by default one per
+    core. Parsed files are cached in *cache_dir*, if given, see
+    *xtuml.ModelLoader*. Files that are *mapped* into memory are parsed one
+    at a time in the loading process.
+    
+    Instances may be restricted to classes of some *kinds*, and instances of
+    classes of *exclude_kinds* left out, see *xtuml.ModelLoader*. The kinds
+    needed to build a component are given by *component_kinds()*.
+    '''
+    processes = None
+    
+    def __init__(self, load_globals=True, processes=None, cache_dir=None,
+                 mapped=False, kinds=None, exclude_kinds=None):
+        xtuml.ModelLoader.__init__(self, cache_dir=cache_dir, mapped=mapped,
+                                   kinds=kinds, exclude_kinds=exclude_kinds)
+        self.processes = processes or multiprocessing.cpu_count()
+        self._add_statements(schema_statements('classes'))
+        self._add_statements(schema_statements('associations'))
+        self._add_statements(schema_statements('indices'))
         if load_globals:
-            self.input(schema.globals, 'predefined ooaofooa globals (v%02.1f)' % schema.__version__)
+            self._add_statements(schema_statements('globals'))
         
     def filename_input(self, path_or_filename):
         '''
@@ -515,19 +711,62 @@ class ModelLoader(xtuml.ModelLoader):
         If the filename is a zip archive, files that ends with .xtuml located
         somewhere in the archive will be loaded as well.
         '''
+        tasks = list()
         if os.path.isdir(path_or_filename):
             for path, _, files in os.walk(path_or_filename):
                 for name in files:
                     if name.endswith('.xtuml'):
-                        xtuml.ModelLoader.filename_input(self, os.path.join(path, name))
+                        tasks.append((os.path.join(path, name), None))
+                        
         elif zipfile.is_zipfile(path_or_filename):
             with zipfile.ZipFile(path_or_filename) as zipinput:
                 for zipinfo in zipinput.filelist:
                     if zipinfo.filename.endswith('.xtuml'):
-                        with zipinput.open(zipinfo) as f:
-                            xtuml.ModelLoader.file_input(self, io.TextIOWrapper(f, encoding='UTF-8'))
+                        tasks.append((path_or_filename, zipinfo.filename))
         else:
-            xtuml.ModelLoader.filename_input(self, path_or_filename)
+            return xtuml.ModelLoader.filename_input(self, path_or_filename)
+
+        if (len(tasks) > 1 and self.processes > 1 and self.fast_parser and
+            not self.mapped):
+            return self._parallel_input(tasks)
+        
+        if os.path.isdir(path_or_filename):
+            for filename, _ in tasks:
+                xtuml.ModelLoader.filename_input(self, filename)
+        else:
+            with zipfile.ZipFile(path_or_filename) as zipinput:
+                for _, member in tasks:
+                    with zipinput.open(member) as f:
+                        f = io.TextIOWrapper(f, encoding='UTF-8')
+                        xtuml.ModelLoader.file_input(self, f)
+
+    def _parallel_input(self, tasks):
+        '''
+        Parse files described by *tasks* in worker processes, and add the
+        resulting statements in the same order as the tasks.
+        '''
+        processes = min(self.processes, len(tasks))
+        chunksize = max(1, len(tasks) // (processes * 4))
+        if self.cache is not None:
+            cache_dir = self.cache.directory
+        else:
+            cache_dir = None
+
+        tasks = [(filename, member, cache_dir, self.kinds, self.exclude_kinds)
+                 for filename, member in tasks]
+        pool = multiprocessing.Pool(processes)
+        try:
+            for statements in pool.imap(_parse_file, tasks, chunksize):
+                self._add_statements(statements)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        if self.cache is not None:
+            self.cache.evict()
 
     def build_component(self, name=None, derived_attributes=False):
         '''
@@ -552,26 +791,28 @@ class ModelLoader(xtuml.ModelLoader):
             return mk_component(mm, c_c, derived_attributes)
     
 
-def _mk_loader(resource, load_globals):
+def _mk_loader(resource, load_globals, kinds=None, exclude_kinds=None):
     resource = resource or list()
         
     if isinstance(resource, str):
         resource = [resource]
         
-    loader = Loader(load_globals)
+    loader = Loader(load_globals, kinds=kinds, exclude_kinds=exclude_kinds)
     for filename in resource:
         loader.filename_input(filename)
     
     return loader
 
 
-def load_metamodel(resource=None, load_globals=True):
+def load_metamodel(resource=None, load_globals=True, kinds=None,
+                   exclude_kinds=None):
     '''
     Load and return a metamodel expressed in ooaofooa from a *resource*.
     The resource may be either a filename, a path, or a list of filenames
-    and/or paths.
+    and/or paths. Optionally, only load instances of classes of some *kinds*,
+    and leave out instances of classes of *exclude_kinds*.
     '''
-    loader = _mk_loader(resource, load_globals)
+    loader = _mk_loader(resource, load_globals, kinds, exclude_kinds)
     return loader.build_metamodel()
 
 
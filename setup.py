@@ -38,11 +38,13 @@ class BuildCommand(build_py):
     def run(self):
         import xtuml
         from bridgepoint import oal
+        from bridgepoint import ooaofooa
 
         l = xtuml.ModelLoader()
         l.input('', name='<empty string>')
         l.build_metamodel()
         oal.parse('')
+        ooaofooa.precompile_schema()
         build_py.run(self)
 
 
@@ -86,6 +88,7 @@ setup(name='pyxtuml',
           'Programming Language :: Python :: 3.6'],
       keywords='xtuml bridgepoint',
       packages=['xtuml', 'bridgepoint'],
+      package_data={'bridgepoint': ['__ooaofooa_schema.marshal']},
       requires=['ply'],
       install_requires=['ply'],
       setup_requires=['ply'],
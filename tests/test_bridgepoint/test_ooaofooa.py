@@ -18,6 +18,7 @@
 import atexit
 import os
 import shutil
+import tempfile
 import unittest
 import xtuml
 from bridgepoint import ooaofooa
@@ -50,6 +51,73 @@ class TestOoaOfOoa(unittest.TestCase):
 
         metamodel = ooaofooa.load_metamodel(zipfile, load_globals=False)
         self.assertTrue(metamodel.select_any('S_DT', xtuml.where_eq(Name='integer')) is not None)
+
+
+    def test_parallel_input(self):
+        dirname = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        zipfile = shutil.make_archive(dirname + '_parallel', 'zip', dirname)
+        atexit.register(os.remove, zipfile)
+        
+        for resource in [dirname, zipfile]:
+            models = list()
+            for processes in [1, 2]:
+                loader = ooaofooa.Loader(load_globals=False, processes=processes)
+                loader.filename_input(resource)
+                models.append(xtuml.serialize(loader.build_metamodel()))
+                
+            self.assertEqual(models[0], models[1])
+
+    def test_component_kinds(self):
+        dirname = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        filename = dirname + os.sep + 'Simple_Model.xtuml'
+        kinds = ooaofooa.component_kinds()
+        self.assertTrue('O_OBJ' in kinds)
+        self.assertFalse('GD_GE' in kinds)
+
+        resources = [dirname] + [dirname + os.sep + name
+                                 for name in sorted(os.listdir(dirname))
+                                 if name.endswith('.xtuml')]
+        for resource in resources:
+            components = list()
+            for processes in [1, 2]:
+                for loader_kinds in [None, kinds]:
+                    loader = ooaofooa.Loader(processes=processes, kinds=loader_kinds)
+                    loader.filename_input(resource)
+                    components.append(xtuml.serialize(loader.build_component()))
+
+            for component in components[1:]:
+                self.assertEqual(components[0], component)
+
+        m = ooaofooa.load_metamodel(filename, kinds=kinds)
+        self.assertTrue(m.select_any('O_OBJ'))
+        self.assertFalse('GD_GE' in m.metaclasses)
+
+    def test_precompiled_schema(self):
+        loader = xtuml.ModelLoader()
+        for part in ['classes', 'associations', 'indices', 'globals']:
+            loader.input(getattr(ooaofooa.schema, part))
+        expected = xtuml.serialize(loader.build_metamodel())
+
+        dirname = tempfile.mkdtemp()
+        filename = os.path.join(dirname, 'schema.marshal')
+        default_filename = ooaofooa._schema_filename
+        ooaofooa._schema_filename = filename
+        try:
+            models = list()
+            for precompile in [False, True]:
+                if precompile:
+                    ooaofooa.precompile_schema()
+                ooaofooa._schema_statements.clear()
+                loader = ooaofooa.Loader()
+                models.append(xtuml.serialize(loader.build_metamodel()))
+                self.assertEqual(precompile, os.path.exists(filename))
+        finally:
+            ooaofooa._schema_filename = default_filename
+            ooaofooa._schema_statements.clear()
+            shutil.rmtree(dirname)
+
+        self.assertEqual(expected, models[0])
+        self.assertEqual(expected, models[1])
         
         
 if __name__ == "__main__":
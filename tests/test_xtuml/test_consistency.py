@@ -90,6 +90,39 @@ class TestConcistency(unittest.TestCase):
         xtuml.delete(pe_pe_clone)
         self.assertTrue(m.is_consistent())
 
+    def test_incremental_check(self):
+        m = self.metamodel
+        
+        def full_check():
+            return (xtuml.check_association_integrity(m) +
+                    xtuml.check_uniqueness_constraint(m))
+
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        s_dt = m.select_one('S_DT', xtuml.where_eq(Name='string'))
+        pe_pe = xtuml.navigate_one(s_dt).PE_PE[8001]()
+        pe_pe_clone = m.clone(pe_pe)
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        s_bparm = m.new('S_BPARM', Name='My_Parameter')
+        s_brg = m.new('S_BRG', Name='My_Bridge_Operation')
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        self.assertTrue(xtuml.relate(s_bparm, s_dt, 22))
+        self.assertTrue(xtuml.relate(s_bparm, s_brg, 21))
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        pe_pe_clone.Element_ID = None
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        pe_pe.Element_ID = None
+        self.assertEqual(full_check(), m.incremental_check())
+        
+        xtuml.delete(pe_pe_clone)
+        xtuml.delete(s_bparm)
+        self.assertEqual(full_check(), m.incremental_check())
+        self.assertFalse(m.journal)
+
     def test_subtype_integrity(self):
         for num in range(0, 5):
             errors = xtuml.check_subtype_integrity(self.metamodel, 'PE_PE', 8001)
@@ -18,6 +18,7 @@
 
 import unittest
 import os
+import tempfile
 
 import xtuml
 
@@ -51,7 +52,322 @@ class TestLoader(unittest.TestCase):
 
         metamodel = xtuml.load_metamodel([globs, schema])
         self.assertTrue(metamodel.select_any('S_DT', xtuml.where_eq(Name='integer')) is not None)
+
+    def test_fast_parser(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        for name in ['ooaofooa_schema.sql', 'Simple_Model.xtuml']:
+            with open(resources + os.sep + name) as f:
+                data = f.read()
+            
+            statements = list()
+            for fast_parser in [True, False]:
+                loader = xtuml.ModelLoader(fast_parser)
+                loader.input(data, name)
+                statements.append([(type(stmt), vars(stmt))
+                                   for stmt in loader.statements])
+            
+            self.assertEqual(statements[0], statements[1])
+    
+    def test_stream(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+
+        loader = xtuml.ModelLoader()
+        for filename in [globs, schema, model]:
+            loader.filename_input(filename)
+        expected = xtuml.serialize(loader.build_metamodel())
+
+        for compact in [False, True]:
+            loader = xtuml.ModelLoader()
+            loader.chunk_size = 100
+            loader.filename_input(globs)
+            loader.stream(compact=compact)
+            loader.filename_input(schema)
+            loader.filename_input(model)
+            m = loader.build_metamodel()
+            
+            self.assertFalse(loader.statements)
+            self.assertIsNone(loader.metamodel)
+            self.assertEqual(expected, xtuml.serialize(m))
+
+    def test_mapped_input(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+
+        loader = xtuml.ModelLoader()
+        for filename in [globs, schema, model]:
+            loader.filename_input(filename)
+        expected = xtuml.serialize(loader.build_metamodel())
+
+        defer_size = xtuml.StatementParser.defer_size
+        for compact in [False, True]:
+            xtuml.StatementParser.defer_size = 0
+            try:
+                loader = xtuml.ModelLoader(mapped=True)
+                for filename in [globs, schema, model]:
+                    loader.filename_input(filename)
+            finally:
+                xtuml.StatementParser.defer_size = defer_size
+            m = loader.build_metamodel(compact=compact)
+
+            deferred = m.find_metaclass('O_OBJ').deferred
+            self.assertTrue(deferred)
+            inst, name = next(iter(deferred))
+            self.assertTrue(isinstance(getattr(inst, name), type(u'')))
+            self.assertFalse((inst, name) in deferred)
+
+            self.assertEqual(expected, xtuml.serialize(m.fork()))
+            self.assertEqual(expected, xtuml.serialize(m))
+
+    def test_mapped_input_persist(self):
+        (_, filename) = tempfile.mkstemp()
+        with open(filename, 'w') as f:
+            f.write('''
+            CREATE TABLE X (Id INTEGER, Text STRING);
+            INSERT INTO X VALUES (1, '%s');
+            ''' % ('x' * 100))
+
+        loader = xtuml.ModelLoader(mapped=True)
+        loader.filename_input(filename)
+        m = loader.build_metamodel()
+        self.assertTrue(m.find_metaclass('X').deferred)
+        expected = xtuml.serialize(m.fork())
+
+        m = loader.build_metamodel()
+        xtuml.persist_database(m, filename)
+        self.assertEqual(m.select_any('X').Text, 'x' * 100)
+        self.assertEqual(expected, xtuml.serialize(m))
+
+        m = loader.build_metamodel()
+        self.assertEqual(m.select_any('X').Text, 'x' * 100)
+        os.remove(filename)
+
+    def test_deferred_string_write(self):
+        loader = xtuml.ModelLoader()
+        loader.input(bytearray(b'''
+        CREATE TABLE X (Id INTEGER, Text STRING);
+        INSERT INTO X VALUES (1, '%s');
+        ''' % (b"it''s" * 20)))
+        m = loader.build_metamodel()
+        x = m.select_any('X')
+        self.assertTrue(m.find_metaclass('X').deferred)
+        self.assertEqual(x.text, "it's" * 20)
+
+        loader.input(bytearray(b"INSERT INTO X VALUES (3, '%s');" %
+                               (b'x' * 100)))
+        m = loader.build_metamodel()
+        x = m.select_any('X', xtuml.where_eq(Id=3))
+        x.Text = 'short'
+        self.assertFalse((x, 'Text') in m.find_metaclass('X').deferred)
+        self.assertEqual(x.Text, 'short')
+
+    def test_kinds(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+        kinds = ['o_obj', 'O_ATTR', 'R_REL']
+
+        loader = xtuml.ModelLoader()
+        loader.filename_input(schema)
+        loader.filename_input(model)
+        expected = xtuml.serialize(loader.build_metamodel(kinds=kinds))
+        m = loader.build_metamodel(exclude_kinds=['O_OBJ'])
+        self.assertFalse(m.select_any('O_OBJ'))
+        self.assertTrue(m.select_any('O_ATTR'))
+        
+        m = xtuml.load_metamodel([schema, model], kinds=kinds)
+        self.assertEqual(expected, xtuml.serialize(m))
+        self.assertTrue(m.select_any('O_OBJ'))
+        self.assertFalse(m.select_any('PE_PE'))
+        
+        for mapped in [False, True]:
+            loader = xtuml.ModelLoader(mapped=mapped, kinds=kinds,
+                                       exclude_kinds=['R_REL'])
+            loader.filename_input(schema)
+            loader.filename_input(model)
+            m = loader.build_metamodel()
+            self.assertTrue(m.select_any('O_ATTR'))
+            self.assertFalse(m.select_any('R_REL'))
+            self.assertFalse(m.select_any('PE_PE'))
+
+    def test_stream_error(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+        with open(model) as f:
+            data = f.read()
+
+        idx = data.index(';', 5000) + 1
+        data = data[:idx] + '@' + data[idx:]
+        (_, filename) = tempfile.mkstemp()
+        with open(filename, 'w') as f:
+            f.write(data)
+
+        messages = list()
+        for streaming in [False, True]:
+            loader = xtuml.ModelLoader()
+            loader.chunk_size = 100
+            if streaming:
+                loader.stream()
+                
+            with self.assertRaises(xtuml.ParsingException) as cm:
+                loader.filename_input(filename)
+            messages.append(str(cm.exception))
+            
+        loader = xtuml.ModelLoader()
+        loader.chunk_size = 100
+        loader.stream()
+        with open(filename) as f:
+            self.assertRaises(xtuml.ParsingException, loader.file_input, f)
+            self.assertTrue(f.tell() < idx + 1000)
+
+        os.remove(filename)
+        self.assertEqual(messages[0], messages[1])
+        
+    def test_stream_long_statement(self):
+        text = 'x' * 5000
+        (_, filename) = tempfile.mkstemp()
+        with open(filename, 'w') as f:
+            f.write("CREATE TABLE X (Name STRING);\n")
+            f.write("INSERT INTO X VALUES ('%s');\n" % text)
+            f.write("INSERT INTO X VALUES ('y');\n")
+
+        sizes = list()
+        class Reader(object):
+            def __init__(self, f):
+                self.f = f
+                self.name = f.name
+                
+            def read(self, size):
+                sizes.append(size)
+                return self.f.read(size)
+            
+        loader = xtuml.ModelLoader()
+        loader.chunk_size = 100
+        loader.stream()
+        with open(filename) as f:
+            loader.file_input(Reader(f))
+        m = loader.build_metamodel()
+        os.remove(filename)
+
+        self.assertEqual([text, 'y'], [x.Name for x in m.select_many('X')])
+        self.assertEqual(100, sizes[0])
+        self.assertTrue(len(sizes) < 10)
         
+    def test_parse_cache(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        with open(resources + os.sep + 'Simple_Model.xtuml') as f:
+            data = f.read()
+            
+        cache_dir = tempfile.mkdtemp()
+        (_, model) = tempfile.mkstemp()
+        with open(model, 'w') as f:
+            f.write(data)
+
+        def failing_parse(data, name):
+            self.fail('%s was not served from cache' % name)
+            
+        serialized = list()
+        for fast_parser in [True, False, True]:
+            loader = xtuml.ModelLoader(fast_parser, cache_dir=cache_dir)
+            if len(serialized) == 2:
+                os.utime(model, (0, 0))
+                loader._parse = failing_parse
+                
+            loader.filename_input(schema)
+            loader.filename_input(model)
+            serialized.append(xtuml.serialize(loader.build_metamodel()))
+
+        self.assertEqual(serialized[0], serialized[1])
+        self.assertEqual(serialized[0], serialized[2])
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        
+        with open(model, 'w') as f:
+            f.write(data + "INSERT INTO S_SYS VALUES (1, 'X', 1, 0);")
+        
+        loader = xtuml.ModelLoader(cache_dir=cache_dir)
+        loader.filename_input(schema)
+        loader.filename_input(model)
+        m = loader.build_metamodel()
+        self.assertTrue(m.select_any('S_SYS', xtuml.where_eq(Name='X')))
+
+        loader.cache.max_size = 1
+        loader.cache.evict()
+        self.assertEqual(os.listdir(cache_dir), [])
+        
+        os.remove(model)
+        os.rmdir(cache_dir)
+        
+    def test_fast_parser_errors(self):
+        for data in ["CREATE TABLE & (Id INTEGER);",
+                     "CREATE TABLE X (Id INTEGER)",
+                     "INSERT INTO X VALUES (1C);",
+                     "INSERT INTO X\nVALUES ('a\nb', -);",
+                     "CREATE ROP REF_ID R1 FROM 2 X (Id) TO 1 Y (Id);",
+                     "CREATE ROP REF_ID R1 FROM X (Id) TO 1 Y (Id);"]:
+            messages = list()
+            for fast_parser in [True, False]:
+                loader = xtuml.ModelLoader(fast_parser)
+                with self.assertRaises(xtuml.ParsingException) as cm:
+                    loader.input(data)
+                messages.append(str(cm.exception))
+            
+            self.assertEqual(messages[0], messages[1])
+
+    def test_compact(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+
+        loader = xtuml.ModelLoader()
+        loader.filename_input(schema)
+        loader.filename_input(globs)
+        m1 = loader.build_metamodel()
+        m2 = loader.build_metamodel(compact=True)
+
+        s_dt = m2.select_any('S_DT', xtuml.where_eq(name='integer'))
+        self.assertIn('Name', type(s_dt).__slots__)
+        self.assertNotIn('Name', s_dt.__dict__)
+        self.assertEqual(s_dt.NAME, 'integer')
+
+        metaclass = xtuml.get_metaclass(s_dt)
+        self.assertIn('DT_ID', metaclass.referential_attributes)
+        self.assertNotIn('DT_ID', type(s_dt).__slots__)
+
+        pe_pe = xtuml.navigate_one(s_dt).PE_PE[8001]()
+        self.assertEqual(pe_pe.Element_ID, s_dt.DT_ID)
+
+        s_dt.Extra = 1
+        self.assertEqual(s_dt.Extra, 1)
+        self.assertEqual(xtuml.serialize_instances(m1),
+                         xtuml.serialize_instances(m2))
+
+        usage1 = m1.memory_usage()
+        usage2 = m2.memory_usage()
+        self.assertTrue(0 < usage2['S_DT'] < usage1['S_DT'])
+        
+    @load_docstring
+    def test_insert_shapes(self, m):
+        '''
+        CREATE TABLE X (Id UNIQUE_ID, Name STRING, Count INTEGER);
+        INSERT INTO X VALUES ("1e0eb5a0-95d7-4f0a-9d43-6d1a2a1b9a0c", 'a', 1);
+        INSERT INTO X (Name, Id) VALUES ('b', "{2e0eb5a0-95d7-4f0a-9d43-6d1a2a1b9a0c}");
+        INSERT INTO X (Id, Name) VALUES ("3e0eb5a095d74f0a9d436d1a2a1b9a0c", 'c');
+        INSERT INTO X VALUES ("00000000-0000-0000-0000-000000000004", 'd');
+        INSERT INTO X VALUES (5, 'e', "00000000-0000-0000-0000-00000000000f");
+        '''
+        values = [(x.Id, x.Name, x.Count) for x in m.select_many('X')]
+        self.assertEqual(values, [
+            (0x1e0eb5a095d74f0a9d436d1a2a1b9a0c, 'a', 1),
+            (0x2e0eb5a095d74f0a9d436d1a2a1b9a0c, 'b', None),
+            (0x3e0eb5a095d74f0a9d436d1a2a1b9a0c, 'c', None),
+            (4, 'd', 0),
+            (5, 'e', 15)])
+
     @load_docstring
     def test_table_named_create(self, m):
         '''
@@ -332,6 +648,29 @@ class TestLoader(unittest.TestCase):
         y = xtuml.navigate_one(x).Y[1]()
         self.assertTrue(y is not None)
 
+    @load_docstring
+    def test_rop_with_composite_key(self, m):
+        '''
+        CREATE TABLE X (Name STRING, Id INTEGER, Y_Id INTEGER, Y_Name STRING);
+        CREATE TABLE Y (Id INTEGER, Name STRING);
+
+        CREATE ROP REF_ID R1 FROM MC X (Y_Name, Y_Id)
+                             TO   1 Y (Name, Id);
+
+        INSERT INTO Y VALUES (1, 'a');
+        INSERT INTO Y VALUES (1, 'b');
+        INSERT INTO Y VALUES (2, '');
+        INSERT INTO X VALUES ('x1', 1, 1, 'b');
+        INSERT INTO X VALUES ('x2', 2, 2, '');
+        '''
+        x1 = m.select_any('X', xtuml.where_eq(Name='x1'))
+        y = xtuml.navigate_one(x1).Y[1]()
+        self.assertTrue(y is not None)
+        self.assertEqual(y.Name, 'b')
+
+        x2 = m.select_any('X', xtuml.where_eq(Name='x2'))
+        self.assertTrue(xtuml.navigate_one(x2).Y[1]() is None)
+
     @load_docstring
     def test_empty_input(self, m):
         ''''''
@@ -475,6 +814,72 @@ class TestLoader(unittest.TestCase):
         self.assertTrue(x)
         self.assertEqual(x.self, 'test')
 
+    @load_docstring
+    def test_delete_from(self, m):
+        '''
+        CREATE TABLE X (Id UNIQUE_ID, Name STRING, Y_Id UNIQUE_ID);
+        CREATE TABLE Y (Id UNIQUE_ID);
+        CREATE ROP REF_ID R1 FROM MC X (Y_Id) TO 1 Y (Id);
+        INSERT INTO Y VALUES ("00000000-0000-0000-0000-000000000001");
+        INSERT INTO X VALUES (1, 'a', "00000000-0000-0000-0000-000000000001");
+        INSERT INTO X VALUES (2, 'b', "00000000-0000-0000-0000-000000000001");
+        INSERT INTO X VALUES (3, 'c', 1);
+        DELETE FROM X VALUES (1, 'a', 1);
+        DELETE FROM X (Name, Y_Id, Id) VALUES ('b', 1, 2);
+        '''
+        self.assertEqual(len(m.select_many('X')), 1)
+        x = m.select_any('X')
+        self.assertEqual(x.Name, 'c')
+        self.assertTrue(xtuml.navigate_one(x).Y[1]())
+
+    @load_docstring
+    def test_delete_from_unknown_instance(self, m):
+        '''
+        CREATE TABLE X (Id UNIQUE_ID);
+        INSERT INTO X VALUES (1);
+        DELETE FROM X VALUES (2);
+        '''
+        self.assertIsInstance(m, xtuml.ParsingException)
+
+    def test_delete_from_parsers(self):
+        data = '''
+        DELETE FROM X VALUES (1, 'a', -2.5);
+        delete from X (A, B) VALUES ("00000000-0000-0000-0000-000000000001", TRUE);
+        '''
+        statements = list()
+        for fast_parser in [True, False]:
+            loader = xtuml.ModelLoader(fast_parser)
+            loader.input(data)
+            statements.append([(type(stmt), vars(stmt))
+                               for stmt in loader.statements])
+        
+        self.assertEqual(statements[0], statements[1])
+        self.assertEqual(len(statements[0]), 2)
+
+    def test_load_delta(self):
+        loader = xtuml.ModelLoader()
+        loader.input('''
+        CREATE TABLE X (Id UNIQUE_ID, Name STRING, Y_Id UNIQUE_ID);
+        CREATE TABLE Y (Id UNIQUE_ID);
+        CREATE ROP REF_ID R1 FROM MC X (Y_Id) TO 1 Y (Id);
+        INSERT INTO Y VALUES (1);
+        INSERT INTO X VALUES (2, 'a', 1);
+        ''')
+        m = loader.build_metamodel()
+        
+        loader = xtuml.ModelLoader()
+        loader.input('''
+        DELETE FROM Y VALUES (1);
+        INSERT INTO Y VALUES (1);
+        INSERT INTO X VALUES (3, 'b', 1);
+        ''')
+        loader.populate_changes(m)
+        
+        y = m.select_any('Y')
+        self.assertEqual(len(xtuml.navigate_many(y).X[1]()), 2)
+        self.assertEqual(len(m.select_many('Y')), 1)
+        self.assertTrue(m.is_consistent())
+
     @load_docstring
     def test_insert_unknown_named_values(self, m):
         '''
@@ -225,6 +225,20 @@ class TestModel(unittest.TestCase):
         inst = self.metamodel.select_any('S_DT', where(Name='void'))
         self.assertFalse(inst)
     
+    def test_delete_many(self):
+        last = self.metamodel.select_many('S_DT').last
+        inst1 = self.metamodel.select_any('S_DT', where(Name='void'))
+        inst2 = self.metamodel.select_any('S_DT', where(Name='integer'))
+        self.metamodel.delete_many([inst1, inst2])
+
+        q = self.metamodel.select_many('S_DT')
+        self.assertNotIn(inst1, q)
+        self.assertNotIn(inst2, q)
+        self.assertEqual(q.last, last)
+        self.assertFalse(xtuml.navigate_one(inst1).PE_PE[8001]())
+        self.assertRaises(xtuml.DeleteException, self.metamodel.delete_many,
+                          [inst1])
+
     def test_delete_twise(self):
         inst = self.metamodel.select_any('S_DT', where(Name='void'))
         xtuml.delete(inst)
@@ -255,6 +269,30 @@ class TestModel(unittest.TestCase):
         self.assertEqual(pe_pe_clone.Component_ID, pe_pe.Component_ID)
         self.assertEqual(pe_pe_clone.type, pe_pe.type)
     
+    def test_fork(self):
+        s_ee = self.metamodel.new('S_EE', Name='Test', Key_Lett='TEST')
+        pe_pe = self.metamodel.new('PE_PE')
+        self.assertTrue(xtuml.relate(s_ee, pe_pe, 8001))
+        
+        m = self.metamodel.fork()
+        self.assertEqual(xtuml.serialize(self.metamodel), xtuml.serialize(m))
+        
+        s_ee_fork = m.select_any('S_EE', where(Name='Test'))
+        self.assertNotEqual(s_ee, s_ee_fork)
+        self.assertEqual(s_ee_fork.EE_ID, s_ee.EE_ID)
+        self.assertIs(xtuml.get_metamodel(s_ee_fork), m)
+        
+        pe_pe_fork = xtuml.navigate_one(s_ee_fork).PE_PE[8001]()
+        self.assertNotEqual(pe_pe, pe_pe_fork)
+        self.assertIs(xtuml.get_metamodel(pe_pe_fork), m)
+        self.assertEqual(pe_pe_fork.Element_ID, s_ee_fork.EE_ID)
+        
+        s_ee_fork.Name = 'Changed'
+        xtuml.delete(pe_pe_fork)
+        self.assertEqual(s_ee.Name, 'Test')
+        self.assertEqual(xtuml.navigate_one(s_ee).PE_PE[8001](), pe_pe)
+        self.assertFalse(xtuml.navigate_one(s_ee_fork).PE_PE[8001]())
+        
     def test_delete_unknown_instance(self):
         self.assertRaises(xtuml.DeleteException, xtuml.delete, self)
 
@@ -327,6 +365,25 @@ class TestDefineAssociations(unittest.TestCase):
         
         self.assertEqual(a, xtuml.navigate_one(b).A[1]())
 
+    def test_resolved_links(self):
+        metaclass = self.metamodel.define_class('A', [('Id', 'unique_id')])
+        self.metamodel.define_class('B', [('Id', 'unique_id'),
+                                          ('A_Id', 'unique_id')])
+
+        self.assertRaises(xtuml.UnknownLinkException,
+                          metaclass.resolve_link, 'B', 1)
+        
+        self.metamodel.define_association(1, 'A', ['Id'], False, False, '',
+                                          'B', ['A_Id'], True, False, '')
+        link = metaclass.links[('B', 'R1', '')]
+        self.assertEqual(metaclass.resolve_link('b', 1), (link,))
+        self.assertIn(('b', 1, ''), metaclass.resolved_links)
+        
+        self.metamodel.define_class('C', [('Id', 'unique_id')])
+        self.metamodel.define_association(2, 'A', ['Id'], False, False, '',
+                                          'C', ['Id'], True, False, '')
+        self.assertFalse(metaclass.resolved_links)
+
 
 class TestClass(unittest.TestCase):
     '''
@@ -396,6 +453,31 @@ class TestMetaClass(unittest.TestCase):
         self.assertEqual(self.metaclass.default_value('unique_id'), None)
         self.assertEqual(self.metaclass.default_value('boolean'), False)
     
+    def test_referential_cache(self):
+        self.metaclass.append_attribute('id', 'integer')
+        other = xtuml.MetaClass('Other')
+        other.append_attribute('test_id', 'integer')
+        
+        source_link = self.metaclass.add_link(other, 'R1', '', True, True)
+        source_link.key_map = dict(test_id='id')
+        target_link = other.add_link(self.metaclass, 'R1', '', True, False)
+        target_link.key_map = dict(id='test_id')
+        xtuml.Association('R1', ['test_id'], source_link,
+                          ['id'], target_link).formalize()
+        
+        inst = self.metaclass(id=1)
+        other_inst = other()
+        self.assertTrue(source_link.connect(inst, other_inst))
+        self.assertTrue(target_link.connect(other_inst, inst))
+        self.assertEqual(other_inst.test_id, 1)
+        self.assertIn(other_inst, other.referential_cache)
+        
+        inst.id = 2
+        self.assertEqual(other_inst.test_id, 2)
+        
+        other.drop_referential_cache()
+        self.assertFalse(other.referential_cache)
+        
     def test_modifying_attributes(self):
         self.metaclass.append_attribute('number', 'integer')
         self.metaclass.append_attribute('name', 'string')
@@ -415,8 +497,99 @@ class TestMetaClass(unittest.TestCase):
         
         self.assertEqual(inst1.number, 2)
         self.assertEqual(inst1.name, 'test')
-        
-        
+
+    def test_attribute_case_insensitivity(self):
+        self.metaclass.append_attribute('Number', 'integer')
+        inst = self.metaclass(NUMBER=2)
+        self.assertEqual(inst.number, 2)
+        self.assertEqual(self.metaclass.attribute_type('nUMBER'), 'integer')
+
+        inst.nUmBeR = 3
+        self.assertEqual(inst.Number, 3)
+        self.assertNotIn('nUmBeR', inst.__dict__)
+
+        self.metaclass.insert_attribute(0, 'Name', 'string')
+        inst.NAME = 'test'
+        self.assertEqual(inst.name, 'test')
+        self.assertEqual(self.metaclass.attribute_type('name'), 'string')
+
+        self.metaclass.delete_attribute('Name')
+        self.assertIsNone(self.metaclass.attribute_type('name'))
+        self.assertRaises(AttributeError, getattr, inst, 'NAME')
+
+    def test_query_hash_index(self):
+        self.metaclass.append_attribute('number', 'integer')
+        self.metaclass.append_attribute('name', 'string')
+
+        inst1 = self.metaclass(number=1, name='A')
+        inst2 = self.metaclass(number=2, name='B')
+        inst3 = self.metaclass(number=1, name='C')
+
+        q = self.metaclass.select_many(where(NUMBER=1))
+        self.assertEqual(q, [inst1, inst3])
+        self.assertIn(('number',), self.metaclass.hash_indices)
+
+        inst4 = self.metaclass(number=1, name='D')
+        inst2.number = 1
+        inst3.number = 3
+        q = self.metaclass.select_many(where(number=1))
+        self.assertEqual(q, [inst1, inst2, inst4])
+
+        xtuml.delete(inst1)
+        q = self.metaclass.select_many(where(number=1, name='D'))
+        self.assertEqual(q, [inst4])
+        self.assertEqual(self.metaclass.select_one(where(number=3)), inst3)
+        self.assertIsNone(self.metaclass.select_one(where(number=4)))
+
+    def test_query_hash_index_on_identifier(self):
+        m = xtuml.MetaModel()
+        metaclass = m.define_class('A', [('Id', 'integer'), ('Name', 'string')])
+        m.define_unique_identifier('A', 1, 'id')
+
+        inst1 = m.new('A', Id=1, Name='A')
+        inst2 = m.new('A', Id=2, Name='B')
+
+        self.assertEqual(m.select_one('A', where(Id=2, Name='B')), inst2)
+        self.assertIsNone(m.select_one('A', where(Id=2, Name='A')))
+        self.assertEqual(list(metaclass.hash_indices), [('Id',)])
+
+        metaclass.append_attribute('Other', 'integer')
+        self.assertFalse(metaclass.hash_indices)
+        self.assertEqual(m.select_one('A', where(Id=1)), inst1)
+
+    def test_query_columns(self):
+        m = xtuml.MetaModel()
+        metaclass = m.define_class('A', [('Id', 'integer'), ('Name', 'string')])
+
+        inst1 = m.new('A', Id=1, Name='A')
+        inst2 = m.new('A', Id=2, Name='B')
+        inst3 = m.new('A', Name='C')
+
+        q = m.select_many('A', xtuml.where_vec(Id__gt=1))
+        self.assertEqual(list(q), [inst2])
+        self.assertEqual(list(metaclass.columns), ['Id'])
+
+        q = m.select_many('A', xtuml.where_vec(id__ge=1, Name__ne='A'))
+        self.assertEqual(list(q), [inst2])
+
+        q = m.select_many('A', xtuml.where_vec(Name__in=['A', 'C']))
+        self.assertEqual(list(q), [inst1, inst3])
+
+        inst1.Id = 3
+        self.assertNotIn('Id', metaclass.columns)
+        q = m.select_many('A', xtuml.where_vec(Id__ge=2))
+        self.assertEqual(list(q), [inst1, inst2])
+
+        inst4 = m.new('A', Id=4)
+        q = m.select_many('A', xtuml.where_vec(Id__ge=2), xtuml.order_by('Id'))
+        self.assertEqual(list(q), [inst2, inst1, inst4])
+
+        xtuml.delete(inst2)
+        q = m.select_many('A', lambda sel: True, xtuml.where_vec(Id__ge=2))
+        self.assertEqual(list(q), [inst1, inst4])
+
+
+
 class TestQuerySet(unittest.TestCase):
     '''
     Test suite for the class xtuml.QuerySet
@@ -41,6 +41,29 @@ class TestNavigation(unittest.TestCase):
         pe_pe = xtuml.navigate_many(s_dt).PE_PE[8001](lambda inst: True)
         self.assertEqual(len(s_dt), len(pe_pe))
    
+    def test_navigate_many_chain(self):
+        s_dt = self.m.select_many('S_DT')
+        s_dt = xtuml.navigate_many(s_dt).PE_PE[8001].S_DT[8001]()
+        s_cdt = xtuml.navigate_many(s_dt).S_CDT[17]()
+        self.assertEqual(len(s_dt), len(self.m.select_many('S_DT')))
+        self.assertEqual(len(s_cdt), len(self.m.select_many('S_CDT')))
+        
+        expected = list()
+        for inst in s_dt:
+            inst = xtuml.navigate_one(inst).S_CDT[17]()
+            if inst is not None:
+                expected.append(inst)
+                
+        self.assertEqual(list(s_cdt), expected)
+        
+    def test_navigate_one_chain(self):
+        s_dt = self.m.select_many('S_DT')
+        s_cdt = xtuml.navigate_one(s_dt).S_CDT[17]()
+        self.assertEqual(s_cdt, xtuml.navigate_many(s_dt).S_CDT[17]().first)
+        
+        s_dt = xtuml.navigate_any(s_dt).S_CDT[17].S_DT[17](xtuml.where_eq(Name='void'))
+        self.assertEqual(s_dt.Name, 'void')
+        
     def test_navigate_suptype(self):
         s_dt = self.m.select_any('S_DT', xtuml.where_eq(Name='void'))
         s_cdt = xtuml.navigate_subtype(s_dt, 17)
@@ -70,6 +93,37 @@ class TestNavigation(unittest.TestCase):
     def test_navigate_invalid_handle(self):
         self.assertRaises(xtuml.MetaException, xtuml.navigate_one, 50)
 
+    def test_compile_path(self):
+        s_dt = self.m.select_many('S_DT')
+        path = xtuml.compile_path('PE_PE[8001]', ('S_DT', 8001))
+        self.assertEqual(path(s_dt), s_dt)
+        self.assertEqual(path.one(s_dt.first), s_dt.first)
+        self.assertEqual(path(s_dt, xtuml.where_eq(Name='void')).first,
+                         xtuml.navigate_one(s_dt).PE_PE[8001].S_DT[8001](
+                             xtuml.where_eq(Name='void')))
+        self.assertEqual(len(path(None)), 0)
+        self.assertIsNone(path.one(None))
+        
+    def test_compile_path_assoc(self):
+        s_sys = self.m.new('S_SYS')
+        g_eis = self.m.new('G_EIS')
+        s_dt = self.m.select_any('S_DT', xtuml.where_eq(Name='void'))
+        pe_pe = xtuml.navigate_one(s_dt).PE_PE[8001]()
+        
+        path = xtuml.compile_path('PE_PE[R9100]', "S_DT[R8001.'']")
+        self.assertIsNone(path.one(s_sys))
+        
+        self.assertTrue(xtuml.relate(g_eis, s_sys, 9100))
+        self.assertTrue(xtuml.relate(g_eis, pe_pe, 9100))
+        self.assertEqual(path.one(s_sys), s_dt)
+        
+    def test_compile_path_invalid(self):
+        self.assertRaises(xtuml.MetaException, xtuml.compile_path, 'PE_PE')
+        
+        s_dt = self.m.select_any('S_DT')
+        path = xtuml.compile_path('S_SYS[8001]')
+        self.assertRaises(xtuml.UnknownLinkException, path, s_dt)
+
         
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,11 @@ import os
 import tempfile
 import atexit
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 import xtuml
     
 
@@ -190,6 +195,214 @@ class TestPersist(unittest.TestCase):
         finally:
             atexit.register(os.remove, filename)
 
+    def test_serialize_to(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        m = xtuml.load_metamodel([globs, schema])
+        s = xtuml.serialize(m)
+
+        chunks = list(xtuml.iter_serialize(m))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(s, ''.join(chunks))
+
+        for buffer_size in [1, 1 << 16]:
+            f = StringIO()
+            xtuml.serialize_to(f, m, buffer_size)
+            self.assertEqual(s, f.getvalue())
+
+        inst = m.select_any('S_DT')
+        self.assertEqual(xtuml.serialize(inst),
+                         ''.join(xtuml.iter_serialize(inst)))
+
+    def test_row_formatter(self):
+        loader = xtuml.ModelLoader()
+        loader.input('CREATE TABLE X (Id UNIQUE_ID, Name STRING);')
+        m = loader.build_metamodel()
+        x = m.new('X', Id=1 << 127, Name='100%')
+        metaclass = xtuml.get_metaclass(x)
+
+        s = xtuml.serialize_instance(x)
+        self.assertTrue(metaclass.row_formatter is not None)
+        self.assertEqual(s, '''INSERT INTO X VALUES (
+    "80000000-0000-0000-0000-000000000000", -- Id : UNIQUE_ID
+    '100%' -- Name : STRING
+);
+''')
+        metaclass.append_attribute('Count', 'INTEGER')
+        self.assertTrue(metaclass.row_formatter is None)
+        x.Count = None
+        self.assertEqual(xtuml.serialize_instance(x), '''INSERT INTO X VALUES (
+    "80000000-0000-0000-0000-000000000000", -- Id : UNIQUE_ID
+    '100%', -- Name : STRING
+    0 -- Count : INTEGER
+);
+''')
+
+    def test_persist_parallel(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        m = xtuml.load_metamodel([globs, schema])
+        
+        (_, filename) = tempfile.mkstemp()
+        try:
+            xtuml.persist_database(m, filename)
+            with open(filename) as f:
+                s = f.read()
+            
+            xtuml.persist_database(m, filename, processes=2)
+            with open(filename) as f:
+                self.assertEqual(s, f.read())
+        finally:
+            atexit.register(os.remove, filename)
+
+        s = xtuml.serialize_instances(m)
+        chunks = xtuml.iter_serialize_instances_parallel(m, processes=2,
+                                                         chunk_size=7)
+        self.assertEqual(s, ''.join(chunks))
+
+    def test_persist_delta(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+        m = xtuml.load_metamodel([globs, model, schema])
+        checkpoint = m.checkpoint()
+        self.assertEqual(xtuml.serialize_delta(m, since=checkpoint), '')
+        
+        s_dt = m.select_any('S_DT', lambda sel: sel.Name == 'integer')
+        s_dt.Descrip = 'changed'
+        
+        s_dt = m.select_any('S_DT', lambda sel: sel.Name == 'real')
+        xtuml.delete(xtuml.navigate_one(s_dt).S_CDT[17]())
+        xtuml.delete(s_dt)
+        
+        o_attr = m.select_any('O_ATTR', lambda sel:
+                              xtuml.navigate_one(sel).O_BATTR[106]())
+        o_attr.Attr_ID = 12345
+
+        s_dt = m.new('S_DT', Name='new')
+        xtuml.relate(s_dt, m.new('PE_PE'), 8001)
+        s = xtuml.serialize_delta(m, since=checkpoint)
+        self.assertTrue('DELETE FROM O_BATTR VALUES' in s)
+        self.assertTrue('DELETE FROM S_CDT VALUES' in s)
+        
+        expected = sorted(xtuml.serialize_instances(m).split('INSERT INTO'))
+        (_, base) = tempfile.mkstemp()
+        (_, delta) = tempfile.mkstemp()
+        try:
+            other = xtuml.load_metamodel([globs, model, schema])
+            xtuml.persist_database(other, base)
+            xtuml.persist_delta(m, delta, since=checkpoint)
+            
+            other = xtuml.load_metamodel([base, delta])
+            s = xtuml.serialize_instances(other)
+            self.assertEqual(expected, sorted(s.split('INSERT INTO')))
+
+            other = xtuml.load_delta(xtuml.load_metamodel(base), delta)
+            s = xtuml.serialize_instances(other)
+            self.assertEqual(expected, sorted(s.split('INSERT INTO')))
+            o_attr = other.select_any('O_ATTR', xtuml.where_eq(Attr_ID=12345))
+            self.assertTrue(xtuml.navigate_one(o_attr).O_BATTR[106]())
+        finally:
+            atexit.register(os.remove, base)
+            atexit.register(os.remove, delta)
+
+        checkpoint = m.checkpoint()
+        m.new('PE_PE')
+        s = xtuml.serialize_delta(m, since=checkpoint)
+        self.assertEqual(s.count('INSERT INTO'), 1)
+        self.assertTrue('DELETE FROM' not in s)
+
+        m.stop_tracking()
+        self.assertTrue(m.changes is None)
+        m.new('PE_PE')
+        self.assertRaises(xtuml.MetaModelException, xtuml.serialize_delta, m)
+
+    def test_persist_delta_of_dependents(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+
+        def rewrite_supertype_identifier(m):
+            pe_pe = m.select_any('PE_PE', lambda sel:
+                                 xtuml.navigate_one(sel).O_OBJ[8001]())
+            pe_pe.Element_ID = 12345
+
+        def delete_attribute(m):
+            xtuml.delete(m.select_any('O_ATTR'))
+            
+        (_, base) = tempfile.mkstemp()
+        (_, delta) = tempfile.mkstemp()
+        (_, full) = tempfile.mkstemp()
+        try:
+            for fn in [rewrite_supertype_identifier, delete_attribute]:
+                m = xtuml.load_metamodel([globs, model, schema])
+                xtuml.persist_database(m, base)
+                checkpoint = m.checkpoint()
+                fn(m)
+                xtuml.persist_delta(m, delta, since=checkpoint)
+                xtuml.persist_database(m, full)
+
+                s = xtuml.serialize_instances(xtuml.load_metamodel(full))
+                expected = sorted(s.split('INSERT INTO'))
+                
+                other = xtuml.load_metamodel([base, delta])
+                s = xtuml.serialize_instances(other)
+                self.assertEqual(expected, sorted(s.split('INSERT INTO')))
+                
+                other = xtuml.load_delta(xtuml.load_metamodel(base), delta)
+                s = xtuml.serialize_instances(other)
+                self.assertEqual(expected, sorted(s.split('INSERT INTO')))
+        finally:
+            atexit.register(os.remove, base)
+            atexit.register(os.remove, delta)
+            atexit.register(os.remove, full)
+
+    def test_persist_binary(self):
+        resources = os.path.dirname(__file__) + os.sep + '..' + os.sep + 'resources'
+        schema = resources + os.sep + 'ooaofooa_schema.sql'
+        globs = resources + os.sep + 'Globals.xtuml'
+        model = resources + os.sep + 'Simple_Model.xtuml'
+        m = xtuml.load_metamodel([globs, model, schema])
+        m.new('S_DT', Name='åäö -- 100%')
+        s = xtuml.serialize(m)
+
+        (_, filename) = tempfile.mkstemp()
+        try:
+            for links in [True, False]:
+                for compact in [False, True]:
+                    xtuml.persist_binary(m, filename, links)
+                    other = xtuml.load_binary(filename, compact=compact)
+                    self.assertEqual(s, xtuml.serialize(other))
+
+            other = xtuml.load_binary(filename)
+            s_dt = other.select_any('S_DT', lambda sel: sel.Name == 'integer')
+            self.assertTrue(xtuml.navigate_one(s_dt).S_CDT[17]())
+
+            loader = xtuml.ModelLoader()
+            loader.input('''
+            CREATE TABLE X (Name STRING, Other STRING);
+            INSERT INTO X VALUES ('Åke', 'A');
+            INSERT INTO X VALUES ('Öster', 'Ängö');
+            ''')
+            m = loader.build_metamodel()
+            xtuml.persist_binary(m, filename)
+            other = xtuml.load_binary(filename)
+            self.assertEqual(xtuml.serialize(m), xtuml.serialize(other))
+            self.assertEqual(m.select_any('X').Name, other.select_any('X').Name)
+            self.assertIs(type(m.select_any('X').Name),
+                          type(other.select_any('X').Name))
+            
+            with open(filename, 'wb') as f:
+                f.write(b'INSERT INTO X VALUES ();')
+            self.assertRaises(xtuml.BinaryFormatException,
+                              xtuml.load_binary, filename)
+        finally:
+            atexit.register(os.remove, filename)
+
     def test_serialize_schema(self):
         schema = '''
             CREATE TABLE X (BOOLEAN BOOLEAN,
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with pyxtuml. If not, see <http://www.gnu.org/licenses/>.
 
+import gc
 import unittest
 import xtuml
 import bridgepoint
@@ -101,6 +102,69 @@ class TestRelateUnrelate(unittest.TestCase):
         self.assertTrue(xtuml.relate(s_edt, s_dt, 17))
         self.assertEqual(s_edt, xtuml.navigate_one(s_dt).S_EDT[17]())
     
+    def test_relate_many(self):
+        act_blk = self.m.new('ACT_BLK')
+        act_smts = [self.m.new('ACT_SMT') for _ in range(3)]
+        
+        pairs = [(act_smt, act_blk) for act_smt in act_smts]
+        self.assertEqual(xtuml.relate_many(pairs + [(None, act_blk)], 602), 3)
+        self.assertEqual(len(xtuml.navigate_many(act_blk).ACT_SMT[602]()), 3)
+        
+        pairs = [(act_smts[1], act_smts[0]), (act_smts[2], act_smts[1])]
+        self.assertEqual(xtuml.relate_many(pairs, 661, 'precedes'), 2)
+        self.assertEqual(act_smts[1],
+                         xtuml.navigate_one(act_smts[0]).ACT_SMT[661, 'succeeds']())
+        self.assertEqual(act_smts[2],
+                         xtuml.navigate_one(act_smts[1]).ACT_SMT[661, 'succeeds']())
+        
+        self.assertRaises(xtuml.RelateException, xtuml.relate_many,
+                          [(act_smts[0], self.m.new('ACT_BLK'))], 602)
+
+    def test_referential_cache(self):
+        s_dt = self.m.new('S_DT')
+        pe_pe = self.m.new('PE_PE')
+        self.assertIsNone(s_dt.DT_ID)
+        
+        self.assertTrue(xtuml.relate(s_dt, pe_pe, 8001))
+        self.assertEqual(s_dt.DT_ID, pe_pe.Element_ID)
+        self.assertIn('DT_ID', self.m.referential_cache[s_dt])
+        
+        pe_pe.Element_ID = self.m.id_generator.next()
+        self.assertEqual(s_dt.DT_ID, pe_pe.Element_ID)
+        self.assertEqual(s_dt, self.m.select_any('S_DT', xtuml.where_eq(DT_ID=pe_pe.Element_ID)))
+        
+        self.assertTrue(xtuml.unrelate(s_dt, pe_pe, 8001))
+        self.assertIsNone(s_dt.DT_ID)
+        
+    def test_referential_cache_of_dependents(self):
+        s_dt = self.m.new('S_DT')
+        pe_pe = self.m.new('PE_PE')
+        s_edt = self.m.new('S_EDT')
+        self.assertTrue(xtuml.relate(s_dt, pe_pe, 8001))
+        self.assertTrue(xtuml.relate(s_edt, s_dt, 17))
+        self.assertEqual(s_edt.DT_ID, pe_pe.Element_ID)
+        
+        other = self.m.new('S_DT')
+        self.assertIsNone(other.DT_ID)
+        self.assertIn('DT_ID', self.m.referential_cache[s_edt])
+        
+        pe_pe.Element_ID = self.m.id_generator.next()
+        self.assertEqual(s_edt.DT_ID, pe_pe.Element_ID)
+        
+        self.assertTrue(xtuml.unrelate(s_dt, pe_pe, 8001))
+        self.assertIsNone(s_edt.DT_ID)
+        
+    def test_referential_cache_of_deleted(self):
+        s_dt = self.m.new('S_DT')
+        self.assertIsNone(s_dt.DT_ID)
+        self.assertIn(s_dt, self.m.referential_cache)
+        
+        xtuml.delete(s_dt)
+        del s_dt
+        gc.collect()
+        self.assertFalse(self.m.referential_cache)
+        
+        
     def test_relate_invalid_relid(self):
         s_edt = self.m.new('S_EDT')
         s_dt = self.m.new('S_DT')
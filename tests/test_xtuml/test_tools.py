@@ -132,6 +132,12 @@ class TestOrderedSet(unittest.TestCase):
         s2 = xtuml.OrderedSet([1, 3, 2])
         self.assertNotEqual(s1, s2)
         
+    def test_position(self):
+        s1 = xtuml.OrderedSet([3, 1, 2])
+        s1.discard(1)
+        s1.add(1)
+        self.assertEqual(sorted([1, 2, 3], key=s1.position), [3, 2, 1])
+        
     def test_pop_empty(self):
         q = xtuml.OrderedSet()
         self.assertRaises(KeyError, q.pop)
@@ -31,13 +31,20 @@ from .tools import Visitor
 from .tools import NodePrintVisitor
 
 from .load import load_metamodel
+from .load import load_delta
 from .load import ParsingException
 from .load import ModelLoader
+from .load import StatementParser
+from .load import ParseCache
+from .load import DeferredString
+from .load import MappedFile
+from .load import release_mapped_file
 
 from .persist import persist_database
 from .persist import persist_instances
 from .persist import persist_schema
 from .persist import persist_unique_identifiers
+from .persist import persist_delta
 
 from .persist import serialize_database
 from .persist import serialize_schema
@@ -50,6 +57,19 @@ from .persist import serialize_instances
 from .persist import serialize_instance
 from .persist import serialize_value
 from .persist import serialize
+from .persist import iter_serialize
+from .persist import iter_serialize_database
+from .persist import iter_serialize_instances
+from .persist import iter_serialize_instances_parallel
+from .persist import serialize_to
+from .persist import serialize_delta
+from .persist import iter_serialize_delta
+
+from .binary import persist_binary
+from .binary import load_binary
+from .binary import serialize_binary
+from .binary import deserialize_binary
+from .binary import BinaryFormatException
 
 from .meta import Association
 from .meta import Link
@@ -72,11 +92,15 @@ from .meta import navigate_any
 from .meta import navigate_one
 from .meta import navigate_many
 from .meta import navigate_subtype
+from .meta import compile_path
+from .meta import NavPath
 from .meta import relate
+from .meta import relate_many
 from .meta import unrelate
 from .meta import delete
 from .meta import cardinality
 from .meta import where_eq
+from .meta import where_vec
 from .meta import sort_reflexive
 from .meta import get_metaclass
 from .meta import get_metamodel
@@ -86,3 +110,4 @@ from .meta import reverse_order_by
 from .consistency_check import check_association_integrity
 from .consistency_check import check_uniqueness_constraint
 from .consistency_check import check_subtype_integrity
+from .consistency_check import IncrementalChecker
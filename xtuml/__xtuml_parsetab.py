@@ -0,0 +1,86 @@
+
+# __xtuml_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'CARDINALITY COMMA CREATE DELETE FALSE FRACTION FROM GUID ID INDEX INSERT INTO LPAREN MINUS NUMBER ON PHRASE REF_ID RELID ROP RPAREN SEMICOLON STRING TABLE TO TRUE UNIQUE VALUEStranslation_unit :translation_unit : statement_sequencestatement_sequence : statement_sequence statementstatement_sequence : statement\n        statement : create_table_statement SEMICOLON\n                  | insert_into_statement SEMICOLON\n                  | delete_from_statement SEMICOLON\n                  | create_rop_statement SEMICOLON\n                  | create_index_statement SEMICOLON\n        create_table_statement : CREATE TABLE identifier LPAREN attribute_sequence RPARENattribute_sequence : attribute_sequence : attributeattribute_sequence : attribute_sequence COMMA attributeattribute : identifier identifier\n        insert_into_statement : INSERT INTO identifier VALUES LPAREN value_sequence RPAREN\n        \n        insert_into_statement : INSERT INTO identifier LPAREN identifier_sequence RPAREN VALUES LPAREN value_sequence RPAREN\n        \n        delete_from_statement : DELETE FROM identifier VALUES LPAREN value_sequence RPAREN\n        \n        delete_from_statement : DELETE FROM identifier LPAREN identifier_sequence RPAREN VALUES LPAREN value_sequence RPAREN\n        value_sequence : value_sequence : value_sequence COMMA valuevalue_sequence : value\n        value : FRACTION\n              | NUMBER\n              | STRING\n              | GUID\n              | TRUE\n              | FALSE\n        \n        value : MINUS FRACTION\n              | MINUS NUMBER\n        create_rop_statement : CREATE ROP REF_ID RELID FROM association_end TO association_endassociation_end : cardinality identifier LPAREN identifier_sequence RPARENassociation_end : cardinality identifier LPAREN identifier_sequence RPAREN PHRASE STRINGcardinality : NUMBERcardinality : IDcardinality : CARDINALITYidentifier_sequence : identifier_sequence : identifier_sequence COMMA identifieridentifier_sequence : identifier\n        identifier : ID\n                   | CREATE\n                   | INSERT\n                   | DELETE\n                   | INTO\n                   | VALUES\n                   | TABLE\n                   | ROP\n                   | REF_ID\n                   | FROM\n                   | TO\n                   | PHRASE\n                   | UNIQUE\n                   | INDEX\n                   | ON\n                   | TRUE\n                   | FALSE\n        \n        create_index_statement : CREATE UNIQUE INDEX identifier ON identifier LPAREN identifier_sequence RPAREN\n        '
+    
+_lr_action_items = {'INDEX':([13,14,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[23,41,23,23,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,23,23,23,23,23,23,23,-35,-33,23,-34,23,23,23,]),'NUMBER':([52,56,60,69,85,91,97,101,],[64,76,64,87,64,76,64,64,]),'PHRASE':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,107,],[24,24,24,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,24,24,24,24,24,24,24,-35,-33,24,-34,24,24,24,109,]),'GUID':([52,60,85,97,101,],[62,62,62,62,62,]),'TRUE':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,52,55,59,60,72,75,76,77,78,80,85,90,97,100,101,],[26,26,26,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,26,26,26,26,68,26,26,68,26,-35,-33,26,-34,26,68,26,68,26,68,]),'MINUS':([52,60,85,97,101,],[69,69,69,69,69,]),'INSERT':([0,1,4,12,13,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[2,2,-4,-3,27,27,-8,-6,-9,-7,-5,27,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,27,27,27,27,27,27,27,-35,-33,27,-34,27,27,27,]),'RPAREN':([23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,46,49,51,52,53,54,57,58,60,61,62,63,64,65,66,67,68,70,81,82,86,87,89,90,93,96,97,98,100,101,102,104,105,],[-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,-36,-11,-36,-19,71,-38,-12,79,-19,83,-25,-22,-23,-21,84,-27,-26,-24,-14,94,-28,-29,-37,-36,-13,-20,-19,103,-36,-19,106,107,108,]),'SEMICOLON':([6,7,8,9,10,79,84,94,99,103,106,107,108,110,],[17,18,19,20,21,-10,-15,-17,-30,-56,-16,-31,-18,-32,]),'CREATE':([0,1,4,12,13,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[3,3,-4,-3,28,28,-8,-6,-9,-7,-5,28,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,28,28,28,28,28,28,28,-35,-33,28,-34,28,28,28,]),'REF_ID':([13,15,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[25,42,25,25,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,25,25,25,25,25,25,25,-35,-33,25,-34,25,25,25,]),'TO':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,74,75,76,77,78,80,90,100,107,110,],[29,29,29,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,29,29,29,29,29,29,29,91,-35,-33,29,-34,29,29,29,-31,-32,]),'COMMA':([23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,46,49,51,52,53,54,57,58,60,61,62,63,64,65,66,67,68,70,81,82,86,87,89,90,93,96,97,98,100,101,102,104,105,],[-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,-36,-11,-36,-19,72,-38,-12,80,-19,72,-25,-22,-23,-21,85,-27,-26,-24,-14,85,-28,-29,-37,-36,-13,-20,-19,72,-36,-19,85,72,85,]),'FRACTION':([52,60,69,85,97,101,],[63,63,86,63,63,63,]),'ROP':([3,13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[15,30,30,30,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,30,30,30,30,30,30,30,-35,-33,30,-34,30,30,30,]),'TABLE':([3,13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[16,31,31,31,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,31,31,31,31,31,31,31,-35,-33,31,-34,31,31,31,]),'$end':([0,1,4,5,12,17,18,19,20,21,],[-1,-2,-4,0,-3,-8,-6,-9,-7,-5,]),'STRING':([52,60,85,97,101,109,],[70,70,70,70,70,110,]),'INTO':([2,13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[13,32,32,32,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,32,32,32,32,32,32,32,-35,-33,32,-34,32,32,32,]),'LPAREN':([23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,43,44,45,50,73,88,92,95,],[-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,46,-42,49,51,52,60,90,97,100,101,]),'FALSE':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,52,55,59,60,72,75,76,77,78,80,85,90,97,100,101,],[33,33,33,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,33,33,33,33,67,33,33,67,33,-35,-33,33,-34,33,67,33,67,33,67,]),'UNIQUE':([3,13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[14,34,34,34,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,34,34,34,34,34,34,34,-35,-33,34,-34,34,34,34,]),'ID':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,56,59,72,75,76,77,78,80,90,91,100,],[35,35,35,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,35,35,35,35,35,78,35,35,-35,-33,35,-34,35,35,78,35,]),'ON':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,47,49,51,55,59,72,75,76,77,78,80,90,100,],[36,36,36,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,36,36,55,36,36,36,36,36,-35,-33,36,-34,36,36,36,]),'RELID':([42,],[48,]),'FROM':([11,13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,48,49,51,55,59,72,75,76,77,78,80,90,100,],[22,37,37,37,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,37,37,56,37,37,37,37,37,-35,-33,37,-34,37,37,37,]),'VALUES':([13,16,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,44,46,49,51,55,59,71,72,75,76,77,78,80,83,90,100,],[38,38,38,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,45,-42,38,50,38,38,38,38,38,88,38,-35,-33,38,-34,38,95,38,38,]),'CARDINALITY':([56,91,],[75,75,]),'DELETE':([0,1,4,12,13,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,46,49,51,55,59,72,75,76,77,78,80,90,100,],[11,11,-4,-3,40,40,-8,-6,-9,-7,-5,40,-52,-50,-47,-54,-41,-40,-49,-46,-45,-43,-55,-51,-39,-53,-48,-44,-42,40,40,40,40,40,40,40,-35,-33,40,-34,40,40,40,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'cardinality':([56,91,],[77,77,]),'association_end':([56,91,],[74,99,]),'attribute':([49,80,],[57,93,]),'value':([52,60,85,97,101,],[65,65,96,65,65,]),'statement_sequence':([0,],[1,]),'identifier_sequence':([46,51,90,100,],[53,61,98,104,]),'create_index_statement':([0,1,],[8,8,]),'attribute_sequence':([49,],[58,]),'delete_from_statement':([0,1,],[9,9,]),'create_rop_statement':([0,1,],[6,6,]),'create_table_statement':([0,1,],[10,10,]),'statement':([0,1,],[4,12,]),'identifier':([13,16,22,41,46,49,51,55,59,72,77,80,90,100,],[39,43,44,47,54,59,54,73,81,89,92,59,54,54,]),'value_sequence':([52,60,97,101,],[66,82,102,105,]),'translation_unit':([0,],[5,]),'insert_into_statement':([0,1,],[7,7,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit","S'",1,None,None,None),
+  ('translation_unit -> <empty>','translation_unit',0,'p_empty_translation_unit','load.py',1927),
+  ('translation_unit -> statement_sequence','translation_unit',1,'p_translation_unit','load.py',1931),
+  ('statement_sequence -> statement_sequence statement','statement_sequence',2,'p_statement_sequence','load.py',1935),
+  ('statement_sequence -> statement','statement_sequence',1,'p_statement_sequence_endpoint','load.py',1940),
+  ('statement -> create_table_statement SEMICOLON','statement',2,'p_statement','load.py',1945),
+  ('statement -> insert_into_statement SEMICOLON','statement',2,'p_statement','load.py',1946),
+  ('statement -> delete_from_statement SEMICOLON','statement',2,'p_statement','load.py',1947),
+  ('statement -> create_rop_statement SEMICOLON','statement',2,'p_statement','load.py',1948),
+  ('statement -> create_index_statement SEMICOLON','statement',2,'p_statement','load.py',1949),
+  ('create_table_statement -> CREATE TABLE identifier LPAREN attribute_sequence RPAREN','create_table_statement',6,'p_create_table_statement','load.py',1957),
+  ('attribute_sequence -> <empty>','attribute_sequence',0,'p_empty_attribute_sequence','load.py',1961),
+  ('attribute_sequence -> attribute','attribute_sequence',1,'p_attribute_sequence_endpoint','load.py',1965),
+  ('attribute_sequence -> attribute_sequence COMMA attribute','attribute_sequence',3,'p_attribute_sequence','load.py',1969),
+  ('attribute -> identifier identifier','attribute',2,'p_attribute','load.py',1974),
+  ('insert_into_statement -> INSERT INTO identifier VALUES LPAREN value_sequence RPAREN','insert_into_statement',7,'p_ordered_insert_into_statement','load.py',1979),
+  ('insert_into_statement -> INSERT INTO identifier LPAREN identifier_sequence RPAREN VALUES LPAREN value_sequence RPAREN','insert_into_statement',10,'p_named_insert_into_statement','load.py',1985),
+  ('delete_from_statement -> DELETE FROM identifier VALUES LPAREN value_sequence RPAREN','delete_from_statement',7,'p_ordered_delete_from_statement','load.py',1991),
+  ('delete_from_statement -> DELETE FROM identifier LPAREN identifier_sequence RPAREN VALUES LPAREN value_sequence RPAREN','delete_from_statement',10,'p_named_delete_from_statement','load.py',1997),
+  ('value_sequence -> <empty>','value_sequence',0,'p_empty_value_sequence','load.py',2002),
+  ('value_sequence -> value_sequence COMMA value','value_sequence',3,'p_value_sequence','load.py',2006),
+  ('value_sequence -> value','value_sequence',1,'p_value_sequence_endpoint','load.py',2011),
+  ('value -> FRACTION','value',1,'p_value','load.py',2016),
+  ('value -> NUMBER','value',1,'p_value','load.py',2017),
+  ('value -> STRING','value',1,'p_value','load.py',2018),
+  ('value -> GUID','value',1,'p_value','load.py',2019),
+  ('value -> TRUE','value',1,'p_value','load.py',2020),
+  ('value -> FALSE','value',1,'p_value','load.py',2021),
+  ('value -> MINUS FRACTION','value',2,'p_negative_value','load.py',2027),
+  ('value -> MINUS NUMBER','value',2,'p_negative_value','load.py',2028),
+  ('create_rop_statement -> CREATE ROP REF_ID RELID FROM association_end TO association_end','create_rop_statement',8,'p_create_rop_statement','load.py',2033),
+  ('association_end -> cardinality identifier LPAREN identifier_sequence RPAREN','association_end',5,'p_association_end','load.py',2040),
+  ('association_end -> cardinality identifier LPAREN identifier_sequence RPAREN PHRASE STRING','association_end',7,'p_phrased_association_end','load.py',2044),
+  ('cardinality -> NUMBER','cardinality',1,'p_cardinality_1','load.py',2048),
+  ('cardinality -> ID','cardinality',1,'p_cardinality_many','load.py',2055),
+  ('cardinality -> CARDINALITY','cardinality',1,'p_cardinality_01','load.py',2062),
+  ('identifier_sequence -> <empty>','identifier_sequence',0,'p_empty_identifier_sequence','load.py',2066),
+  ('identifier_sequence -> identifier_sequence COMMA identifier','identifier_sequence',3,'p_identifier_sequence','load.py',2070),
+  ('identifier_sequence -> identifier','identifier_sequence',1,'p_identifier_sequence_endpoint','load.py',2075),
+  ('identifier -> ID','identifier',1,'p_identifier','load.py',2080),
+  ('identifier -> CREATE','identifier',1,'p_identifier','load.py',2081),
+  ('identifier -> INSERT','identifier',1,'p_identifier','load.py',2082),
+  ('identifier -> DELETE','identifier',1,'p_identifier','load.py',2083),
+  ('identifier -> INTO','identifier',1,'p_identifier','load.py',2084),
+  ('identifier -> VALUES','identifier',1,'p_identifier','load.py',2085),
+  ('identifier -> TABLE','identifier',1,'p_identifier','load.py',2086),
+  ('identifier -> ROP','identifier',1,'p_identifier','load.py',2087),
+  ('identifier -> REF_ID','identifier',1,'p_identifier','load.py',2088),
+  ('identifier -> FROM','identifier',1,'p_identifier','load.py',2089),
+  ('identifier -> TO','identifier',1,'p_identifier','load.py',2090),
+  ('identifier -> PHRASE','identifier',1,'p_identifier','load.py',2091),
+  ('identifier -> UNIQUE','identifier',1,'p_identifier','load.py',2092),
+  ('identifier -> INDEX','identifier',1,'p_identifier','load.py',2093),
+  ('identifier -> ON','identifier',1,'p_identifier','load.py',2094),
+  ('identifier -> TRUE','identifier',1,'p_identifier','load.py',2095),
+  ('identifier -> FALSE','identifier',1,'p_identifier','load.py',2096),
+  ('create_index_statement -> CREATE UNIQUE INDEX identifier ON identifier LPAREN identifier_sequence RPAREN','create_index_statement',9,'p_create_index_statement','load.py',2102),
+]
@@ -0,0 +1,572 @@
+# encoding: utf-8
+# Copyright (C) 2017 John Törnblom
+#
+# This file is part of pyxtuml.
+#
+# pyxtuml is free software: you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, either
+# version 3 of the License, or (at your option) any later version.
+#
+# pyxtuml is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with pyxtuml. If not, see <http://www.gnu.org/licenses/>.
+'''
+Persist xtuml models to, and load them from, a compact binary format.
+
+A binary file starts with a magic string and a format version, followed by
+a string table, the schema (classes, attributes, unique identifiers and
+associations), the instances of each class stored column by column, and
+optionally the links between instances. All integers are little-endian.
+Unique ids are stored as 16-byte values, and strings as indices into the
+string table.
+'''
+
+import binascii
+import logging
+import numbers
+import struct
+
+import xtuml
+
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b'PYXTUMLB'
+VERSION = 1
+
+# flags stored in the header
+_LINKS = 0x01
+
+# encodings of instance columns
+_NONE = b'N'
+_UNIQUE_ID = b'U'
+_INT64 = b'q'
+_REAL = b'd'
+_BOOLEAN = b'b'
+_STRING = b's'
+_VALUES = b'v'
+
+# tags of individually encoded values
+_TAG_NONE = b'n'
+_TAG_TRUE = b't'
+_TAG_FALSE = b'f'
+_TAG_INTEGER = b'i'
+_TAG_REAL = b'r'
+_TAG_STRING = b's'
+
+# types of text. On python 2, the sql loader yields native strings encoded
+# in utf-8, but unicode strings may also be assigned to attributes.
+_text_types = (str, type(u''))
+
+
+def _encode_text(s):
+    '''
+    Encode a text string *s* in utf-8, unless it is already encoded.
+    '''
+    if isinstance(s, bytes):
+        return s
+    
+    return s.encode('utf-8')
+
+
+def _decode_text(data):
+    '''
+    Decode utf-8 encoded *data* into a native string, i.e. leave it encoded
+    on python 2.
+    '''
+    if bytes is str:
+        return bytes(data)
+
+    return data.decode('utf-8')
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_UUID_MAX = (1 << 128) - 1
+
+
+class BinaryFormatException(Exception):
+    '''
+    An exception that may be thrown while loading a model from a file that
+    is not in the binary format, or in a version of the format not supported.
+    '''
+    pass
+
+
+class _Writer(object):
+    '''
+    Accumulate binary data, and keep a table of the strings referred to.
+    '''
+
+    def __init__(self):
+        self.chunks = list()
+        self.strings = dict()
+
+    def uint(self, value):
+        self.chunks.append(struct.pack('<I', value))
+
+    def byte(self, value):
+        self.chunks.append(struct.pack('<B', value))
+
+    def blob(self, data):
+        self.uint(len(data))
+        self.chunks.append(data)
+
+    def text(self, s):
+        self.blob(_encode_text(s))
+
+    def texts(self, seq):
+        self.uint(len(seq))
+        for s in seq:
+            self.text(s)
+
+    def string_index(self, s):
+        idx = self.strings.get(s)
+        if idx is None:
+            idx = self.strings[s] = len(self.strings)
+
+        return idx
+
+    def value(self, value):
+        if value is None:
+            self.chunks.append(_TAG_NONE)
+        elif value is True:
+            self.chunks.append(_TAG_TRUE)
+        elif value is False:
+            self.chunks.append(_TAG_FALSE)
+        elif isinstance(value, numbers.Integral):
+            self.chunks.append(_TAG_INTEGER)
+            self.text('%d' % value)
+        elif isinstance(value, float):
+            self.chunks.append(_TAG_REAL)
+            self.chunks.append(struct.pack('<d', value))
+        else:
+            self.chunks.append(_TAG_STRING)
+            self.uint(self.string_index(value))
+
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+
+class _Reader(object):
+    '''
+    Read binary data written by a *_Writer*.
+    '''
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+        self.strings = None
+
+    def read(self, size):
+        data = self.data[self.pos:self.pos + size]
+        if len(data) != size:
+            raise BinaryFormatException('unexpected end of file')
+
+        self.pos += size
+        return data
+
+    def uint(self):
+        return struct.unpack('<I', self.read(4))[0]
+
+    def byte(self):
+        return struct.unpack('<B', self.read(1))[0]
+
+    def blob(self):
+        return self.read(self.uint())
+
+    def text(self):
+        return _decode_text(self.blob())
+
+    def texts(self):
+        return [self.text() for _ in range(self.uint())]
+
+    def value(self):
+        tag = self.read(1)
+        if tag == _TAG_NONE:
+            return None
+        elif tag == _TAG_TRUE:
+            return True
+        elif tag == _TAG_FALSE:
+            return False
+        elif tag == _TAG_INTEGER:
+            return int(self.text())
+        elif tag == _TAG_REAL:
+            return struct.unpack('<d', self.read(8))[0]
+        elif tag == _TAG_STRING:
+            return self.strings[self.uint()]
+        else:
+            raise BinaryFormatException('unknown value tag %r' % tag)
+
+
+def _column_encoding(values, ty):
+    '''
+    Select an encoding for a column of *values* of an attribute of some type
+    *ty*. Typed encodings are used only when all values, except None, are of
+    the expected python type.
+    '''
+    types = set(type(value) for value in values)
+    types.discard(type(None))
+    if not types:
+        return _NONE
+
+    if bool not in types and all(issubclass(value_type, numbers.Integral)
+                                 for value_type in types):
+        values = [value for value in values if value is not None]
+        if (ty.upper() != 'UNIQUE_ID' and
+            _INT64_MIN <= min(values) and max(values) <= _INT64_MAX):
+            return _INT64
+
+        if 0 <= min(values) and max(values) <= _UUID_MAX:
+            return _UNIQUE_ID
+
+        return _VALUES
+
+    if all(value_type in _text_types for value_type in types):
+        return _STRING
+
+    if len(types) > 1:
+        return _VALUES
+
+    value_type = types.pop()
+    if value_type is bool:
+        return _BOOLEAN
+
+    if value_type is float:
+        return _REAL
+
+    return _VALUES
+
+
+def _write_column(writer, values, ty):
+    '''
+    Write a column of *values* of an attribute of some type *ty*.
+    '''
+    encoding = _column_encoding(values, ty)
+    writer.chunks.append(encoding)
+    if encoding == _NONE:
+        return
+
+    if encoding == _VALUES:
+        for value in values:
+            writer.value(value)
+        return
+
+    nulls = [value is None for value in values]
+    if any(nulls):
+        writer.byte(1)
+        writer.chunks.append(bytes(bytearray(nulls)))
+    else:
+        writer.byte(0)
+
+    count = len(values)
+    if encoding == _UNIQUE_ID:
+        digits = ''.join(['%032x' % (value or 0) for value in values])
+        writer.chunks.append(binascii.unhexlify(digits))
+
+    elif encoding == _INT64:
+        writer.chunks.append(struct.pack('<%dq' % count,
+                                         *[value or 0 for value in values]))
+    elif encoding == _REAL:
+        writer.chunks.append(struct.pack('<%dd' % count,
+                                         *[value or 0.0 for value in values]))
+    elif encoding == _BOOLEAN:
+        writer.chunks.append(bytes(bytearray([bool(value)
+                                              for value in values])))
+    elif encoding == _STRING:
+        index = writer.string_index
+        writer.chunks.append(struct.pack('<%dI' % count,
+                                         *[index(value or '')
+                                           for value in values]))
+
+
+def _read_column(reader, count):
+    '''
+    Read a column of *count* values.
+    '''
+    encoding = reader.read(1)
+    if encoding == _NONE:
+        return [None] * count
+
+    if encoding == _VALUES:
+        return [reader.value() for _ in range(count)]
+
+    nulls = None
+    if reader.byte():
+        nulls = bytearray(reader.read(count))
+
+    if encoding == _UNIQUE_ID:
+        digits = binascii.hexlify(reader.read(count * 16))
+        values = [int(digits[idx:idx + 32], 16)
+                  for idx in range(0, count * 32, 32)]
+    elif encoding == _INT64:
+        values = list(struct.unpack('<%dq' % count, reader.read(count * 8)))
+    elif encoding == _REAL:
+        values = list(struct.unpack('<%dd' % count, reader.read(count * 8)))
+    elif encoding == _BOOLEAN:
+        values = [bool(value) for value in bytearray(reader.read(count))]
+    elif encoding == _STRING:
+        strings = reader.strings
+        values = [strings[idx] for idx in
+                  struct.unpack('<%dI' % count, reader.read(count * 4))]
+    else:
+        raise BinaryFormatException('unknown column encoding %r' % encoding)
+
+    if nulls is not None:
+        values = [None if null else value
+                  for null, value in zip(nulls, values)]
+
+    return values
+
+
+def _write_schema(writer, metamodel):
+    metaclasses = list(metamodel.metaclasses.values())
+    writer.uint(len(metaclasses))
+    for metaclass in metaclasses:
+        writer.text(metaclass.kind)
+        writer.uint(len(metaclass.attributes))
+        for name, ty in metaclass.attributes:
+            writer.text(name)
+            writer.text(ty)
+
+        writer.uint(len(metaclass.indices))
+        for name, attributes in metaclass.indices.items():
+            writer.text(name)
+            writer.texts(attributes)
+
+    writer.uint(len(metamodel.associations))
+    for ass in metamodel.associations:
+        source_link = ass.source_link
+        target_link = ass.target_link
+        writer.text(ass.rel_id)
+        writer.text(source_link.kind)
+        writer.texts(ass.source_keys)
+        writer.byte(bool(source_link.many))
+        writer.byte(bool(source_link.conditional))
+        writer.text(target_link.phrase)
+        writer.text(target_link.kind)
+        writer.texts(ass.target_keys)
+        writer.byte(bool(target_link.many))
+        writer.byte(bool(target_link.conditional))
+        writer.text(source_link.phrase)
+        writer.byte(bool(ass.formalized))
+
+
+def _read_schema(reader, metamodel):
+    for _ in range(reader.uint()):
+        kind = reader.text()
+        attributes = [(reader.text(), reader.text())
+                      for _ in range(reader.uint())]
+        metamodel.define_class(kind, attributes)
+        for _ in range(reader.uint()):
+            name = reader.text()
+            metamodel.define_unique_identifier(kind, name, *reader.texts())
+
+    for _ in range(reader.uint()):
+        args = [reader.text(), reader.text(), reader.texts(),
+                bool(reader.byte()), bool(reader.byte()), reader.text(),
+                reader.text(), reader.texts(), bool(reader.byte()),
+                bool(reader.byte()), reader.text()]
+        ass = metamodel.define_association(*args)
+        if reader.byte():
+            ass.formalize()
+
+
+def _write_instances(writer, metamodel, links):
+    for metaclass in metamodel.metaclasses.values():
+        instances = list(metaclass.storage)
+        writer.uint(len(instances))
+        if not instances:
+            continue
+
+        # values of formalized referential attributes are given by links,
+        # otherwise they are needed to compute the links when loading
+        attributes = [(name, ty) for name, ty in metaclass.attributes
+                      if not links or
+                      name not in metaclass.referential_attributes]
+        writer.texts([name for name, _ in attributes])
+        for name, ty in attributes:
+            _write_column(writer, [getattr(inst, name) for inst in instances],
+                          ty)
+
+
+def _read_instances(reader, metamodel):
+    for metaclass in metamodel.metaclasses.values():
+        count = reader.uint()
+        if not count:
+            continue
+
+        if metaclass.compact and '__slots__' not in metaclass.clazz.__dict__:
+            metaclass._compact_class()
+
+        clazz = metaclass.clazz
+        slots = set(getattr(clazz, '__slots__', ()))
+        instances = [clazz() for _ in range(count)]
+        for name in reader.texts():
+            values = _read_column(reader, count)
+            if name in slots:
+                for inst, value in zip(instances, values):
+                    object.__setattr__(inst, name, value)
+            else:
+                for inst, value in zip(instances, values):
+                    inst.__dict__[name] = value
+
+        metaclass.storage = xtuml.OrderedSet(instances)
+        metaclass.drop_columns()
+
+
+def _write_links(writer, metamodel):
+    index = dict()
+    for metaclass in metamodel.metaclasses.values():
+        for idx, inst in enumerate(metaclass.storage):
+            index[inst] = idx
+
+    for metaclass in metamodel.metaclasses.values():
+        links = [link for link in metaclass.links.values() if link]
+        writer.uint(len(links))
+        for link in links:
+            writer.text(link.to_metaclass.kind)
+            writer.text(link.rel_id)
+            writer.text(link.phrase)
+            writer.byte(bool(link.conditional))
+            writer.byte(bool(link.many))
+            writer.texts(list(link.key_map.keys()))
+            writer.texts(list(link.key_map.values()))
+
+            sources = list()
+            counts = list()
+            targets = list()
+            for inst, others in link.items():
+                sources.append(index[inst])
+                counts.append(len(others))
+                targets.extend([index[other] for other in others])
+
+            writer.uint(len(sources))
+            writer.chunks.append(struct.pack('<%dI' % len(sources), *sources))
+            writer.chunks.append(struct.pack('<%dI' % len(counts), *counts))
+            writer.uint(len(targets))
+            writer.chunks.append(struct.pack('<%dI' % len(targets), *targets))
+
+
+def _read_links(reader, metamodel):
+    for metaclass in list(metamodel.metaclasses.values()):
+        storage = list(metaclass.storage)
+        for _ in range(reader.uint()):
+            to_metaclass = metamodel.find_metaclass(reader.text())
+            rel_id = reader.text()
+            phrase = reader.text()
+            conditional = bool(reader.byte())
+            many = bool(reader.byte())
+            key_map = dict(zip(reader.texts(), reader.texts()))
+
+            key = (to_metaclass.kind.upper(), rel_id, phrase)
+            link = metaclass.links.get(key)
+            if link is None:
+                link = metaclass.add_link(to_metaclass, rel_id, phrase,
+                                          conditional, many)
+                link.key_map = key_map
+
+            count = reader.uint()
+            sources = struct.unpack('<%dI' % count, reader.read(count * 4))
+            counts = struct.unpack('<%dI' % count, reader.read(count * 4))
+            count = reader.uint()
+            targets = struct.unpack('<%dI' % count, reader.read(count * 4))
+
+            to_storage = list(to_metaclass.storage)
+            pos = 0
+            for source, count in zip(sources, counts):
+                others = [to_storage[idx] for idx in targets[pos:pos + count]]
+                link[storage[source]] = xtuml.OrderedSet(others)
+                pos += count
+
+        metaclass.drop_referential_cache()
+
+
+def serialize_binary(metamodel, links=True):
+    '''
+    Serialize a *metamodel* to the binary format, and return the result as
+    bytes. Optionally, include the *links* between instances so that they
+    need not be computed from referential attributes when the model is
+    loaded.
+    '''
+    body = _Writer()
+    _write_schema(body, metamodel)
+    _write_instances(body, metamodel, links)
+    if links:
+        _write_links(body, metamodel)
+
+    strings = sorted(body.strings, key=body.strings.get)
+    strings = [_encode_text(s) for s in strings]
+    header = _Writer()
+    header.chunks.append(MAGIC)
+    header.uint(VERSION)
+    header.uint(_LINKS if links else 0)
+    header.uint(len(strings))
+    header.chunks.append(struct.pack('<%dI' % len(strings),
+                                     *[len(s) for s in strings]))
+    header.chunks.extend(strings)
+
+    return header.getvalue() + body.getvalue()
+
+
+def deserialize_binary(data, id_generator=None, compact=False):
+    '''
+    Create a metamodel from *data* in the binary format. Optionally, specify
+    an id generator used to obtain unique identifiers, and if instances shall
+    be stored in a *compact* form, see *xtuml.MetaModel*.
+    '''
+    if data[:len(MAGIC)] != MAGIC:
+        raise BinaryFormatException('not a binary xtuml model')
+
+    reader = _Reader(data, len(MAGIC))
+    version = reader.uint()
+    if version != VERSION:
+        raise BinaryFormatException('unsupported binary format version %d' %
+                                    version)
+    flags = reader.uint()
+    count = reader.uint()
+    lengths = struct.unpack('<%dI' % count, reader.read(count * 4))
+    strings = list()
+    for length in lengths:
+        strings.append(_decode_text(reader.read(length)))
+    reader.strings = strings
+
+    metamodel = xtuml.MetaModel(id_generator, compact)
+    _read_schema(reader, metamodel)
+    _read_instances(reader, metamodel)
+    if flags & _LINKS:
+        _read_links(reader, metamodel)
+    else:
+        xtuml.ModelLoader().populate_connections(metamodel)
+
+    return metamodel
+
+
+def persist_binary(metamodel, path, links=True):
+    '''
+    Persist a *metamodel*, i.e. its schema and instances, in the binary
+    format to a *path* on disk. Optionally, include the *links* between
+    instances so that they need not be computed when the model is loaded.
+
+    Usage example:
+
+    >>> xtuml.persist_binary(m, 'db.bin')
+    >>> m = xtuml.load_binary('db.bin')
+    '''
+    xtuml.release_mapped_file(path)
+    with open(path, 'wb') as f:
+        f.write(serialize_binary(metamodel, links))
+
+
+def load_binary(path, id_generator=None, compact=False):
+    '''
+    Load and return a metamodel previously persisted in the binary format to
+    a *path* on disk, see *persist_binary()*.
+    '''
+    with open(path, 'rb') as f:
+        return deserialize_binary(f.read(), id_generator, compact)
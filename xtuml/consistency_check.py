@@ -83,6 +83,39 @@ def pretty_unique_identifier(inst, identifier):
     return '%s(%s)' % (identifier, values)
 
 
+def check_null_identifiers(metaclass, inst):
+    '''
+    Check an instance for null-values in attributes that are part of an
+    identifier.
+    '''
+    res = 0
+    for name, ty in metaclass.attributes:
+        if name not in metaclass.identifying_attributes:
+            continue
+
+        value = getattr(inst, name)
+        isnull = value is None
+        isnull |= (ty == 'UNIQUE_ID' and not value)
+        if isnull:
+            res += 1 
+            logger.warning('%s.%s is part of an identifier and is null' 
+                           % (metaclass.kind, name))
+
+    return res
+
+
+def compute_index_key(metaclass, identifier, inst):
+    '''
+    Compute the key used to check an instance for uniqueness constraint
+    violations on an identifier.
+    '''
+    kwargs = dict()
+    for name in metaclass.indices[identifier]:
+        kwargs[name] = getattr(inst, name)
+
+    return frozenset(kwargs.items())
+
+
 def check_uniqueness_constraint(m, kind=None):
     '''
     Check the model for uniqueness constraint violations.
@@ -100,25 +133,11 @@ def check_uniqueness_constraint(m, kind=None):
                 
         for inst in metaclass.select_many():
             # Check for null-values
-            for name, ty in metaclass.attributes:
-                if name not in metaclass.identifying_attributes:
-                    continue
-                
-                value = getattr(inst, name)
-                isnull = value is None
-                isnull |= (ty == 'UNIQUE_ID' and not value)
-                if isnull:
-                    res += 1 
-                    logger.warning('%s.%s is part of an identifier and is null' 
-                                   % (metaclass.kind, name))
+            res += check_null_identifiers(metaclass, inst)
 
             # Check uniqueness
             for identifier in metaclass.indices:
-                kwargs = dict()
-                for name in metaclass.indices[identifier]:
-                    kwargs[name] = getattr(inst, name)
-
-                index_key = frozenset(kwargs.items())
+                index_key = compute_index_key(metaclass, identifier, inst)
                 if index_key in id_map[identifier]:
                     res += 1
                     id_string = pretty_unique_identifier(inst, identifier)
@@ -130,21 +149,31 @@ def check_uniqueness_constraint(m, kind=None):
     return res
 
 
+def check_instance_link(inst, link):
+    '''
+    Check an instance for integrity violations on an association in a
+    particular direction.
+    '''
+    q_set = list(link.navigate(inst))
+
+    if(len(q_set) < 1 and not link.conditional) or (
+      (len(q_set) > 1 and not link.many)):
+        logger.warning('integrity violation in '
+                       '%s --(%s)--> %s' % (pretty_from_link(inst, link),
+                                            link.rel_id,
+                                            pretty_to_link(inst, link)))
+        return 1
+
+    return 0
+
+
 def check_link_integrity(m, link):
     '''
     Check the model for integrity violations on an association in a particular direction.
     '''
     res = 0
     for inst in link.from_metaclass.select_many():
-        q_set = list(link.navigate(inst))
-
-        if(len(q_set) < 1 and not link.conditional) or (
-          (len(q_set) > 1 and not link.many)):
-            res += 1
-            logger.warning('integrity violation in '
-                           '%s --(%s)--> %s' % (pretty_from_link(inst, link),
-                                                link.rel_id,
-                                                pretty_to_link(inst, link)))
+        res += check_instance_link(inst, link)
     
     return res
 
@@ -182,6 +211,161 @@ def check_association_integrity(m, rel_id=None):
     return res
 
 
+class IncrementalChecker(object):
+    '''
+    Check a model for association and uniqueness constraint violations
+    incrementally. The entire model is checked once when the checker is
+    created, after which changes are recorded in a journal on the metamodel.
+    Each update only re-validates instances and links affected by the
+    recorded changes, and the number of *violations* is kept equal to what
+    check_association_integrity() and check_uniqueness_constraint() report.
+    '''
+    metamodel = None
+    links = None
+    link_violations = None
+    null_violations = None
+    duplicates = 0
+    id_maps = None
+    index_keys = None
+    
+    def __init__(self, m):
+        self.metamodel = m
+        self.reset()
+
+    @property
+    def violations(self):
+        '''
+        Obtain the number of violations found in the model.
+        '''
+        return (len(self.link_violations) + sum(self.null_violations.values())
+                + self.duplicates)
+
+    def reset(self):
+        '''
+        Check the entire model, and start recording changes.
+        '''
+        self.links = list()
+        for ass in self.metamodel.associations:
+            self.links.append(ass.source_link)
+            self.links.append(ass.target_link)
+
+        self.link_violations = set()
+        self.null_violations = dict()
+        self.duplicates = 0
+        self.id_maps = dict()
+        self.index_keys = dict()
+        self.metamodel.journal = list()
+        
+        for metaclass in self.metamodel.metaclasses.values():
+            for inst in metaclass.storage:
+                self.check_instance(metaclass, inst)
+
+        for link in self.links:
+            for inst in link.from_metaclass.storage:
+                self.check_link(inst, link)
+
+    def update(self):
+        '''
+        Re-validate instances and links affected by changes recorded in the
+        journal since the previous update.
+        '''
+        if len(self.links) != 2 * len(self.metamodel.associations):
+            return self.reset()
+        
+        journal = self.metamodel.journal
+        self.metamodel.journal = list()
+        
+        # links are dictionaries, and thus keyed by their identity
+        links = dict()
+        instances = set()
+        for entry in journal:
+            if entry[0] == 'link':
+                _, link, inst = entry
+                links[(id(link), inst)] = link
+            else:
+                inst = entry[1]
+                
+            instances.add(inst)
+            if entry[0] in ('create', 'delete'):
+                for link in xtuml.get_metaclass(inst).links.values():
+                    links[(id(link), inst)] = link
+
+        # referential attributes that are part of an identifier are affected
+        # by changes to instances they refer to.
+        stack = list(instances)
+        while stack:
+            inst = stack.pop()
+            for link in xtuml.get_metaclass(inst).links.values():
+                metaclass = link.to_metaclass
+                if not (metaclass.referential_attributes &
+                        metaclass.identifying_attributes):
+                    continue
+                
+                for other in link.navigate(inst):
+                    if other not in instances:
+                        instances.add(other)
+                        stack.append(other)
+
+        checked_links = set(id(link) for link in self.links)
+        for key, link in links.items():
+            if key[0] not in checked_links:
+                continue
+            
+            self.link_violations.discard(key)
+            inst = key[1]
+            if inst in link.from_metaclass.storage:
+                self.check_link(inst, link)
+            
+        for inst in instances:
+            self.uncheck_instance(inst)
+            metaclass = xtuml.get_metaclass(inst)
+            if inst in metaclass.storage:
+                self.check_instance(metaclass, inst)
+
+    def check_link(self, inst, link):
+        '''
+        Check an instance for integrity violations on a link.
+        '''
+        if check_instance_link(inst, link):
+            self.link_violations.add((id(link), inst))
+
+    def check_instance(self, metaclass, inst):
+        '''
+        Check an instance for uniqueness constraint violations.
+        '''
+        res = check_null_identifiers(metaclass, inst)
+        if res:
+            self.null_violations[inst] = res
+
+        index_keys = list()
+        for identifier in metaclass.indices:
+            id_map = self.id_maps.setdefault((metaclass, identifier), dict())
+            index_key = compute_index_key(metaclass, identifier, inst)
+            if id_map.get(index_key, 0):
+                self.duplicates += 1
+                id_string = pretty_unique_identifier(inst, identifier)
+                logger.warning('uniqueness constraint violation in %s, %s' 
+                               % (metaclass.kind, id_string))
+
+            id_map[index_key] = id_map.get(index_key, 0) + 1
+            index_keys.append((id_map, index_key))
+
+        self.index_keys[inst] = index_keys
+
+    def uncheck_instance(self, inst):
+        '''
+        Forget about previous checks of an instance for uniqueness
+        constraint violations.
+        '''
+        self.null_violations.pop(inst, None)
+        for id_map, index_key in self.index_keys.pop(inst, []):
+            id_map[index_key] -= 1
+            if id_map[index_key]:
+                self.duplicates -= 1
+            else:
+                del id_map[index_key]
+
+
 def main(args):
     parser = optparse.OptionParser(usage="%prog [options] <sql_file> [another_sql_file...].",
                                    version=xtuml.version.complete_string,
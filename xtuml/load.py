@@ -21,9 +21,18 @@ Loading support for xtUML models (based on sql).
 '''
 
 import uuid
+import collections
+import hashlib
+import itertools
 import logging
+import marshal
+import mmap
 import os
 import re
+import sys
+import tempfile
+import time
+import weakref
 
 from ply import lex
 from ply import yacc
@@ -56,41 +65,91 @@ def guess_type_name(value):
         return 'UNIQUE_ID'
 
 
+def _deserialize_boolean(value):
+    if value.isdigit():
+        return bool(int(value))
+    elif value.upper() == 'FALSE':
+        return False
+    elif value.upper() == 'TRUE':
+        return True
+    else:
+        return None
+
+
+def _deserialize_guid(value):
+    '''
+    Deserialize a quoted GUID literal into an integer. Literals in the
+    canonical form are converted directly from hex, others are left to the
+    uuid module.
+    '''
+    digits = value[1:-1].replace('-', '')
+    if len(digits) == 32:
+        return int(digits, 16)
+    else:
+        return uuid.UUID(value[1:-1]).int
+
+
+def _deserialize_integer(value):
+    if '"' in value:
+        return _deserialize_guid(value)
+    else:
+        return int(value)
+
+
+def _deserialize_string(value):
+    return value[1:-1].replace("''", "'")
+
+
+_deserializers = {
+    'BOOLEAN': _deserialize_boolean,
+    'INTEGER': _deserialize_integer,
+    'REAL': float,
+    'STRING': _deserialize_string,
+    'UNIQUE_ID': _deserialize_integer
+}
+
+
+def deserializer(ty):
+    '''
+    Obtain a function that deserializes values of some type, or None if the
+    type is unknown.
+    '''
+    return _deserializers.get(ty.upper())
+
+
 def deserialize_value(ty, value):
     '''
     Deserialize a value of some type
     '''
-    uty = ty.upper()
-    
-    if uty == 'BOOLEAN':
-        if value.isdigit():
-            return bool(int(value))
-        elif value.upper() == 'FALSE':
-            return False
-        elif value.upper() == 'TRUE':
-            return True
-        else:
-            return None
+    fn = _deserializers.get(ty.upper())
+    if fn is not None:
+        return fn(value)
+
     
-    elif uty == 'INTEGER': 
-        if '"' in value:
-            return uuid.UUID(value[1:-1]).int
-        else:
-            return int(value)
+def kind_filter(kinds=None, exclude_kinds=None):
+    '''
+    Create a predicate that accepts the kind of a class if it is one of
+    *kinds*, or if no kinds are given, and it is not one of *exclude_kinds*.
+    Kinds are case insensitive. None is returned if all kinds are accepted.
+    '''
+    if kinds is None and not exclude_kinds:
+        return None
     
-    elif uty == 'REAL': 
-        return float(value)
+    if kinds is not None:
+        kinds = frozenset(kind.upper() for kind in kinds)
+    exclude_kinds = frozenset(kind.upper() for kind in exclude_kinds or ())
+    accepted = dict()
     
-    elif uty == 'STRING': 
-        return value[1:-1].replace("''", "'")
+    def accept(kind):
+        if kind not in accepted:
+            ukind = kind.upper()
+            accepted[kind] = ((kinds is None or ukind in kinds) and
+                              ukind not in exclude_kinds)
+        return accepted[kind]
     
-    elif uty == 'UNIQUE_ID': 
-        if '"' in value:
-            return uuid.UUID(value[1:-1]).int
-        else:
-            return int(value)
+    return accept
+
 
-    
 class ParsingException(Exception):
     '''
     An exception that may be thrown while loading (and parsing) a metamodel.
@@ -98,6 +157,80 @@ class ParsingException(Exception):
     pass
 
 
+class DeferredString(object):
+    '''
+    A string literal located in some *data*, e.g. a memory-mapped file, that
+    is decoded when first needed rather than when it is scanned. The literal,
+    including its quotes, spans from *start* to *end*.
+    '''
+    __slots__ = ('data', 'start', 'end')
+    
+    def __init__(self, data, start, end):
+        self.data = data
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return 'DeferredString(%d bytes)' % (self.end - self.start)
+
+    def __str__(self):
+        return self.text()
+    
+    def text(self):
+        '''
+        Decode the literal, including its quotes.
+        '''
+        return self.data[self.start:self.end].decode('utf-8')
+    
+    def materialize(self):
+        '''
+        Decode and deserialize the literal into a string.
+        '''
+        return _deserialize_string(self.text())
+
+
+class MappedFile(object):
+    '''
+    The *data* of a file on disk mapped into memory, see
+    *ModelLoader.mapped_input()*. Deferred string values refer to the file by
+    slicing the mapped file rather than the memory map itself, so that the
+    content may be copied into memory and the map closed before the file is
+    rewritten, see *release_mapped_file()*.
+    '''
+    __slots__ = ('data', '__weakref__')
+    
+    def __init__(self, data):
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data[key]
+    
+    def release(self):
+        '''
+        Copy the mapped data into memory, and close the map.
+        '''
+        data = self.data
+        if isinstance(data, mmap.mmap):
+            self.data = data[:]
+            data.close()
+
+
+# files currently mapped into memory, keyed by their real path
+_mapped_files = dict()
+
+
+def release_mapped_file(path):
+    '''
+    Copy the content of a file at some *path* on disk into memory, if the file
+    is mapped into memory, and close the map. Writing to a file while it is
+    mapped may crash the python process when the mapped content is accessed,
+    so the persist functions release a file before opening it for writing.
+    '''
+    mapped_files = _mapped_files.pop(os.path.realpath(path), None)
+    for mapped_file in list(mapped_files or ()):
+        mapped_file.release()
+
+
 class Stmt(object):
     offset = None
     lineno = None
@@ -112,6 +245,14 @@ class CreateInstanceStmt(Stmt):
         self.names = names
 
 
+class DeleteInstanceStmt(Stmt):
+    
+    def __init__(self, kind, values, names):
+        self.kind = kind
+        self.values = values
+        self.names = names
+
+
 class CreateClassStmt(Stmt):
     
     def __init__(self, kind, attributes):
@@ -142,6 +283,670 @@ class CreateUniqueStmt(Stmt):
         self.attributes = attributes
 
 
+def _case_insensitive(keyword):
+    '''
+    Create a regular expression that matches a *keyword* regardless of its
+    case.
+    '''
+    return ''.join('[%s%s]' % (c.upper(), c.lower()) for c in keyword)
+
+
+_space = r'[ \t\r\x0c\n]'
+
+_value = (r'-?\d+\.\d+(?![\w.])|-?[0-9]+(?![\w.])|'
+          r'\'(?:\'\'|[^\'])*\'|\"(?:[^\"\\\n]|\\.)*?\"|'
+          r'(?:%s|%s)(?!\w)' % (_case_insensitive('TRUE'),
+                                _case_insensitive('FALSE')))
+
+
+# data scanned as bytes rather than as text, see *StatementParser*. On
+# python 2, bytes are the same type as text.
+if bytes is str:
+    _binary_types = (mmap.mmap, bytearray)
+else:
+    _binary_types = (mmap.mmap, bytearray, bytes)
+
+
+class StatementParser(object):
+    '''
+    A hand-written parser for the sql dialect accepted by the *ModelLoader*.
+    
+    The parser is based on a regular expression scanner, and produces the
+    same statements and error messages as the PLY-based parser. INSERT INTO
+    statements with positional values, the bulk of persisted models, are
+    matched by a single regular expression rather than token by token.
+    
+    The *data* may also be bytes, or a buffer such as a memory-mapped file,
+    which is scanned without being decoded as a whole. String values longer
+    than *defer_size* bytes are then left undecoded as *DeferredString*
+    objects.
+    
+    INSERT INTO statements on classes not accepted by the predicate *accept*,
+    see *kind_filter()*, are skipped without their values being scanned.
+    
+    After a parsing error, *truncated* indicates if the error may be caused by
+    the data ending within a statement rather than by invalid input.
+    '''
+    reserved = (
+        'CREATE',
+        'DELETE',
+        'FALSE',
+        'FROM',
+        'INDEX',
+        'INSERT',
+        'INTO',
+        'ON',
+        'PHRASE',
+        'REF_ID',
+        'ROP',
+        'TABLE',
+        'TO',
+        'TRUE',
+        'UNIQUE',
+        'VALUES'
+    )
+
+    # Token definitions, in the same order of precedence as the PLY lexer.
+    token_regexp = re.compile('|'.join([
+        r'(?P<comment>\-\-([^\n]*\n?))',
+        r'(?P<COMMA>,)',
+        r'(?P<FRACTION>(\d+)(\.\d+))',
+        r'(?P<RELID>R[0-9]+)',
+        r'(?P<CARDINALITY>(1C))',
+        r'(?P<ID>[A-Za-z_][\w_]*)',
+        r'(?P<LPAREN>\()',
+        r'(?P<MINUS>-)',
+        r'(?P<NUMBER>[0-9]+)',
+        r'(?P<RPAREN>\))',
+        r'(?P<SEMICOLON>;)',
+        r'(?P<STRING>\'((\'\')|[^\'])*\')',
+        r'(?P<GUID>\"([^\\\n]|(\\.))*?\")',
+        r'(?P<newline>\n+)',
+    ]))
+    
+    ignore = ' \t\r\x0c'
+    
+    space_regexp = re.compile(r'(?:%s+|\-\-[^\n]*\n?)*' % _space)
+
+    value_regexp = re.compile(_value)
+    
+    insert_regexp = re.compile(r'%s%s+%s%s+([A-Za-z_]\w*)%s+%s%s*\(%s*'
+                               r'((?:%s)(?:%s*,%s*(?:%s))*)%s*\)%s*;' % (
+                                   _case_insensitive('INSERT'), _space,
+                                   _case_insensitive('INTO'), _space, _space,
+                                   _case_insensitive('VALUES'), _space, _space,
+                                   _value, _space, _space, _value, _space,
+                                   _space))
+    
+    identifier_types = reserved + ('ID',)
+    value_types = ('FRACTION', 'NUMBER', 'STRING', 'GUID', 'TRUE', 'FALSE')
+    
+    data = None
+    source = None
+    filename = None
+    tokens = None
+    binary = False
+    defer_size = 64
+    accept = None
+    pos = 0
+    truncated = False
+    
+    def __init__(self, data, filename='<string>', lineno=1, offset=0,
+                 accept=None, source=None):
+        '''
+        Create a parser for some *data*. When the data is a part of a larger
+        input, *lineno* and *offset* locate the data within the input.
+        Deferred string values refer to the data through *source*, if given,
+        e.g. a *MappedFile*.
+        '''
+        self.data = data
+        self.source = source if source is not None else data
+        self.filename = filename
+        self.offset = offset
+        self.accept = accept
+        self._identifiers = dict()
+        self._first_lineno = lineno
+        self._lineno = lineno
+        self._lineno_pos = 0
+        if isinstance(data, _binary_types):
+            self.binary = True
+            self.ignore = bytearray(self.ignore.encode('ascii'))
+            for name in ('token_regexp', 'space_regexp', 'value_regexp',
+                         'insert_regexp'):
+                regexp = getattr(self, name)
+                setattr(self, name, re.compile(regexp.pattern.encode('ascii')))
+        
+    def lineno(self, pos):
+        '''
+        Obtain the line number at some position in the data.
+        '''
+        if pos < self._lineno_pos:
+            self._lineno = self._first_lineno
+            self._lineno_pos = 0
+            
+        if self.binary:
+            self._lineno += self.data[self._lineno_pos:pos].count(b'\n')
+        else:
+            self._lineno += self.data.count('\n', self._lineno_pos, pos)
+        self._lineno_pos = pos
+        return self._lineno
+
+    def is_identifier(self, value):
+        '''
+        Determine if a *value* matched by a regular expression would be
+        tokenized as an identifier (rather than e.g. a RELID).
+        '''
+        if value not in self._identifiers:
+            m = StatementParser.token_regexp.match(value)
+            self._identifiers[value] = (m.end() == len(value) and
+                                        m.lastgroup == 'ID')
+            
+        return self._identifiers[value]
+        
+    def parse(self):
+        '''
+        Parse the data, and return a list of statements.
+        '''
+        return list(self.iterparse())
+    
+    def iterparse(self, complete=True):
+        '''
+        Parse the data, and yield statements one at a time. The position in
+        the data following the last statement is available as *pos*.
+        
+        If the data is not *complete*, i.e. more data may follow, parsing
+        stops without errors at the first statement that cannot be parsed
+        because the data ends within it, see *truncated*. Other errors are
+        raised at once.
+        '''
+        data = self.data
+        length = len(data)
+        insert_regexp = self.insert_regexp
+        space_regexp = self.space_regexp
+        binary = self.binary
+        accept = self.accept
+        findall = self.value_regexp.findall
+        
+        pos = space_regexp.match(data, self.pos).end()
+        while pos < length:
+            m = insert_regexp.match(data, pos)
+            kind = m and m.group(1)
+            if kind and binary:
+                kind = kind.decode('utf-8')
+                
+            if kind and self.is_identifier(kind):
+                if accept is not None and not accept(kind):
+                    self.pos = pos = m.end()
+                    pos = space_regexp.match(data, pos).end()
+                    continue
+                
+                if binary:
+                    values = self.scan_values(m.start(2), m.end(2))
+                else:
+                    values = findall(m.group(2))
+                stmt = CreateInstanceStmt(kind, values, None)
+                stmt.offset = pos + self.offset
+                stmt.lineno = self.lineno(pos)
+                stmt.filename = self.filename
+                pos = m.end()
+            else:
+                self.tokens = self.tokenize(pos)
+                self.truncated = False
+                try:
+                    stmt, pos = self.parse_statement()
+                except ParsingException:
+                    if complete or not self.truncated:
+                        raise
+                    return
+
+                if (accept is not None and
+                    isinstance(stmt, (CreateInstanceStmt,
+                                      DeleteInstanceStmt)) and
+                    not accept(stmt.kind)):
+                    self.pos = pos
+                    pos = space_regexp.match(data, pos).end()
+                    continue
+                
+            self.pos = pos
+            yield stmt
+            pos = space_regexp.match(data, pos).end()
+        
+        if complete:
+            self.pos = pos
+
+    def scan_values(self, start, end):
+        '''
+        Scan a comma-separated sequence of values located between *start* and
+        *end* in binary data. Long string values are deferred.
+        '''
+        data = self.data
+        source = self.source
+        defer_size = self.defer_size
+        values = list()
+        for m in self.value_regexp.finditer(data, start, end):
+            start, end = m.span()
+            if end - start > defer_size and data[start:start + 1] == b"'":
+                values.append(DeferredString(source, start, end))
+            else:
+                values.append(m.group().decode('utf-8'))
+
+        return values
+    
+    def tokenize(self, pos):
+        '''
+        Tokenize the input from some position, and yield tokens as tuples
+        (type, value, position).
+        '''
+        data = self.data
+        length = len(data)
+        while pos < length:
+            if data[pos] in self.ignore:
+                pos += 1
+                continue
+            
+            m = self.token_regexp.match(data, pos)
+            if m is None:
+                char = data[pos:pos + 1]
+                if self.binary:
+                    char = char.decode('utf-8', 'replace')
+                    newline = b'\n'
+                else:
+                    newline = '\n'
+                # the last character, e.g. the point of a fraction, or an
+                # unterminated string or guid may be completed by more data
+                self.truncated = (pos + 1 == length or char == "'" or
+                                  char == '"' and data.find(newline, pos) < 0)
+                raise ParsingException("illegal character '%s' at %s:%d" % (
+                                       char, self.filename, self.lineno(pos)))
+            
+            ty = m.lastgroup
+            value = m.group(ty)
+            if self.binary:
+                value = value.decode('utf-8')
+            if ty == 'ID' and value.upper() in self.reserved:
+                ty = value.upper()
+
+            if ty not in ('comment', 'newline'):
+                yield ty, value, pos
+            
+            pos = m.end()
+
+    def next(self):
+        '''
+        Consume and return the next token.
+        '''
+        token = next(self.tokens, None)
+        if token is None:
+            self.truncated = True
+            raise ParsingException("unknown error")
+
+        return token
+
+    def push(self, token):
+        '''
+        Put back a *token* previously consumed.
+        '''
+        self.tokens = itertools.chain([token], self.tokens)
+        
+    def error(self, token):
+        ty, value, pos = token
+        # a token that extends to the end of the data may be incomplete
+        end = self.token_regexp.match(self.data, pos).end()
+        self.truncated = end == len(self.data)
+        raise ParsingException("illegal token %s (%s) at %s:%d" % (ty, value,
+                               self.filename, self.lineno(pos)))
+    
+    def expect(self, *types):
+        '''
+        Consume the next token, and raise an exception unless it is of one
+        of the given *types*.
+        '''
+        token = self.next()
+        if token[0] not in types:
+            self.error(token)
+
+        return token
+
+    def parse_statement(self):
+        '''
+        Parse a statement, and return it along with the position in the input
+        that follows it.
+        '''
+        token = self.expect('CREATE', 'INSERT', 'DELETE')
+        if token[0] == 'INSERT':
+            stmt = self.parse_insert_into()
+        elif token[0] == 'DELETE':
+            stmt = self.parse_delete_from()
+        else:
+            ty = self.expect('TABLE', 'ROP', 'UNIQUE')[0]
+            if ty == 'TABLE':
+                stmt = self.parse_create_table()
+            elif ty == 'ROP':
+                stmt = self.parse_create_rop()
+            else:
+                stmt = self.parse_create_index()
+
+        semicolon = self.expect('SEMICOLON')
+        stmt.offset = token[2] + self.offset
+        stmt.lineno = self.lineno(token[2])
+        stmt.filename = self.filename
+        return stmt, semicolon[2] + 1
+
+    def parse_sequence(self, fn):
+        '''
+        Parse a comma-separated sequence enclosed in parentheses, where each
+        item is parsed by *fn*.
+        '''
+        self.expect('LPAREN')
+        res = list()
+        token = self.next()
+        if token[0] not in ('COMMA', 'RPAREN'):
+            res.append(fn(token))
+            token = self.next()
+
+        while token[0] == 'COMMA':
+            res.append(fn(self.next()))
+            token = self.next()
+        
+        if token[0] != 'RPAREN':
+            self.error(token)
+            
+        return res
+
+    def parse_identifier(self, token):
+        if token[0] not in self.identifier_types:
+            self.error(token)
+
+        return token[1]
+
+    def parse_attribute(self, token):
+        return (self.parse_identifier(token),
+                self.parse_identifier(self.next()))
+
+    def parse_value(self, token):
+        if token[0] == 'MINUS':
+            return token[1] + self.expect('FRACTION', 'NUMBER')[1]
+        
+        if token[0] not in self.value_types:
+            self.error(token)
+
+        return token[1]
+
+    def parse_create_table(self):
+        kind = self.parse_identifier(self.next())
+        attributes = self.parse_sequence(self.parse_attribute)
+        return CreateClassStmt(kind, attributes)
+
+    def parse_insert_into(self):
+        self.expect('INTO')
+        return self.parse_instance(CreateInstanceStmt)
+
+    def parse_delete_from(self):
+        self.expect('FROM')
+        return self.parse_instance(DeleteInstanceStmt)
+
+    def parse_instance(self, cls):
+        kind = self.parse_identifier(self.next())
+        token = self.expect('VALUES', 'LPAREN')
+        if token[0] == 'VALUES':
+            values = self.parse_sequence(self.parse_value)
+            return cls(kind, values, None)
+
+        self.push(token)
+        names = self.parse_sequence(self.parse_identifier)
+        self.expect('VALUES')
+        values = self.parse_sequence(self.parse_value)
+        return cls(kind, values, names)
+
+    def parse_cardinality(self):
+        ty, value, pos = self.expect('NUMBER', 'ID', 'CARDINALITY')
+        
+        # the PLY-based parser checks the cardinality when the identifier
+        # that follows it has been read.
+        token = self.next()
+        self.parse_identifier(token)
+        self.push(token)
+        
+        if ((ty == 'NUMBER' and value != '1') or
+            (ty == 'ID' and value not in ['M', 'MC'])):
+            raise ParsingException("illegal cardinality (%s) at %s:%d" % (value,
+                                   self.filename, self.lineno(pos)))
+        return value
+
+    def parse_association_end(self):
+        cardinality = self.parse_cardinality()
+        kind = self.parse_identifier(self.next())
+        keys = self.parse_sequence(self.parse_identifier)
+        token = self.next()
+        if token[0] == 'PHRASE':
+            phrase = self.expect('STRING')[1][1:-1]
+        else:
+            phrase = ''
+            self.push(token)
+
+        return (kind, cardinality, keys, phrase)
+
+    def parse_create_rop(self):
+        self.expect('REF_ID')
+        args = [self.expect('RELID')[1]]
+        self.expect('FROM')
+        args.extend(self.parse_association_end())
+        self.expect('TO')
+        args.extend(self.parse_association_end())
+        return CreateAssociationStmt(*args)
+
+    def parse_create_index(self):
+        self.expect('INDEX')
+        name = self.parse_identifier(self.next())
+        self.expect('ON')
+        kind = self.parse_identifier(self.next())
+        attributes = self.parse_sequence(self.parse_identifier)
+        return CreateUniqueStmt(kind, name, attributes)
+
+
+def encode_statement(stmt):
+    '''
+    Encode a statement as a tuple of builtin types that may be marshalled.
+    '''
+    if isinstance(stmt, CreateInstanceStmt):
+        args = ('I', stmt.kind, stmt.values, stmt.names)
+    elif isinstance(stmt, DeleteInstanceStmt):
+        args = ('D', stmt.kind, stmt.values, stmt.names)
+    elif isinstance(stmt, CreateClassStmt):
+        args = ('C', stmt.kind, stmt.attributes)
+    elif isinstance(stmt, CreateAssociationStmt):
+        args = ('A', stmt.rel_id, stmt.source_kind, stmt.source_cardinality,
+                stmt.source_keys, stmt.source_phrase, stmt.target_kind,
+                stmt.target_cardinality, stmt.target_keys, stmt.target_phrase)
+    else:
+        args = ('U', stmt.kind, stmt.name, stmt.attributes)
+        
+    return (stmt.offset, stmt.lineno) + args
+
+
+_statement_types = {
+    'I': CreateInstanceStmt,
+    'D': DeleteInstanceStmt,
+    'C': CreateClassStmt,
+    'A': CreateAssociationStmt,
+    'U': CreateUniqueStmt
+}
+
+
+def decode_statement(record, filename):
+    '''
+    Decode a statement previously encoded by *encode_statement()*.
+    '''
+    stmt = _statement_types[record[2]](*record[3:])
+    stmt.offset = record[0]
+    stmt.lineno = record[1]
+    stmt.filename = filename
+    return stmt
+
+
+class ParseCache(object):
+    '''
+    An on-disk cache of statements parsed from files, stored in a *directory*.
+    Entries are keyed by the path of a file, and validated against the size,
+    the modification time and a hash of the content of the file. Entries of
+    files that have been touched, but not modified, are still valid.
+    
+    When the cache grows beyond *max_size* bytes, the least recently used
+    entries are evicted. No entries are evicted if *max_size* is None.
+    
+    The directory may be selected by the environment variable
+    PYXTUML_CACHE_DIR, and the size by PYXTUML_CACHE_SIZE, see
+    *from_environment()*.
+    '''
+    magic = 'pyxtuml-parse-cache-1'
+    suffix = '.cache'
+    directory = None
+    max_size = None
+    _size = None
+    
+    def __init__(self, directory, max_size=256 << 20):
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+    
+    @classmethod
+    def from_environment(cls):
+        '''
+        Create a cache in the directory named by the environment variable
+        PYXTUML_CACHE_DIR, or return None if the variable is not set.
+        '''
+        directory = os.environ.get('PYXTUML_CACHE_DIR')
+        if not directory:
+            return None
+        
+        max_size = os.environ.get('PYXTUML_CACHE_SIZE')
+        if max_size:
+            return cls(directory, int(max_size))
+        else:
+            return cls(directory)
+        
+    @staticmethod
+    def digest(data):
+        '''
+        Compute a hash of some *data* read from a file.
+        '''
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+            
+        return hashlib.sha1(data).hexdigest()
+    
+    def entry_path(self, filename):
+        '''
+        Get the path to the cache entry of a *filename*.
+        '''
+        key = os.path.abspath(filename)
+        if not isinstance(key, bytes):
+            key = key.encode('utf-8')
+            
+        return os.path.join(self.directory,
+                            hashlib.sha1(key).hexdigest() + self.suffix)
+    
+    def _read_entry(self, path):
+        try:
+            with open(path, 'rb') as f:
+                entry = marshal.load(f)
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if (not isinstance(entry, tuple) or len(entry) != 6 or
+            entry[0] != (self.magic, sys.version_info[:2])):
+            return None
+
+        return entry
+    
+    def _write_entry(self, path, entry):
+        fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(entry, f)
+            getattr(os, 'replace', os.rename)(tmp, path)
+        except:
+            os.remove(tmp)
+            raise
+        
+        if self._size is not None:
+            self._size += os.path.getsize(path)
+            
+    def load(self, filename, parse):
+        '''
+        Load statements parsed from a *filename*. Unless the cache contains
+        a valid entry for the file, the content of the file is read and
+        passed to *parse*, and the statements returned are cached.
+        '''
+        path = self.entry_path(filename)
+        stat = os.stat(filename)
+        entry = self._read_entry(path)
+        if entry and entry[3] != os.path.abspath(filename):
+            entry = None
+            
+        if entry and entry[1:3] == (stat.st_size, stat.st_mtime):
+            logger.debug('%s served from cache' % filename)
+            os.utime(path, None)
+            return [decode_statement(record, filename)
+                    for record in entry[5]]
+
+        with open(filename, 'r') as f:
+            data = f.read()
+            
+        digest = self.digest(data)
+        if entry and entry[4] == digest:
+            logger.debug('%s served from cache' % filename)
+            records = entry[5]
+            statements = [decode_statement(record, filename)
+                          for record in records]
+        else:
+            statements = list(parse(data))
+            records = [encode_statement(stmt) for stmt in statements]
+            
+        entry = ((self.magic, sys.version_info[:2]), stat.st_size,
+                 stat.st_mtime, os.path.abspath(filename), digest, records)
+        try:
+            self._write_entry(path, entry)
+        except (IOError, OSError) as e:
+            logger.warning('unable to cache %s: %s' % (filename, e))
+        else:
+            self.evict()
+            
+        return statements
+
+    def evict(self):
+        '''
+        Evict the least recently used entries until the size of the cache is
+        below the maximum size.
+        '''
+        if self.max_size is None:
+            return
+        
+        if self._size is not None and self._size <= self.max_size:
+            return
+        
+        entries = list()
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.suffix):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            self._size -= size
+    
+
 class ModelLoader(object):
     '''
     Class for loading metamodels previously persisted to disk.
@@ -152,6 +957,8 @@ class ModelLoader(object):
     any time.
     
     **Note:** Additional data will not affect previosly built metamodels.
+    Building the same input several times is better done by forking a
+    metamodel, see *xtuml.MetaModel.fork()*.
     
     Usage example:
     
@@ -161,9 +968,30 @@ class ModelLoader(object):
     >>> m1 = l.build_metamodel()
     >>> l.filename_input('additional_data.sql')
     >>> m2 = l.build_metamodel()
+    
+    Large models may be loaded in a streaming fashion, where input is read in
+    chunks and instances are created as soon as their classes are defined,
+    rather than after all input has been parsed, see *stream()*.
+    
+    By default, input is parsed by a hand-written *StatementParser*. The
+    PLY-based parser is used instead when *fast_parser* is set to False.
+    
+    Statements parsed from files may be kept in a *ParseCache*, so that files
+    which have not changed since they were last loaded need not be parsed
+    again. The cache is stored in *cache_dir*, or in the directory named by
+    the environment variable PYXTUML_CACHE_DIR. By default, no cache is used.
+    
+    Files may also be *mapped* into memory and scanned as bytes, see
+    *mapped_input()*. Mapped files are not cached.
+    
+    Instances may be restricted to classes of some *kinds*, and instances of
+    classes of *exclude_kinds* left out. Instances of other classes are then
+    discarded when the input is parsed. Classes and associations are always
+    defined.
     '''
     reserved = (
         'CREATE',
+        'DELETE',
         'FALSE',
         'FROM',
         'INDEX',
@@ -201,21 +1029,64 @@ class ModelLoader(object):
     parser = None
     lexer = None
     statements = None
+    fast_parser = True
+    metamodel = None
+    chunk_size = 1 << 20
+    cache = None
+    mapped = False
+    kinds = None
+    exclude_kinds = None
+    accept = None
+    _pending = None
+    _converters = None
     
-    def __init__(self):
+    def __init__(self, fast_parser=True, cache_dir=None, mapped=False,
+                 kinds=None, exclude_kinds=None):
         self.statements = list()
-        self.parser = yacc.yacc(debuglog=logger,
-                                errorlog=logger,
-                                optimize=1,
-                                module=self,
-                                outputdir=os.path.dirname(__file__),
-                                tabmodule='xtuml.__xtuml_parsetab')
+        self.fast_parser = fast_parser
+        self.mapped = mapped
+        self.kinds = kinds
+        self.exclude_kinds = exclude_kinds
+        self.accept = kind_filter(kinds, exclude_kinds)
+        if cache_dir:
+            self.cache = ParseCache(cache_dir)
+        else:
+            self.cache = ParseCache.from_environment()
+            
+        if not fast_parser:
+            self.parser = self._build_parser()
+
+    def _build_parser(self):
+        return yacc.yacc(debuglog=logger,
+                         errorlog=logger,
+                         optimize=1,
+                         module=self,
+                         outputdir=os.path.dirname(__file__),
+                         tabmodule='xtuml.__xtuml_parsetab')
     
     def input(self, data, name='<string>'):
         '''
         Parse *data* directly from a string. The *name* is used when reporting
         positional information if the parser encounter syntax errors.
         '''
+        if self.fast_parser:
+            logger.debug('parsing %s' % name)
+            s = StatementParser(data, name, accept=self.accept).iterparse()
+            return self._add_statements(s)
+
+        self._add_statements(self._parse(data, name))
+
+    def _parse(self, data, name):
+        '''
+        Parse *data* into a list of statements.
+        '''
+        if self.fast_parser:
+            logger.debug('parsing %s' % name)
+            return StatementParser(data, name).parse()
+        
+        if self.parser is None:
+            self.parser = self._build_parser()
+            
         lexer = lex.lex(debuglog=logger,
                         errorlog=logger,
                         optimize=1,
@@ -224,22 +1095,179 @@ class ModelLoader(object):
                         lextab="xtuml.__xtuml_lextab")
         lexer.filename = name
         logger.debug('parsing %s' % name)
-        s = self.parser.parse(lexer=lexer, input=data, tracking=1)
-        self.statements.extend(s)
+        return self.parser.parse(lexer=lexer, input=data, tracking=1)
 
     def filename_input(self, filename):
         '''
         Open and read from a *filename* on disk, and parse its content.
         '''
+        if self.mapped and self.fast_parser:
+            return self.mapped_input(filename)
+        
+        if self.cache is not None:
+            s = self.cache.load(filename, lambda data: self._parse(data, filename))
+            return self._add_statements(s)
+        
         with open(filename, 'r') as f:
             return self.file_input(f)
     
+    def mapped_input(self, filename):
+        '''
+        Map a *filename* on disk into memory, and parse its content without
+        reading it into a string first. The content is assumed to be encoded
+        in UTF-8.
+        
+        String values longer than *StatementParser.defer_size* bytes are
+        neither copied nor decoded while loading. Instead, they are decoded
+        when an instance attribute is first accessed. The file is kept mapped
+        until all such values have been decoded or dropped, or until the file
+        is released by *release_mapped_file()*.
+        '''
+        with open(filename, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                data = b''
+
+        source = MappedFile(data)
+        path = os.path.realpath(filename)
+        _mapped_files.setdefault(path, weakref.WeakSet()).add(source)
+        
+        logger.debug('parsing %s' % filename)
+        s = StatementParser(data, filename, accept=self.accept,
+                            source=source).iterparse()
+        return self._add_statements(s)
+    
     def file_input(self, file_object):
         '''
         Read and parse data from a *file object*, i.e. the type of object 
         returned by the builtin python function *open()*.
         '''
-        return self.input(file_object.read(), name=file_object.name)
+        if self.metamodel is None or not self.fast_parser:
+            return self.input(file_object.read(), name=file_object.name)
+
+        name = file_object.name
+        logger.debug('parsing %s' % name)
+        data = ''
+        lineno = 1
+        offset = 0
+        size = self.chunk_size
+        while True:
+            chunk = file_object.read(size)
+            data += chunk
+            parser = StatementParser(data, name, lineno, offset, self.accept)
+            self._add_statements(parser.iterparse(complete=not chunk))
+            if not chunk:
+                break
+
+            # a statement longer than a chunk is scanned again from its start
+            # after each read, so grow the reads to keep that linear.
+            if parser.pos:
+                size = self.chunk_size
+            else:
+                size *= 2
+                
+            lineno = parser.lineno(parser.pos)
+            offset += parser.pos
+            data = data[parser.pos:]
+
+    def stream(self, id_generator=None, compact=False):
+        '''
+        Start streaming input into a new metamodel, see *build_metamodel()*
+        for a description of the arguments. Input provided so far is
+        populated into the metamodel at once. From now on, files are read in
+        chunks, and statements are populated into the metamodel as they are
+        parsed. Statements that depend on classes not yet defined are kept
+        until the classes are defined.
+
+        The metamodel is returned by a subsequent call to *build_metamodel()*,
+        after which the loader is no longer streaming.
+        
+        Usage example:
+    
+        >>> l = xtuml.ModelLoader()
+        >>> l.filename_input('schema.sql')
+        >>> l.stream()
+        >>> l.filename_input('data.sql')
+        >>> m = l.build_metamodel()
+        '''
+        self.metamodel = xtuml.MetaModel(id_generator, compact)
+        self._pending = collections.OrderedDict()
+        self._converters = dict()
+
+        statements = self.statements
+        self.statements = list()
+        for ty in [CreateClassStmt, CreateUniqueStmt, CreateAssociationStmt,
+                   CreateInstanceStmt]:
+            self._add_statements(stmt for stmt in statements
+                                 if isinstance(stmt, ty))
+
+    def _add_statements(self, statements):
+        '''
+        Add parsed *statements* to the loader, or populate them into the
+        metamodel when streaming. Instances of classes not accepted by the
+        loader are discarded.
+        '''
+        accept = self.accept
+        if accept is not None:
+            statements = (stmt for stmt in statements
+                          if not isinstance(stmt, (CreateInstanceStmt,
+                                                   DeleteInstanceStmt)) or
+                          accept(stmt.kind))
+            
+        if self.metamodel is None:
+            return self.statements.extend(statements)
+        
+        for stmt in statements:
+            self._stream_statement(stmt)
+            
+    def _stream_statement(self, stmt):
+        '''
+        Populate the metamodel being streamed with a statement, or keep the
+        statement until the classes it depends on are defined.
+        '''
+        metamodel = self.metamodel
+        if isinstance(stmt, CreateClassStmt):
+            metamodel.define_class(stmt.kind, stmt.attributes)
+            for other in self._pending.pop(stmt.kind.upper(), []):
+                self._stream_statement(other)
+            return
+        
+        if isinstance(stmt, CreateAssociationStmt):
+            kinds = [stmt.source_kind, stmt.target_kind]
+        else:
+            kinds = [stmt.kind]
+
+        for kind in kinds:
+            if kind.upper() not in metamodel.metaclasses:
+                self._pending.setdefault(kind.upper(), list()).append(stmt)
+                return
+                
+        self._populate_statement(metamodel, stmt)
+        
+    def _populate_statement(self, metamodel, stmt):
+        '''
+        Populate a *metamodel* with a statement other than a CREATE TABLE
+        statement.
+        '''
+        if isinstance(stmt, CreateUniqueStmt):
+            metamodel.define_unique_identifier(stmt.kind, stmt.name, 
+                                               *stmt.attributes)
+
+        elif isinstance(stmt, CreateAssociationStmt):
+            self._populate_association(metamodel, stmt)
+            
+        elif isinstance(stmt, DeleteInstanceStmt):
+            self._delete_instances(metamodel, [stmt])
+            
+        elif stmt.names:
+            self._populate_instance_with_named_arguments(metamodel, stmt,
+                                                         self._converters)
+
+        else:
+            self._populate_instance_with_positional_arguments(metamodel, stmt,
+                                                              self._converters)
 
     def populate_classes(self, metamodel):
         '''
@@ -255,21 +1283,26 @@ class ModelLoader(object):
         input.
         '''
         for stmt in self.statements:
-            if not isinstance(stmt, CreateAssociationStmt):
-                continue
-            
-            ass = metamodel.define_association(stmt.rel_id,
-                                         stmt.source_kind,
-                                         stmt.source_keys,
-                                         'M' in stmt.source_cardinality,
-                                         'C' in stmt.source_cardinality,
-                                         stmt.source_phrase,
-                                         stmt.target_kind,
-                                         stmt.target_keys,
-                                         'M' in stmt.target_cardinality,
-                                         'C' in stmt.target_cardinality,
-                                         stmt.target_phrase)
-            ass.formalize()
+            if isinstance(stmt, CreateAssociationStmt):
+                self._populate_association(metamodel, stmt)
+
+    @staticmethod
+    def _populate_association(metamodel, stmt):
+        '''
+        Populate a *metamodel* with an association defined by a statement.
+        '''
+        ass = metamodel.define_association(stmt.rel_id,
+                                           stmt.source_kind,
+                                           stmt.source_keys,
+                                           'M' in stmt.source_cardinality,
+                                           'C' in stmt.source_cardinality,
+                                           stmt.source_phrase,
+                                           stmt.target_kind,
+                                           stmt.target_keys,
+                                           'M' in stmt.target_cardinality,
+                                           'C' in stmt.target_cardinality,
+                                           stmt.target_phrase)
+        ass.formalize()
 
     def populate_unique_identifiers(self, metamodel):
         '''
@@ -296,7 +1329,136 @@ class ModelLoader(object):
         return metamodel.define_class(kind, attributes)
     
     @staticmethod
-    def _populate_instance_with_positional_arguments(metamodel, stmt):
+    def _slots(metaclass, inst):
+        '''
+        Obtain the names of attributes stored in slots on an instance,
+        excluding attributes that have become referential since the slots
+        were laid out.
+        '''
+        slots = getattr(type(inst), '__slots__', ())
+        if slots and metaclass.referential_attributes:
+            slots = set(slots) - metaclass.referential_attributes
+
+        return slots
+
+    @staticmethod
+    def _deferrable(metaclass, name, fn):
+        '''
+        Determine if decoding a value of an attribute with some *name*, which
+        is deserialized by *fn*, may be deferred until the attribute is
+        accessed. Unresolved referential attributes are never deferred.
+        '''
+        return (fn is _deserialize_string and
+                name not in metaclass.referential_attributes)
+
+    @staticmethod
+    def _converter(converters, metaclass, inst, names, count):
+        '''
+        Obtain a converter for insert statements of some shape, i.e. with
+        some attribute *names* (or None when positional) and a *count* of
+        values. The converter consists of a list of columns (name, type,
+        deserializer, index, slot, deferrable) to assign values from, a list
+        of attributes (name, type, slot) to assign default values to, and a
+        flag indicating if the shape does not match the schema. Converters are
+        kept in *converters*, and rebuilt when the class or referential
+        attributes of the metaclass change.
+        '''
+        key = (metaclass, names, count)
+        clazz = type(inst)
+        entry = converters.get(key)
+        if (entry is not None and entry[0] is clazz and 
+            entry[1] == len(metaclass.referential_attributes)):
+            return entry[2]
+        
+        slots = ModelLoader._slots(metaclass, inst)
+        for name, ty in metaclass.attributes:
+            if (deserializer(ty) is None and 
+                name not in metaclass.referential_attributes):
+                raise xtuml.MetaException("Unknown type named '%s'" % ty)
+            
+        columns = list()
+        defaults = list()
+        if names is None:
+            mismatch = len(metaclass.attributes) != count
+            for idx, (name, ty) in enumerate(metaclass.attributes):
+                if idx < count:
+                    fn = deserializer(ty) or (lambda value: None)
+                    columns.append((name, ty, fn, idx, name in slots,
+                                    ModelLoader._deferrable(metaclass, name,
+                                                            fn)))
+                elif name not in metaclass.referential_attributes:
+                    defaults.append((name, ty, name in slots))
+        else:
+            unames = [name.upper() for name in names]
+            schema_unames = [name.upper() for name in metaclass.attribute_names]
+            mismatch = bool(set(unames) - set(schema_unames))
+            for name, ty in metaclass.attributes:
+                uname = name.upper()
+                if uname in unames:
+                    idx = unames.index(uname)
+                else:
+                    idx = None
+                fn = deserializer(ty) or (lambda value: None)
+                columns.append((name, ty, fn, idx, name in slots,
+                                ModelLoader._deferrable(metaclass, name, fn)))
+                
+        converter = (columns, defaults, mismatch)
+        converters[key] = (clazz, len(metaclass.referential_attributes), 
+                           converter)
+        return converter
+
+    @staticmethod
+    def _populate_instance(metaclass, stmt, names, converters):
+        '''
+        Populate a *metaclass* with an instance defined by an insert
+        statement, using a converter for the shape of the statement.
+        '''
+        values = stmt.values
+        inst = metaclass.allocate()
+        columns, defaults, mismatch = ModelLoader._converter(converters,
+                                                             metaclass, inst,
+                                                             names,
+                                                             len(values))
+        if mismatch:
+            logger.warn('%s:%d:schema mismatch' % (stmt.filename, stmt.lineno))
+            
+        d = inst.__dict__
+        for name, ty, fn, idx, slot, deferrable in columns:
+            if idx is None:
+                value = None
+            else:
+                value = values[idx]
+                if value.__class__ is DeferredString:
+                    if deferrable:
+                        metaclass.defer(inst, name, value)
+                        continue
+                    value = value.text()
+                    
+                value = fn(value)
+                if value is None:
+                    raise ParsingException("%s:%d:unable to deserialize "\
+                                           "%s to a %s" % (stmt.filename,
+                                                           stmt.lineno,
+                                                           values[idx],
+                                                           ty))
+            if slot:
+                object.__setattr__(inst, name, value)
+            else:
+                d[name] = value
+
+        for name, ty, slot in defaults:
+            value = metaclass.default_value(ty)
+            if slot:
+                object.__setattr__(inst, name, value)
+            else:
+                d[name] = value
+                
+        metaclass.index_instance(inst)
+        return inst
+    
+    @staticmethod
+    def _populate_instance_with_positional_arguments(metamodel, stmt,
+                                                     converters=None):
         '''
         Populate a *metamodel* with an instance previously encountered from 
         input that was defined using positional arguments.
@@ -307,26 +1469,15 @@ class ModelLoader(object):
                                                  names, stmt.values)
             
         metaclass = metamodel.find_metaclass(stmt.kind)
-        if len(metaclass.attributes) != len(stmt.values):
-            logger.warn('%s:%d:schema mismatch' % (stmt.filename, stmt.lineno))
-                
-        inst = metamodel.new(stmt.kind)
-        for attr, value in zip(metaclass.attributes, stmt.values):
-            name, ty = attr
-            py_value = deserialize_value(ty, value)
-            if py_value is None:
-                raise ParsingException("%s:%d:unable to deserialize "\
-                                       "%s to a %s" % (stmt.filename,
-                                                       stmt.lineno,
-                                                       value,
-                                                       ty))
-
-            inst.__dict__[name] = py_value
-        
-        return inst
+        if converters is None:
+            converters = dict()
+            
+        return ModelLoader._populate_instance(metaclass, stmt, None,
+                                              converters)
     
     @staticmethod
-    def _populate_instance_with_named_arguments(metamodel, stmt):
+    def _populate_instance_with_named_arguments(metamodel, stmt,
+                                                converters=None):
         '''
         Populate a *metamodel* with an instance previously encountered from 
         input that was defined using named arguments.
@@ -336,108 +1487,361 @@ class ModelLoader(object):
                                                  stmt.names, stmt.values)
             
         metaclass = metamodel.find_metaclass(stmt.kind)
+        if converters is None:
+            converters = dict()
             
-        schema_unames = [name.upper() for name in metaclass.attribute_names]
-        inst_unames = [name.upper() for name in stmt.names]
-        
-        if set(inst_unames) - set(schema_unames):
-            logger.warn('%s:%d:schema mismatch' % (stmt.filename, stmt.lineno))
-            
-        inst = metamodel.new(stmt.kind)
-        for name, ty in metaclass.attributes:
-            uname = name.upper()
-            if uname in inst_unames:
-                idx = inst_unames.index(uname)
-                value = deserialize_value(ty, stmt.values[idx])
-                if value is None:
-                    raise ParsingException("%s:%d:unable to deserialize "\
-                                           "%s to a %s" % (stmt.filename,
-                                                           stmt.lineno,
-                                                           value,
-                                                           ty))
-            else:
-                value = None
-            
-            inst.__dict__[name] = value
-
-        return inst
+        return ModelLoader._populate_instance(metaclass, stmt,
+                                              tuple(stmt.names), converters)
     
-    def populate_instances(self, metamodel):
+    def populate_instances(self, metamodel, kinds=None, exclude_kinds=None):
         '''
         Populate a *metamodel* with instances previously encountered from
-        input.
+        input. Optionally, restrict instances to classes of some *kinds*, and
+        leave out instances of classes of *exclude_kinds*.
         '''
+        accept = kind_filter(kinds, exclude_kinds)
+        converters = dict()
         for stmt in self.statements:
             if not isinstance(stmt, CreateInstanceStmt):
                 continue
             
+            if accept is not None and not accept(stmt.kind):
+                continue
+            
             if stmt.names:
                 fn = self._populate_instance_with_named_arguments
             else:
                 fn = self._populate_instance_with_positional_arguments
             
-            fn(metamodel, stmt)
+            fn(metamodel, stmt, converters)
+    
+    def populate_deletes(self, metamodel, kinds=None, exclude_kinds=None):
+        '''
+        Delete instances from a *metamodel* named by DELETE FROM statements
+        previously encountered from input, e.g. a delta persisted by
+        *xtuml.persist_delta()* following its base. Optionally, restrict
+        deletes to classes of some *kinds*, and leave out deletes of
+        instances of classes of *exclude_kinds*.
+        '''
+        accept = kind_filter(kinds, exclude_kinds)
+        statements = [stmt for stmt in self.statements
+                      if isinstance(stmt, DeleteInstanceStmt) and
+                      (accept is None or accept(stmt.kind))]
+        if statements:
+            self._delete_instances(metamodel, statements)
+    
+    @staticmethod
+    def _key_columns(metaclass, names):
+        '''
+        Obtain a list of columns (name, null) used to compute keys from
+        attributes with some *names* on instances of a *metaclass*. The null
+        field indicates which falsy values, besides None, denote null, see
+        *_compute_key()*.
+        '''
+        columns = list()
+        for name in names:
+            ty = (metaclass.attribute_type(name) or '').upper()
+            if ty == 'UNIQUE_ID':
+                null = 0
+            elif ty == 'STRING':
+                null = ''
+            else:
+                null = None
+            columns.append((name, null))
+
+        return columns
     
-    def populate_connections(self, metamodel):
+    @staticmethod
+    def _compute_key(inst, columns):
+        '''
+        Compute a key, i.e. a tuple of attribute values in *columns*, that
+        identifies some *instance*. Values stored in the dictionary of the
+        instance take precedence, e.g. unresolved referential attributes.
+        None is returned if any of the values are null.
+        '''
+        d = inst.__dict__
+        key = list()
+        for name, null in columns:
+            if name in d:
+                value = d[name]
+            else:
+                value = getattr(inst, name)
+
+            if not value and (value is None or 
+                              (null is not None and value == null)):
+                return None
+
+            key.append(value)
+
+        return tuple(key)
+
+    def populate_connections(self, metamodel, instances=None):
         '''
         Populate links in a *metamodel* with connections between them.
+        Optionally, only connect some *instances* to the instances they
+        refer to, e.g. instances added to a metamodel already populated.
+        
+        Connections are computed by joining the referential attributes of
+        one class with the identifying attributes of another class, using an
+        index built in a single pass over the identified class. Indices are
+        shared between associations that refer to the same attributes.
         '''
-        storage = dict()
+        if instances is None:
+            sources = dict((metaclass, metaclass.storage)
+                           for metaclass in metamodel.metaclasses.values())
+        else:
+            sources = dict()
+            for inst in instances:
+                metaclass = xtuml.get_metaclass(inst)
+                sources.setdefault(metaclass, list()).append(inst)
+            
+        indices = dict()
         for ass in metamodel.associations:
-            source_class = ass.source_link.to_metaclass
-            target_class = ass.target_link.to_metaclass
-
-            if target_class not in storage:
-                storage[target_class] = dict()
+            started = time.time()
+            source_link = ass.source_link
+            target_link = ass.target_link
+            source_class = source_link.to_metaclass
+            target_class = target_link.to_metaclass
+            if not sources.get(source_class) or not target_class.storage:
+                continue
+            
+            # order keys as the identifying attributes are declared
+            order = target_class.attribute_names
+            pairs = sorted(source_link.key_map.items(),
+                           key=lambda pair: (order.index(pair[1])
+                                             if pair[1] in order else len(order)))
+            ref_names = tuple(pair[0] for pair in pairs)
+            id_names = tuple(pair[1] for pair in pairs)
             
-            link_key = frozenset(ass.source_link.key_map.values())
-            if link_key not in storage[target_class]:
-                storage[target_class][link_key] = dict()
+            index = indices.get((target_class, id_names))
+            if index is None:
+                index = indices[(target_class, id_names)] = dict()
+                columns = self._key_columns(target_class, id_names)
                 for other_inst in target_class.storage:
-                    inst_key = ass.source_link.compute_index_key(other_inst)
-                    if inst_key is None:
+                    key = self._compute_key(other_inst, columns)
+                    if key is not None:
+                        index.setdefault(key, list()).append(other_inst)
+
+            count = 0
+            columns = self._key_columns(source_class, ref_names)
+            for inst in sources[source_class]:
+                key = self._compute_key(inst, columns)
+                if key is None or key not in index:
+                    continue
+                
+                for other_inst in index[key]:
+                    count += 1
+                    if metamodel.journal is not None:
+                        source_link.connect(other_inst, inst, check=False)
+                        target_link.connect(inst, other_inst, check=False)
                         continue
                     
-                    if inst_key not in storage[target_class][link_key]:
-                        storage[target_class][link_key][inst_key] = xtuml.OrderedSet()
+                    if other_inst not in source_link:
+                        source_link[other_inst] = xtuml.OrderedSet()
+                    source_link[other_inst].add(inst)
+                    
+                    if inst not in target_link:
+                        target_link[inst] = xtuml.OrderedSet()
+                    target_link[inst].add(other_inst)
 
-                    storage[target_class][link_key][inst_key].add(other_inst)
+            if count:
+                source_class.drop_referential_cache()
 
-            for inst in source_class.storage:
-                inst_key = ass.source_link.compute_lookup_key(inst)
-                if inst_key is None:
-                    continue
+            logger.debug('%s: %d connection(s) between %s and %s in %.1f ms',
+                         ass.rel_id, count, source_class.kind, target_class.kind,
+                         (time.time() - started) * 1000)
+
+        for metaclass, instances in sources.items():
+            referential_attributes = metaclass.referential_attributes
+            if not referential_attributes:
+                continue
+
+            if metamodel.journal is not None:
+                for inst in instances:
+                    for attr in referential_attributes:
+                        if attr in inst.__dict__:
+                            delattr(inst, attr)
+                continue
                 
-                if inst_key not in storage[target_class][link_key]:
+            for inst in instances:
+                d = inst.__dict__
+                for attr in referential_attributes:
+                    d.pop(attr, None)
+
+            metaclass.drop_referential_cache()
+
+    @staticmethod
+    def _find_instances(metamodel, statements):
+        '''
+        Find instances in a *metamodel* named by DELETE FROM *statements*,
+        i.e. instances with attribute values that serialize to the same
+        values as in a statement. Values stored in the dictionary of an
+        instance take precedence, e.g. unresolved referential attributes.
+        '''
+        rows = dict()
+        instances = list()
+        for stmt in statements:
+            metaclass = metamodel.find_metaclass(stmt.kind)
+            attributes = metaclass.attributes
+            if metaclass not in rows:
+                rows[metaclass] = dict()
+                for inst in metaclass.storage:
+                    d = inst.__dict__
+                    key = tuple([xtuml.serialize_value(d[name] if name in d
+                                                       else getattr(inst, name),
+                                                       ty)
+                                 for name, ty in attributes])
+                    rows[metaclass].setdefault(key, list()).append(inst)
+
+            values = [value.text() if value.__class__ is DeferredString
+                      else value for value in stmt.values]
+            if stmt.names:
+                values = dict((name.upper(), value)
+                              for name, value in zip(stmt.names, values))
+                values = [values.get(name.upper()) for name, _ in attributes]
+            
+            if len(values) != len(attributes):
+                raise ParsingException("%s:%d:schema mismatch" % (
+                                       stmt.filename, stmt.lineno))
+
+            key = list()
+            for (_, ty), value in zip(attributes, values):
+                if value is not None:
+                    value = deserialize_value(ty, value)
+                key.append(xtuml.serialize_value(value, ty))
+
+            candidates = rows[metaclass].get(tuple(key))
+            if not candidates:
+                raise ParsingException("%s:%d:unable to find an instance "
+                                       "of %s to delete" % (stmt.filename,
+                                                            stmt.lineno,
+                                                            stmt.kind))
+            instances.append(candidates.pop(0))
+
+        return instances
+
+    @staticmethod
+    def _delete_instances(metamodel, statements):
+        '''
+        Delete instances from a *metamodel* named by DELETE FROM *statements*.
+        Instances that refer to a deleted instance keep the values of their
+        referential attributes, and are returned so that they may be
+        connected again, see *populate_connections()*.
+        '''
+        instances = ModelLoader._find_instances(metamodel, statements)
+        deleted = set(instances)
+        affected = xtuml.OrderedSet()
+        for inst in instances:
+            for link in xtuml.get_metaclass(inst).links.values():
+                metaclass = link.to_metaclass
+                if not metaclass.referential_attributes:
                     continue
                 
-                for other_inst in storage[target_class][link_key][inst_key]:
-                    ass.source_link.connect(other_inst, inst, check=False)
-                    ass.target_link.connect(inst, other_inst, check=False)
+                for other in link.get(inst, ()):
+                    if other in deleted or other in affected:
+                        continue
+
+                    d = other.__dict__
+                    for name in metaclass.referential_attributes:
+                        if name not in d:
+                            d[name] = getattr(other, name)
+                    affected.add(other)
+                    
+        for inst in instances:
+            xtuml.get_metaclass(inst).delete(inst)
+
+        return affected
 
-        for inst in metamodel.instances:
-            metaclass = xtuml.get_metaclass(inst)
-            for attr in metaclass.referential_attributes:
-                if attr in inst.__dict__:
-                    delattr(inst, attr)
+    def populate_changes(self, metamodel):
+        '''
+        Populate an existing *metamodel* with changes to instances previously
+        encountered from input, e.g. a delta persisted by
+        *xtuml.persist_delta()*. Instances named by DELETE FROM statements are
+        deleted, after which instances defined by INSERT INTO statements are
+        created. Only new instances, and instances that referred to deleted
+        ones, are connected.
+        '''
+        accept = self.accept
+        statements = [stmt for stmt in self.statements
+                      if isinstance(stmt, DeleteInstanceStmt)]
+        instances = self._delete_instances(metamodel, statements)
 
-    def populate(self, metamodel):
+        converters = dict()
+        for stmt in self.statements:
+            if not isinstance(stmt, CreateInstanceStmt):
+                continue
+            
+            if accept is not None and not accept(stmt.kind):
+                continue
+            
+            if stmt.names:
+                fn = self._populate_instance_with_named_arguments
+            else:
+                fn = self._populate_instance_with_positional_arguments
+            
+            instances.add(fn(metamodel, stmt, converters))
+            
+        self.populate_connections(metamodel, instances)
+        
+    def populate(self, metamodel, kinds=None, exclude_kinds=None):
         '''
         Populate a *metamodel* with entities previously encountered from input.
+        Optionally, restrict instances to classes of some *kinds*, and leave
+        out instances of classes of *exclude_kinds*.
         '''
         self.populate_classes(metamodel)
         self.populate_unique_identifiers(metamodel)
         self.populate_associations(metamodel)
-        self.populate_instances(metamodel)
+        self.populate_instances(metamodel, kinds, exclude_kinds)
+        self.populate_deletes(metamodel, kinds, exclude_kinds)
         self.populate_connections(metamodel)
 
-    def build_metamodel(self, id_generator=None):
+    def build_metamodel(self, id_generator=None, compact=False, kinds=None,
+                        exclude_kinds=None):
         '''
         Build and return a *xtuml.MetaModel* containing previously loaded input.
+        Optionally, store instances in a *compact* form to reduce the memory
+        footprint of large models.
+        
+        Instances may be restricted to classes of some *kinds*, and instances
+        of classes of *exclude_kinds* left out. All classes and associations
+        are defined, but connections are only populated between the classes
+        that have instances.
+        
+        When streaming, the metamodel being streamed is completed and
+        returned instead, and the arguments are ignored.
         '''
-        m = xtuml.MetaModel(id_generator)
+        if self.metamodel is not None:
+            return self._finish_stream()
+        
+        m = xtuml.MetaModel(id_generator, compact)
         
-        self.populate(m)
+        self.populate(m, kinds, exclude_kinds)
+        
+        return m
+
+    def _finish_stream(self):
+        '''
+        Populate the metamodel being streamed with statements that are still
+        kept, and with connections between its instances.
+        '''
+        m = self.metamodel
+        pending = list(itertools.chain(*self._pending.values()))
+        self.metamodel = None
+        self._pending = None
+        
+        instance_types = (CreateInstanceStmt, DeleteInstanceStmt)
+        for stmt in pending:
+            if not isinstance(stmt, instance_types):
+                self._populate_statement(m, stmt)
+
+        for stmt in pending:
+            if isinstance(stmt, instance_types):
+                self._populate_statement(m, stmt)
+
+        self._converters = None
+        
+        self.populate_connections(m)
         
         return m
 
@@ -540,6 +1944,7 @@ class ModelLoader(object):
         '''
         statement : create_table_statement SEMICOLON
                   | insert_into_statement SEMICOLON
+                  | delete_from_statement SEMICOLON
                   | create_rop_statement SEMICOLON
                   | create_index_statement SEMICOLON
         '''
@@ -581,6 +1986,18 @@ class ModelLoader(object):
         '''
         p[0] = CreateInstanceStmt(p[3], p[9], p[5])
     
+    def p_ordered_delete_from_statement(self, p):
+        '''
+        delete_from_statement : DELETE FROM identifier VALUES LPAREN value_sequence RPAREN
+        '''
+        p[0] = DeleteInstanceStmt(p[3], p[6], None)
+
+    def p_named_delete_from_statement(self, p):
+        '''
+        delete_from_statement : DELETE FROM identifier LPAREN identifier_sequence RPAREN VALUES LPAREN value_sequence RPAREN
+        '''
+        p[0] = DeleteInstanceStmt(p[3], p[9], p[5])
+    
     def p_empty_value_sequence(self, p):
         '''value_sequence : '''
         p[0] = []
@@ -663,6 +2080,7 @@ class ModelLoader(object):
         identifier : ID
                    | CREATE
                    | INSERT
+                   | DELETE
                    | INTO
                    | VALUES
                    | TABLE
@@ -693,10 +2111,34 @@ class ModelLoader(object):
             raise ParsingException("unknown error")
 
 
-def load_metamodel(resource):
+def load_delta(metamodel, resource):
+    '''
+    Load changes to instances from a *resource*, e.g. a delta persisted by
+    *xtuml.persist_delta()*, and apply them to a *metamodel*. The *resource*
+    may be either a filename, or a list of filenames.
+    
+    Usage example:
+    
+    >>> metamodel = xtuml.load_metamodel('db.sql')
+    >>> xtuml.load_delta(metamodel, 'delta.sql')
+    '''
+    if isinstance(resource, str):
+        resource = [resource]
+        
+    loader = ModelLoader()
+    for filename in resource:
+        loader.filename_input(filename)
+    
+    loader.populate_changes(metamodel)
+    return metamodel
+
+
+def load_metamodel(resource, kinds=None, exclude_kinds=None):
     '''
     Load and return a metamodel from a *resource*. The *resource* may be either
-    a filename, or a list of filenames.
+    a filename, or a list of filenames. Optionally, only load instances of
+    classes of some *kinds*, and leave out instances of classes of
+    *exclude_kinds*.
     
     Usage example:
     
@@ -705,7 +2147,7 @@ def load_metamodel(resource):
     if isinstance(resource, str):
         resource = [resource]
         
-    loader = ModelLoader()
+    loader = ModelLoader(kinds=kinds, exclude_kinds=exclude_kinds)
     for filename in resource:
         loader.filename_input(filename)
     
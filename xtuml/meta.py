@@ -22,6 +22,13 @@ metaclasses, relate instances and perform navigations and queries.
 
 import logging
 import collections
+import copy
+import itertools
+import operator
+import re
+import sys
+import types
+import weakref
 
 import xtuml
 
@@ -113,24 +120,22 @@ def _is_null(instance, name):
     elif value is None:
         return True
 
-    name = name.upper()
-    metaclass = get_metaclass(instance)
-    for attr_name, attr_ty in metaclass.attributes:
-        if attr_name.upper() != name:
-            continue
+    attr_ty = get_metaclass(instance).attribute_type(name)
+    if attr_ty is None:
+        return None
 
-        attr_ty = attr_ty.upper()
-        if attr_ty == 'UNIQUE_ID':
-            # UUID(int=0) is reserved for null
-            return value == 0
+    attr_ty = attr_ty.upper()
+    if attr_ty == 'UNIQUE_ID':
+        # UUID(int=0) is reserved for null
+        return value == 0
 
-        elif attr_ty == 'STRING':
-            # empty string is reserved for null
-            return len(value) == 0
+    elif attr_ty == 'STRING':
+        # empty string is reserved for null
+        return len(value) == 0
 
-        else:
-            #null-values for integer, boolean and real are not supported
-            return False
+    else:
+        #null-values for integer, boolean and real are not supported
+        return False
 
 
 def apply_query_operators(iterable, ops):
@@ -142,6 +147,9 @@ def apply_query_operators(iterable, ops):
         if isinstance(op, WhereEqual):
             iterable = op(iterable)
             
+        elif isinstance(op, WhereVector):
+            iterable = op(iterable)
+
         elif isinstance(op, OrderBy):
             iterable = op(iterable)
             
@@ -164,6 +172,7 @@ class Association(object):
     source_link = None
     target_keys = None
     target_link = None
+    formalized = False
     
     def __init__(self, rel_id,
                  source_keys, source_link, 
@@ -209,15 +218,29 @@ class Association(object):
         source_class = self.source_link.to_metaclass
         target_class = self.target_link.to_metaclass
         
+        self.formalized = True
         source_class.referential_attributes |= set(self.source_keys)
         target_class.identifying_attributes |= set(self.target_keys)
-
-        def fget(inst, ref_name, alt_prop):
+        for ref_key in self.source_keys:
+            source_class.drop_hash_indices(ref_key)
+        source_class.drop_referential_cache()
+        cache = source_class.referential_cache
+            
+        def fget(inst, name, ref_name, alt_prop):
+            values = cache.get(inst)
+            if values is None:
+                values = cache[inst] = dict()
+            elif name in values:
+                return values[name]
+            
             other_inst = self.target_link.navigate_one(inst)
             if other_inst is None and alt_prop:
-                return alt_prop.fget(inst)
-            
-            return getattr(other_inst, ref_name, None)
+                value = alt_prop.fget(inst)
+            else:
+                value = getattr(other_inst, ref_name, None)
+                
+            values[name] = value
+            return value
 
         def fset(inst, value, name, ref_name, alt_prop):
             kind = get_metaclass(inst).kind
@@ -232,8 +255,26 @@ class Association(object):
             #    return setattr(other_inst, ref_name, value)
         
         for ref_key, primary_key in zip(self.source_keys, self.target_keys):
+            deferred = [inst for inst, name in source_class.deferred
+                        if name == ref_key]
+            for inst in deferred:
+                source_class.materialize(inst, ref_key)
+                    
             prop = getattr(source_class.clazz, ref_key, None)
-            prop = property(partial(fget, ref_name=primary_key, alt_prop=prop), 
+            if isinstance(prop, types.MemberDescriptorType):
+                # move values stored in slots to where the loader expects
+                # to find unresolved referential attributes.
+                for inst in source_class.storage:
+                    if hasattr(inst, '__dict__'):
+                        try:
+                            inst.__dict__[ref_key] = prop.__get__(inst)
+                        except AttributeError:
+                            pass
+
+            if not isinstance(prop, property):
+                prop = None
+            prop = property(partial(fget, name=ref_key, ref_name=primary_key,
+                                    alt_prop=prop),
                             partial(fset, name=ref_key, ref_name=primary_key, alt_prop=prop))
             setattr(source_class.clazz, ref_key, prop)
             
@@ -314,7 +355,9 @@ class Link(dict):
         if self[instance] and not self.many and check:
             return False  
 
+        self.from_metaclass.record_change('link', self, instance)
         self[instance].add(another_instance)
+        self._drop_referential_cache(instance)
         return True
         
     def disconnect(self, instance, another_instance):
@@ -327,8 +370,21 @@ class Link(dict):
         if another_instance not in self[instance]: 
             return False
 
+        self.from_metaclass.record_change('link', self, instance)
         self[instance].remove(another_instance)
+        self._drop_referential_cache(instance)
         return True
+
+    def _drop_referential_cache(self, instance):
+        '''
+        Drop cached values of referential attributes that an *instance* obtains
+        by navigating the link, and of instances that depend on them.
+        '''
+        metaclass = self.from_metaclass
+        names = [name for name in self.key_map.values()
+                 if name in metaclass.referential_attributes]
+        if names:
+            metaclass.drop_referential_cache(instance, names)
         
     def navigate(self, instance):
         '''
@@ -379,7 +435,91 @@ class Link(dict):
 
         return frozenset(tuple(kwargs.items()))
 
-    
+
+class Index(dict):
+    '''
+    A hash index maps the values of some attributes, i.e. a key, to the
+    instances of a metaclass that carry those values. The attributes are
+    given by their *names*, in the order in which key values are computed.
+
+    Most keys in an index identify a single instance, so a bucket is stored
+    as the instance itself until a second instance with the same key shows
+    up. Buckets whose instances may no longer appear in the same order as
+    in the instance pool are kept in *dirty*, and sorted by the position of
+    the instances in the pool when looked up.
+    '''
+    names = None
+    dirty = None
+
+    def __init__(self, names):
+        self.names = names
+        self.dirty = set()
+
+    def compute_key(self, instance):
+        '''
+        Compute the key that can be used to look up an *instance* in the
+        index.
+        '''
+        return tuple([getattr(instance, name) for name in self.names])
+
+    def add(self, instance, key, in_order=True):
+        '''
+        Add an *instance* to the bucket identified by *key*. Specify if the
+        instance is added *in order*, i.e. if it is the last instance in the
+        instance pool.
+        '''
+        bucket = self.get(key)
+        if bucket is None:
+            self[key] = instance
+            return
+
+        if isinstance(bucket, Class):
+            bucket = self[key] = xtuml.OrderedSet([bucket])
+
+        bucket.add(instance)
+        if not in_order:
+            self.dirty.add(key)
+
+    def discard(self, instance, key):
+        '''
+        Remove an *instance* from the bucket identified by *key*. The return
+        value indicates if the instance was found in the bucket.
+        '''
+        bucket = self.get(key)
+        if bucket is instance:
+            del self[key]
+            return True
+
+        if not isinstance(bucket, xtuml.OrderedSet) or instance not in bucket:
+            return False
+
+        bucket.discard(instance)
+        if len(bucket) == 1:
+            self[key] = next(iter(bucket))
+            self.dirty.discard(key)
+
+        return True
+
+    def lookup(self, key, storage):
+        '''
+        Obtain a list of instances identified by *key*, ordered as they
+        appear in the instance pool *storage*.
+        '''
+        bucket = self.get(key)
+        if bucket is None:
+            return []
+
+        if isinstance(bucket, Class):
+            return [bucket]
+
+        if key in self.dirty:
+            bucket = self[key] = xtuml.OrderedSet(sorted(bucket,
+                                                         key=storage.position))
+            self.dirty.discard(key)
+
+        return list(bucket)
+
+
 class QuerySet(xtuml.OrderedSet):
     '''
     An ordered set which holds instances that match queries.
@@ -418,38 +558,73 @@ class Class(object):
         else: return QuerySet([self])
 
     def __getattr__(self, name):
-        uname = name.upper()
-        for attr, _ in get_metaclass(self).attributes:
-            if attr.upper() != uname :
-                continue
-            
-            if attr in self.__dict__:
-                return self.__dict__[attr]
-            else:
-                return object.__getattribute__(self, attr)
+        attr = get_metaclass(self).attribute_map.get(name.upper())
+        if attr is None:
+            return object.__getattribute__(self, name)
+
+        attr, _ = attr
+        if attr in self.__dict__:
+            return self.__dict__[attr]
         
-        return object.__getattribute__(self, name)
+        try:
+            return object.__getattribute__(self, attr)
+        except AttributeError:
+            metaclass = get_metaclass(self)
+            if not metaclass.deferred:
+                raise
+            
+        return metaclass.materialize(self, attr)
     
     def __setattr__(self, name, value):
-        uname = name.upper()
-        for attr, _ in get_metaclass(self).attributes:
-            if attr.upper() != uname :
-                continue
+        metaclass = get_metaclass(self)
+        attr = metaclass.attribute_map.get(name.upper())
+        if attr is None:
+            self.__dict__[name] = value
+            return
+
+        attr, _ = attr
+        if attr in metaclass.identifying_attributes:
+            metaclass.record_change('write', self, attr)
+            metaclass.drop_referential_cache(self, [attr])
+        else:
+            metaclass.track_change(self)
+            
+        if metaclass.deferred:
+            metaclass.deferred.pop((self, attr), None)
+            
+        if not metaclass.hash_indices and not metaclass.columns:
+            return object.__setattr__(self, attr, value)
+
+        indices = metaclass.unindex_instance(self, attr)
+        object.__setattr__(self, attr, value)
+        metaclass.index_instance(self, indices)
 
-            if attr in self.__dict__:
-                self.__dict__[attr] = value
-            else:
-                return object.__setattr__(self, attr, value)
-        
-        self.__dict__[name] = value
-        
     def __delattr__(self, name):
+        metaclass = get_metaclass(self)
         uname = name.upper()
-        for name in self.__dict__:
-            if uname == name.upper():
+        for key in self.__dict__:
+            if uname == key.upper():
+                name = key
                 break
-
-        del self.__dict__[name]
+        else:
+            attr = metaclass.attribute_map.get(uname)
+            if attr is not None:
+                name = attr[0]
+
+        metaclass.drop_hash_indices(name)
+        if name in metaclass.identifying_attributes:
+            metaclass.record_change('write', self, name)
+            metaclass.drop_referential_cache(self, [name])
+        else:
+            metaclass.track_change(self)
+            
+        if metaclass.deferred.pop((self, name), None) is not None:
+            return
+        
+        if name in self.__dict__:
+            del self.__dict__[name]
+        else:
+            object.__delattr__(self, name)
     
     def __str__(self):
         values = list()
@@ -471,26 +646,58 @@ class MetaClass(object):
     available, what thier types are, and so on.
     
     In addition, each metaclass also handle allocations of instances.
+
+    Values that the loader has not yet decoded, e.g. large strings in a
+    memory-mapped file, are kept in *deferred* keyed by (instance, name), and
+    are materialized when the attribute is first accessed.
+
+    Values of referential attributes are cached in *referential_cache*, keyed
+    weakly by instance. The cache is shared by all metaclasses in a metamodel,
+    a metaclass without a metamodel has a cache of its own.
+
+    A *compact* metaclass stores attribute values of its instances in slots
+    rather than in a dictionary per instance. The slots are laid out when the
+    first instance is created, attributes added after that point are stored
+    in the dictionary of each instance.
     '''
     metamodel = None
     kind = None
     attributes = None
+    attribute_map = None
     referential_attributes = None
     identifying_attributes = None
     links = None
+    resolved_links = None
     indices = None
     clazz = None
     storage = None
-    
-    def __init__(self, kind, metamodel=None):
+    hash_indices = None
+    columns = None
+    column_rows = None
+    deferred = None
+    referential_cache = None
+    row_formatter = None
+    compact = False
+    
+    def __init__(self, kind, metamodel=None, compact=False):
         self.metamodel = metamodel
+        self.compact = compact
         self.kind = kind
         self.attributes = list()
+        self.attribute_map = dict()
         self.referential_attributes = set()
         self.identifying_attributes = set()
         self.indices = dict()
         self.links = dict()
-        self.storage = list()
+        self.resolved_links = dict()
+        self.storage = xtuml.OrderedSet()
+        self.hash_indices = dict()
+        self.columns = dict()
+        self.deferred = dict()
+        if metamodel is None:
+            self.referential_cache = weakref.WeakKeyDictionary()
+        else:
+            self.referential_cache = metamodel.referential_cache
         self.clazz = type(str(kind), (Class,), dict(__metaclass__=self))
         
     def __call__(self, *args, **kwargs):
@@ -510,10 +717,17 @@ class MetaClass(object):
         '''
         Obtain the type of an attribute.
         '''
-        attribute_name = attribute_name.upper()
-        for name, ty in self.attributes:
-            if name.upper() == attribute_name:
-                return ty
+        attr = self.attribute_map.get(attribute_name.upper())
+        if attr is not None:
+            return attr[1]
+
+    def _update_attribute_map(self):
+        '''
+        Update the map used to look up attribute names case insensitively.
+        '''
+        self.attribute_map = dict()
+        for attr in reversed(self.attributes):
+            self.attribute_map[attr[0].upper()] = attr
     
     def add_link(self, metaclass, rel_id, phrase, conditional, many):
         '''
@@ -523,6 +737,13 @@ class MetaClass(object):
         key = (metaclass.kind.upper(), rel_id, phrase)
         self.links[key] = link
 
+        if self.metamodel is None:
+            self.resolved_links.clear()
+        else:
+            for other in self.metamodel.resolving_metaclasses:
+                other.resolved_links.clear()
+            self.metamodel.resolving_metaclasses.clear()
+
         return link
             
     def append_attribute(self, name, type_name):
@@ -532,6 +753,9 @@ class MetaClass(object):
         '''
         attr = (name, type_name)
         self.attributes.append(attr)
+        self.attribute_map.setdefault(name.upper(), attr)
+        self.row_formatter = None
+        self.drop_hash_indices()
         
     def insert_attribute(self, index, name, type_name):
         '''
@@ -540,6 +764,9 @@ class MetaClass(object):
         '''
         attr = (name, type_name)
         self.attributes.insert(index, attr)
+        self._update_attribute_map()
+        self.row_formatter = None
+        self.drop_hash_indices()
         
     def delete_attribute(self, name):
         '''
@@ -549,6 +776,9 @@ class MetaClass(object):
             attr_name, _ = attr
             if attr_name == name:
                 del self.attributes[idx]
+                self._update_attribute_map()
+                self.row_formatter = None
+                self.drop_hash_indices()
                 return
         
     def default_value(self, type_name):
@@ -580,8 +810,7 @@ class MetaClass(object):
         '''
         Create and return a new instance.
         '''
-        inst = self.clazz()
-        self.storage.append(inst)
+        inst = self.allocate()
         
         # set all attributes with an initial default value
         referential_attributes = dict()
@@ -605,6 +834,7 @@ class MetaClass(object):
             else:
                 referential_attributes[name] = value
         
+        self.index_instance(inst)
         if not referential_attributes:
             return inst
         
@@ -629,6 +859,111 @@ class MetaClass(object):
                 
         return inst
 
+    def allocate(self):
+        '''
+        Allocate a new instance in the instance pool, without assigning any
+        attribute values. The instance is not added to any hash indices.
+        '''
+        if self.compact and '__slots__' not in self.clazz.__dict__:
+            self._compact_class()
+
+        inst = self.clazz()
+        self.storage.add(inst)
+        self.record_change('create', inst)
+        self.drop_columns()
+        return inst
+        
+    def _compact_class(self):
+        '''
+        Replace the class that instances are created from with a subclass
+        that stores the attributes currently defined in slots. Attributes
+        already exposed by the class, e.g. referential attributes, are left
+        out.
+        '''
+        slots = [str(name) for name, _ in self.attributes
+                 if not hasattr(self.clazz, name)]
+        self.clazz = type(str(self.kind), (self.clazz,),
+                          dict(__slots__=tuple(slots)))
+
+    def _fork_class(self, metamodel):
+        '''
+        Create a copy of the metaclass in some other *metamodel*, without
+        instances or links. Attributes that user code has added to the class
+        are copied, except for referential attributes which are exposed
+        when associations are formalized in the other metamodel.
+        '''
+        metaclass = MetaClass(self.kind, metamodel, self.compact)
+        metaclass.attributes = list(self.attributes)
+        metaclass.attribute_map = dict(self.attribute_map)
+        metaclass.referential_attributes = set(self.referential_attributes)
+        metaclass.identifying_attributes = set(self.identifying_attributes)
+        metaclass.indices = dict(self.indices)
+
+        ignored = ('__dict__', '__weakref__', '__module__', '__doc__',
+                   '__metaclass__', '__slots__')
+        for clazz in reversed(self.clazz.__mro__):
+            if not issubclass(clazz, Class) or clazz is Class:
+                continue
+
+            for name, value in clazz.__dict__.items():
+                if name in ignored or name in self.referential_attributes:
+                    continue
+
+                if isinstance(value, types.MemberDescriptorType):
+                    continue
+
+                setattr(metaclass.clazz, name, value)
+
+        return metaclass
+
+    def _fork_instances(self, metaclass, mapping):
+        '''
+        Copy instances of the metaclass into some other *metaclass* previously
+        created by *_fork_class()*, and record the copy of each instance in a
+        *mapping*. Attribute values are copied as is, without invoking any
+        setters.
+        '''
+        slots = self.clazz.__dict__.get('__slots__')
+        if slots is not None and '__slots__' not in metaclass.clazz.__dict__:
+            metaclass.clazz = type(str(self.kind), (metaclass.clazz,),
+                                   dict(__slots__=slots))
+
+        clazz = metaclass.clazz
+        descriptors = [(self.clazz.__dict__[name], clazz.__dict__[name])
+                       for name in slots or ()]
+        
+        instances = list()
+        for inst in self.storage:
+            other = clazz.__new__(clazz)
+            other.__dict__.update(inst.__dict__)
+            for descriptor, other_descriptor in descriptors:
+                try:
+                    other_descriptor.__set__(other, descriptor.__get__(inst))
+                except AttributeError:
+                    pass
+
+            mapping[inst] = other
+            instances.append(other)
+
+        metaclass.storage = xtuml.OrderedSet(instances)
+        metaclass.deferred = dict(((mapping[inst], name), value)
+                                  for (inst, name), value
+                                  in self.deferred.items())
+
+    def memory_usage(self):
+        '''
+        Estimate the amount of memory, in bytes, used by instances of the
+        metaclass. Memory used by attribute values is not included, nor is
+        the dictionary of compact instances.
+        '''
+        size = 0
+        for inst in self.storage:
+            size += sys.getsizeof(inst)
+            if not self.compact:
+                size += sys.getsizeof(inst.__dict__)
+
+        return size
+
     def clone(self, instance):
         '''
         Create a shallow clone of an *instance*.
@@ -650,10 +985,16 @@ class MetaClass(object):
         part of the metaclass, a *MetaException* is thrown.
         '''
         if instance in self.storage:
-            self.storage.remove(instance)
+            self.storage.discard(instance)
         else:
             raise DeleteException("Instance not found in the instance pool")
 
+        self.unindex_instance(instance)
+        self.record_change('delete', instance)
+        if self.deferred:
+            for name, _ in self.attributes:
+                self.deferred.pop((instance, name), None)
+
         if not disconnect:
             return
         
@@ -663,6 +1004,14 @@ class MetaClass(object):
         
             for other in link[instance]:
                 unrelate(instance, other, link.rel_id, link.phrase)
+
+    def delete_many(self, instances, disconnect=True):
+        '''
+        Delete several *instances* from the instance pool and optionally
+        *disconnect* them from any links they might be connected to.
+        '''
+        for instance in list(instances):
+            self.delete(instance, disconnect)
         
     def select_one(self, *args):
         '''
@@ -670,7 +1019,7 @@ class MetaClass(object):
         where_eq(), order_by() or filter functions may be passed as optional
         arguments.
         '''
-        s = apply_query_operators(self.storage, args)
+        s = self._select(args)
         return next(iter(s), None)
 
     def select_many(self, *args):
@@ -679,7 +1028,7 @@ class MetaClass(object):
         where_eq(), order_by() or filter functions may be passed as optional
         arguments.
         '''
-        s = apply_query_operators(self.storage, args)
+        s = self._select(args)
         if isinstance(s, QuerySet):
             return s
         else:
@@ -697,29 +1046,415 @@ class MetaClass(object):
         
         raise UnknownLinkException(self.kind, kind, rel_id, phrase)
     
+    def resolve_link(self, kind, rel_id, phrase=''):
+        '''
+        Obtain the links to navigate across in order to reach instances of
+        some *kind* across *rel_id* and *phrase*, i.e. a tuple containing
+        either a single link, or two links when navigating across an
+        associative class. Resolved links are kept until another link is
+        added to the metamodel.
+        '''
+        key = (kind, rel_id, phrase)
+        if key in self.resolved_links:
+            return self.resolved_links[key]
+
+        if isinstance(rel_id, int):
+            rel_id = 'R%d' % rel_id
+
+        ukey = (kind.upper(), rel_id, phrase)
+        if ukey in self.links:
+            links = (self.links[ukey],)
+        else:
+            links = self._find_assoc_links(kind, rel_id, phrase)
+
+        self._add_resolved_links(key, links)
+        return links
+
+    def _add_resolved_links(self, key, links):
+        if self.metamodel is not None:
+            self.metamodel.resolving_metaclasses.add(self)
+            
+        self.resolved_links[key] = links
+
+    def resolve_path(self, steps):
+        '''
+        Obtain a flat list of links to navigate across in order to follow a
+        sequence of navigation *steps*, each expressed as a tuple
+        (kind, rel_id, phrase).
+        '''
+        steps = tuple(steps)
+        if steps in self.resolved_links:
+            return self.resolved_links[steps]
+
+        metaclass = self
+        links = list()
+        for kind, rel_id, phrase in steps:
+            resolved = metaclass.resolve_link(kind, rel_id, phrase)
+            metaclass = resolved[-1].to_metaclass
+            links.extend(resolved)
+
+        self._add_resolved_links(steps, links)
+        return links
+
     def navigate(self, inst, kind, rel_id, phrase=''):
         '''
         Navigate across a link with some *rel_id* and *phrase* that yields
         instances of some *kind*.
         '''
-        key = (kind.upper(), rel_id, phrase)
-        if key in self.links:
-            link = self.links[key]
-            return link.navigate(inst)
+        links = self.resolve_link(kind, rel_id, phrase)
+        if len(links) == 1:
+            return links[0].navigate(inst)
         
-        link1, link2 = self._find_assoc_links(kind, rel_id, phrase)
+        link1, link2 = links
         inst_set = xtuml.OrderedSet()
         for inst in link1.navigate(inst):
             inst_set |= link2.navigate(inst)
         
         return inst_set
     
+    def _select(self, args):
+        '''
+        Apply query operators to the instance pool. A where-clause passed as
+        the first operator is answered by a hash index.
+        '''
+        if args and isinstance(args[0], WhereVector):
+            return apply_query_operators(self.query_columns(args[0]), args[1:])
+        elif args and isinstance(args[0], dict):
+            return apply_query_operators(self.query(args[0]), args[1:])
+        else:
+            return apply_query_operators(self.storage, args)
+
+    def _is_indexable(self, name):
+        '''
+        Determine if an attribute with a given *name* may be covered by a hash
+        index, i.e. if its value is stored on the instance itself rather than
+        computed by a property, e.g. a referential attribute.
+        '''
+        if name in self.referential_attributes:
+            return False
+
+        return not isinstance(getattr(self.clazz, name, None), property)
+
+    def _find_hash_index(self, names):
+        '''
+        Find a hash index that cover some of the attributes with given *names*.
+        Indices for unique identifiers are preferred, and created on demand
+        just like indices for any other combination of attributes.
+        '''
+        for identifier in self.indices.values():
+            identifier = [self.attribute_map.get(name.upper())
+                          for name in identifier]
+            identifier = tuple([attr[0] for attr in identifier
+                                if attr and self._is_indexable(attr[0])])
+            if identifier and set(identifier) <= names:
+                names = identifier
+                break
+        else:
+            names = tuple(sorted(names))
+
+        if names in self.hash_indices:
+            return self.hash_indices[names]
+
+        index = Index(names)
+        try:
+            for inst in self.storage:
+                index.add(inst, index.compute_key(inst))
+        except (AttributeError, TypeError):
+            return None
+
+        self.hash_indices[names] = index
+        return index
+
+    def drop_hash_indices(self, name=None):
+        '''
+        Drop hash indices that cover an attribute with a given *name*, or all
+        hash indices if no name is given.
+        '''
+        for names in list(self.hash_indices.keys()):
+            if name is None or name in names:
+                del self.hash_indices[names]
+
+        self.drop_columns(name)
+
+    def index_instance(self, instance, indices=None):
+        '''
+        Add an *instance* to some hash *indices*, or to all hash indices
+        maintained by the metaclass if none are given.
+        '''
+        if indices is None:
+            indices = list(self.hash_indices.values())
+
+        if not indices:
+            return
+
+        in_order = next(reversed(self.storage), None) is instance
+        for index in indices:
+            try:
+                index.add(instance, index.compute_key(instance), in_order)
+            except TypeError:
+                # unhashable values cannot be indexed
+                self.hash_indices.pop(index.names, None)
+
+    def unindex_instance(self, instance, name=None):
+        '''
+        Remove an *instance* from hash indices that cover an attribute with a
+        given *name*, or from all hash indices if no name is given. The indices
+        that the instance was removed from are returned.
+        '''
+        self.drop_columns(name)
+        indices = list()
+        for index in self.hash_indices.values():
+            if name is not None and name not in index.names:
+                continue
+
+            try:
+                key = index.compute_key(instance)
+            except (AttributeError, TypeError):
+                # the instance is not fully initialized yet
+                continue
+
+            if index.discard(instance, key):
+                indices.append(index)
+
+        return indices
+
+    def defer(self, instance, name, value):
+        '''
+        Defer the decoding of a *value* assigned to an attribute with some
+        *name* on an *instance* until the attribute is first accessed. The
+        value must provide a method *materialize()* that returns the decoded
+        value.
+        '''
+        self.deferred[(instance, name)] = value
+
+    def materialize(self, instance, name=None):
+        '''
+        Decode a deferred value of an attribute with a given *name* on an
+        *instance*, assign it to the instance and return it. If no name is
+        given, all deferred values of the instance are materialized.
+        '''
+        if name is None:
+            for name, _ in self.attributes:
+                if (instance, name) in self.deferred:
+                    self.materialize(instance, name)
+            return
+        
+        value = self.deferred.pop((instance, name), None)
+        if value is None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (
+                                 self.kind, name))
+        
+        value = value.materialize()
+        object.__setattr__(instance, name, value)
+        return value
+
+    def drop_referential_cache(self, instance=None, names=None):
+        '''
+        Drop cached values of referential attributes with some *names* on an
+        *instance*, and of referential attributes on other instances that
+        depend on them, e.g. when the instance is related or its identifying
+        attributes are written. If no instance is given, all cached values
+        are dropped.
+
+        Dependents are followed transitively, but only through values that
+        are cached. Since a referential attribute is obtained from the
+        attribute it refers to, a value derived from an attribute that is not
+        cached cannot be cached either.
+        '''
+        cache = self.referential_cache
+        if instance is None:
+            cache.clear()
+            return
+
+        if not cache and self.metamodel is not None:
+            return
+        
+        values = cache.get(instance)
+        stack = list()
+        for name in names:
+            if values:
+                values.pop(name, None)
+            stack.append((instance, name))
+            
+        while stack:
+            inst, name = stack.pop()
+            for link in get_metaclass(inst).links.values():
+                cache = link.to_metaclass.referential_cache
+                for other_name, ref_name in link.key_map.items():
+                    if ref_name != name:
+                        continue
+                    
+                    for other in link.get(inst, ()):
+                        values = cache.get(other)
+                        if values and other_name in values:
+                            del values[other_name]
+                            stack.append((other, other_name))
+
+    def record_change(self, *entry):
+        '''
+        Record a change to the metamodel in its journal, if changes are
+        being tracked, see *MetaModel.incremental_check()*. The change is
+        also tracked for *xtuml.persist_delta()*, see *track_change()*.
+        '''
+        metamodel = self.metamodel
+        if metamodel is None:
+            return
+        
+        if metamodel.journal is not None:
+            metamodel.journal.append(entry)
+
+        if metamodel.changes is None:
+            return
+        
+        if entry[0] == 'create':
+            self.track_change(entry[1], created=True)
+        elif entry[0] == 'link':
+            self.track_change(entry[2])
+            names = set(entry[1].key_map.values())
+            if names & self.referential_attributes:
+                self.track_dependents(entry[2])
+        else:
+            self.track_change(entry[1])
+            self.track_dependents(entry[1])
+
+    def track_change(self, instance, created=False):
+        '''
+        Record the state of an *instance* that is about to change, or was
+        just *created*, in the change log of the metamodel. Only the first
+        change since the latest checkpoint is recorded, and only if changes
+        are being tracked, see *MetaModel.checkpoint()*.
+        '''
+        metamodel = self.metamodel
+        if metamodel is None or metamodel.changes is None:
+            return
+        
+        if instance in metamodel.touched:
+            return
+
+        metamodel.touched.add(instance)
+        if created:
+            metamodel.changes.append((instance, None))
+        else:
+            row = xtuml.serialize_instance(instance)
+            metamodel.changes.append((instance, row))
+
+    def track_dependents(self, instance):
+        '''
+        Record the state of instances whose referential attributes depend on
+        the identifying attributes of an *instance* that is about to change,
+        or to be deleted, see *track_change()*. Dependents are followed
+        transitively through referential attributes that are themselves
+        identifying.
+        '''
+        visited = set([instance])
+        stack = [instance]
+        while stack:
+            inst = stack.pop()
+            for link in get_metaclass(inst).links.values():
+                metaclass = link.to_metaclass
+                names = set(link.key_map.keys())
+                if not names & metaclass.referential_attributes:
+                    continue
+
+                for other in link.get(inst, ()):
+                    if other in visited:
+                        continue
+                    
+                    visited.add(other)
+                    metaclass.track_change(other)
+                    if names & metaclass.identifying_attributes:
+                        stack.append(other)
+
+    def drop_columns(self, name=None):
+        '''
+        Drop the cached column of an attribute with a given *name*, or all
+        cached columns if no name is given.
+        '''
+        if name is None:
+            self.columns.clear()
+            self.column_rows = None
+        else:
+            self.columns.pop(name, None)
+
+    def column(self, name):
+        '''
+        Obtain a list of the values of an attribute with a given *name*, one
+        value per instance in the instance pool. The instances are available
+        in the same order from *column_rows*.
+
+        Columns of attributes stored on the instances are cached until the
+        attribute is written, or instances are created or deleted.
+        '''
+        attr = self.attribute_map.get(name.upper())
+        if attr is not None:
+            name = attr[0]
+
+        if self.column_rows is None:
+            self.columns.clear()
+            self.column_rows = list(self.storage)
+
+        if name in self.columns:
+            return self.columns[name]
+
+        column = [getattr(inst, name) for inst in self.column_rows]
+        if attr is not None and self._is_indexable(name):
+            self.columns[name] = column
+
+        return column
+
+    def query_columns(self, where_clause):
+        '''
+        Query the instance pool for instances with attributes that satisfy a
+        *where clause* created by where_vec(). Each predicate is evaluated
+        over a whole column at once.
+        '''
+        mask = None
+        for name, op, value in where_clause.predicates():
+            column = self.column(name)
+            try:
+                selectors = [op(v, value) for v in column]
+            except TypeError:
+                selectors = [WhereVector.apply(op, v, value) for v in column]
+
+            if mask is None:
+                mask = selectors
+            else:
+                mask = list(map(operator.and_, mask, selectors))
+
+        if mask is None:
+            return QuerySet(self.storage)
+
+        return QuerySet(itertools.compress(self.column_rows, mask))
+
     def query(self, dictonary_of_values):
         '''
         Query the instance pool for instances with attributes that match a given
         *dictonary of values*.
         '''
-        return WhereEqual(dictonary_of_values)(self.storage)
+        values = dict()
+        other_values = dict()
+        for name, value in dictonary_of_values.items():
+            attr = self.attribute_map.get(name.upper())
+            if attr and attr[0] not in values and self._is_indexable(attr[0]):
+                values[attr[0]] = value
+            else:
+                other_values[name] = value
+
+        index = values and self._find_hash_index(set(values))
+        if not index:
+            return WhereEqual(dictonary_of_values)(self.storage)
+
+        key = tuple([values.pop(name) for name in index.names])
+        try:
+            s = index.lookup(key, self.storage)
+        except TypeError:
+            return WhereEqual(dictonary_of_values)(self.storage)
+
+        other_values.update(values)
+        if other_values:
+            return WhereEqual(other_values)(s)
+        else:
+            return s
     
 
 class NavChain(object):
@@ -732,7 +1467,14 @@ class NavChain(object):
     or using an OAL/RSL inspired syntax:
     
        res = NavChain(inst).X[100, 'phrase'].Y[101](lamda x: <filter expression>)
+
+    The navigation is performed when the chain is invoked, one step at a
+    time where each step navigates from all instances reached by the
+    previous step.
     '''
+    handle = None
+    steps = None
+    _kind = None
     
     def __init__(self, handle):
         if handle is None:
@@ -745,21 +1487,79 @@ class NavChain(object):
             raise MetaException("Unable to navigate across '%s'" % type(handle))
         
         self.handle = handle
+        self.steps = list()
         self._kind = None
         
     def nav(self, kind, relid, phrase=''):
-        self.handle = NavChain._nav(self.handle, kind, relid, phrase)
+        self.steps.append((kind, relid, phrase))
         return self
     
+    @staticmethod
+    def _resolve(inst, kind, rel_id, phrase):
+        '''
+        Resolve the links to navigate across from an instance *inst*.
+        '''
+        metaclass = get_metaclass(inst)
+        return type(inst), metaclass.resolve_link(kind, rel_id, phrase)
+
     @staticmethod
     def _nav(handle, kind, rel_id, phrase):
-        if isinstance(rel_id, int):
-            rel_id = 'R%d' % rel_id
-    
-        for inst in iter(handle):
-            metaclass = get_metaclass(inst)
-            for result in metaclass.navigate(inst, kind, rel_id, phrase):
-                yield result
+        '''
+        Navigate from all instances in *handle* and return an ordered set of
+        the instances reached.
+        '''
+        inst_set = xtuml.OrderedSet()
+        clazz = None
+        for inst in handle:
+            if type(inst) is not clazz:
+                clazz, links = NavChain._resolve(inst, kind, rel_id, phrase)
+                
+            others = links[0].get(inst)
+            if not others:
+                continue
+            
+            if len(links) == 1:
+                inst_set |= others
+                continue
+            
+            for other in others:
+                others = links[1].get(other)
+                if others:
+                    inst_set |= others
+
+        return inst_set
+
+    @staticmethod
+    def _iter_nav(handle, kind, rel_id, phrase):
+        '''
+        Navigate lazily from instances in *handle* and yield the instances
+        reached, without duplicates.
+        '''
+        seen = set()
+        clazz = None
+        for inst in handle:
+            if type(inst) is not clazz:
+                clazz, links = NavChain._resolve(inst, kind, rel_id, phrase)
+
+            others = links[0].get(inst) or ()
+            if len(links) == 2:
+                others = (another for other in others
+                          for another in links[1].get(other) or ())
+            
+            for other in others:
+                if other not in seen:
+                    seen.add(other)
+                    yield other
+
+    def _navigate(self):
+        '''
+        Navigate all steps in the chain and return the instances reached.
+        '''
+        handle = self.handle
+        for kind, rel_id, phrase in self.steps:
+            handle = NavChain._nav(handle, kind, rel_id, phrase)
+            
+        return handle
             
     def __getattr__(self, kind):
         '''
@@ -788,7 +1588,7 @@ class NavChain(object):
 
         >>> chain(lambda selected: selected.Name == 'test')
         '''
-        handle = self.handle or list()
+        handle = self._navigate()
         handle = apply_query_operators(handle, args)
         if isinstance(handle, QuerySet):
             return handle
@@ -799,13 +1599,143 @@ class NavChain(object):
 class NavOneChain(NavChain):
     '''
     A navigation chain that yeilds an instance, or None.
+
+    The steps in the chain are navigated lazily, i.e. the navigation stops
+    as soon as an instance is found.
     '''
+    def _navigate(self):
+        handle = self.handle
+        for kind, rel_id, phrase in self.steps:
+            handle = NavChain._iter_nav(handle, kind, rel_id, phrase)
+            
+        return handle
+    
     def __call__(self, *args):
-        handle = self.handle or list()
+        handle = self._navigate()
         handle = apply_query_operators(handle, args)
         return next(iter(handle), None)
 
 
+class NavPath(object):
+    '''
+    A navigation path is a sequence of navigation steps, each expressed as a
+    tuple (kind, rel_id, phrase), that may be applied repeatedly to instances
+    or sets of instances. The links to navigate across are resolved once per
+    metaclass of the instances the path is applied to.
+    '''
+    steps = None
+
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self.steps))
+
+    def resolve(self, metaclass):
+        '''
+        Obtain the links to navigate across from instances of a *metaclass*.
+        '''
+        return metaclass.resolve_path(self.steps)
+
+    def navigate(self, instance_or_set):
+        '''
+        Navigate the path from an instance, or a set of instances, and return
+        a sequence of the instances at the end of the path.
+        '''
+        if instance_or_set is None:
+            return
+        
+        if isinstance(instance_or_set, Class):
+            instance_or_set = [instance_or_set]
+
+        metaclass = None
+        visited = dict()
+        for inst in instance_or_set:
+            if get_metaclass(inst) is not metaclass:
+                metaclass = get_metaclass(inst)
+                links = self.resolve(metaclass)
+                seen = visited.setdefault(metaclass, set())
+            
+            depth = len(links)
+            stack = [iter((inst,))]
+            while stack:
+                try:
+                    inst = next(stack[-1])
+                except StopIteration:
+                    stack.pop()
+                    continue
+                
+                level = len(stack) - 1
+                if (level, inst) in seen:
+                    continue
+                
+                seen.add((level, inst))
+                if level == depth:
+                    yield inst
+
+                elif inst in links[level]:
+                    stack.append(iter(links[level][inst]))
+
+    def __call__(self, instance_or_set, *args):
+        '''
+        Navigate the path from an instance, or a set of instances. Query
+        operators such as where_eq(), order_by() or filter functions may be
+        passed as optional arguments.
+        '''
+        handle = apply_query_operators(self.navigate(instance_or_set), args)
+        if isinstance(handle, QuerySet):
+            return handle
+        else:
+            return QuerySet(handle)
+
+    def one(self, instance_or_set, *args):
+        '''
+        Navigate the path from an instance, or a set of instances, and return
+        an instance, or None.
+        '''
+        handle = apply_query_operators(self.navigate(instance_or_set), args)
+        return next(iter(handle), None)
+
+
+_path_regexp = re.compile(r'''^\s*(\w+)\s*\[\s*[rR]?(\d+)\s*'''
+                          r'''(?:[.,]\s*['"](.*)['"]\s*)?\]\s*$''')
+
+
+def compile_path(*steps):
+    '''
+    Compile a navigation path from a sequence of *steps* that may be applied
+    repeatedly to instances or sets of instances. Each step is either a
+    tuple (kind, rel_id, phrase), or a string using an OAL inspired syntax.
+    
+    Usage example:
+    
+    >>> m = xtuml.load_metamodel('db.sql')
+    >>> path = xtuml.compile_path('O_OBJ[102]', 'O_ATTR[102]')
+    >>> for o_attr in m.select_many('O_ATTR'):
+    ...     other_o_attrs = path(o_attr)
+    
+    Phrases are given in quotes, e.g. "ACT_SMT[R661.'precedes']".
+    '''
+    res = list()
+    for step in steps:
+        if isinstance(step, tuple):
+            kind, rel_id, phrase = (step + ('',))[:3]
+        else:
+            match = _path_regexp.match(step)
+            if match is None:
+                raise MetaException("Invalid navigation step '%s'" % step)
+            
+            kind, rel_id, phrase = match.groups()
+            rel_id = int(rel_id)
+
+        if isinstance(rel_id, int):
+            rel_id = 'R%d' % rel_id
+            
+        res.append((kind, rel_id.upper(), phrase or ''))
+        
+    return NavPath(res)
+
+
 def navigate_one(instance):
     '''
     Initialize a navigation from one *instance* to another across a one-to-one
@@ -892,6 +1822,75 @@ class WhereEqual(dict):
                 yield inst
 
 
+class WhereVector(dict):
+    '''
+    Helper class to create a set of predicates for queries using python
+    keyword arguments to *where_vec()*.
+    '''
+    operators = {
+        'eq': operator.eq,
+        'ne': operator.ne,
+        'lt': operator.lt,
+        'le': operator.le,
+        'gt': operator.gt,
+        'ge': operator.ge,
+        'in': lambda x, y: x in y,
+    }
+
+    def predicates(self):
+        '''
+        Obtain a list of predicates expressed as (name, operator, value)
+        tuples.
+        '''
+        res = list()
+        for key, value in self.items():
+            name, _, op_name = key.partition('__')
+            if op_name not in self.operators:
+                name, op_name = key, 'eq'
+
+            res.append((name, self.operators[op_name], value))
+
+        return res
+
+    @staticmethod
+    def apply(op, x, y):
+        '''
+        Apply an operator to *x* and *y*, where comparisons against null
+        values, i.e. None, do not match.
+        '''
+        try:
+            return bool(op(x, y))
+        except TypeError:
+            return False
+
+    def __call__(self, s):
+        predicates = self.predicates()
+        for inst in iter(s):
+            for name, op, value in predicates:
+                if not self.apply(op, getattr(inst, name), value):
+                    break
+            else:
+                yield inst
+
+
+def where_vec(**kwargs):
+    '''
+    Return a where-clause that filters out instances based on named
+    keywords. A keyword is an attribute name, optionally followed by two
+    underscores and one of the operators eq, ne, lt, le, gt, ge or in.
+
+    When used as the first query operator on a class, the predicates are
+    evaluated over whole attribute columns rather than instance by instance.
+
+    Usage example:
+
+    >>> from xtuml import where_vec
+    >>> m = xtuml.load_metamodel('db.sql')
+    >>> inst_set = m.select_many('R_REL', where_vec(Numb__gt=100))
+    '''
+    return WhereVector(kwargs)
+
+
 def where_eq(**kwargs):
     '''
     Return a where-clause that filters out instances based on named 
@@ -967,6 +1966,14 @@ def _find_link(inst1, inst2, rel_id, phrase):
     if isinstance(rel_id, int):
         rel_id = 'R%d' % rel_id
         
+    key = (metaclass1.kind, metaclass2.kind, rel_id, phrase)
+    if key in metaclass1.metamodel.link_index:
+        ass, reverse = metaclass1.metamodel.link_index[key]
+        if reverse:
+            return inst2, inst1, ass
+        else:
+            return inst1, inst2, ass
+        
     for ass in metaclass1.metamodel.associations:
         if ass.rel_id != rel_id:
             continue
@@ -1007,6 +2014,41 @@ def relate(from_instance, to_instance, rel_id, phrase=''):
     return True
 
 
+def relate_many(pairs, rel_id, phrase=''):
+    '''
+    Relate several *pairs* of instances, each expressed as a tuple
+    (from_instance, to_instance), across *rel_id*. The association is looked
+    up once per kind of instances rather than once per pair. Pairs that
+    contain None are ignored. The number of related pairs will be returned.
+    '''
+    count = 0
+    kinds = None
+    for from_instance, to_instance in pairs:
+        if None in [from_instance, to_instance]:
+            continue
+
+        if (type(from_instance), type(to_instance)) != kinds:
+            kinds = (type(from_instance), type(to_instance))
+            inst1, inst2, ass = _find_link(from_instance, to_instance,
+                                           rel_id, phrase)
+            reverse = inst1 is not from_instance
+            
+        if reverse:
+            inst1, inst2 = to_instance, from_instance
+        else:
+            inst1, inst2 = from_instance, to_instance
+            
+        if not ass.source_link.connect(inst1, inst2):
+            raise RelateException(from_instance, to_instance, rel_id, phrase)
+
+        if not ass.target_link.connect(inst2, inst1):
+            raise RelateException(from_instance, to_instance, rel_id, phrase)
+
+        count += 1
+        
+    return count
+
+
 def unrelate(from_instance, to_instance, rel_id, phrase=''):
     '''
     Unrelate *from_instance* from *to_instance* across *rel_id*. For reflexive
@@ -1130,19 +2172,41 @@ class MetaModel(object):
     '''
     metaclasses = None
     associations = None
+    link_index = None
+    resolving_metaclasses = None
+    referential_cache = None
+    journal = None
+    changes = None
+    touched = None
+    checker = None
     id_generator = None
+    compact = False
     
-    def __init__(self, id_generator=None):
+    def __init__(self, id_generator=None, compact=False):
         '''
         Create a new, empty metamodel. Optionally, specify an id generator
-        used to obtain unique identifiers.
+        used to obtain unique identifiers, and if instances shall be stored
+        in a *compact* form, see *xtuml.MetaClass*.
         '''
         if id_generator is None:
             id_generator = xtuml.UUIDGenerator()
         
-        self.metaclasses = dict()
+        self.metaclasses = collections.OrderedDict()
         self.associations = list()
+        self.link_index = dict()
+        self.resolving_metaclasses = set()
+        self.referential_cache = weakref.WeakKeyDictionary()
         self.id_generator = id_generator
+        self.compact = compact
+
+    def memory_usage(self):
+        '''
+        Estimate the amount of memory, in bytes, used by instances in the
+        metamodel. The estimate is returned as a dictionary keyed by the kind
+        of each metaclass.
+        '''
+        return dict((metaclass.kind, metaclass.memory_usage())
+                    for metaclass in self.metaclasses.values())
     
     @property
     def instances(self):
@@ -1161,7 +2225,7 @@ class MetaModel(object):
         if ukind in self.metaclasses:
             raise MetaModelException('A class with the name %s is already defined' % kind)
 
-        metaclass = MetaClass(kind, self)
+        metaclass = MetaClass(kind, self, self.compact)
         for name, ty in attributes:
             metaclass.append_attribute(name, ty)
             
@@ -1206,6 +2270,75 @@ class MetaModel(object):
         metaclass = get_metaclass(instance)
         metaclass = self.find_metaclass(metaclass.kind)
         return metaclass.clone(instance)
+
+    def fork(self, id_generator=None):
+        '''
+        Create an independent copy of the metamodel, i.e. its classes,
+        associations, instances and the connections between them. Attribute
+        values are shared by instances in both metamodels, but are neither
+        deserialized nor computed again. Optionally, specify an *id generator*
+        to be used by the copy, by default a copy of the id generator of the
+        metamodel in its current state is used.
+        
+        Usage example:
+        
+        >>> base = xtuml.load_metamodel('db.sql')
+        >>> m1 = base.fork()
+        >>> m2 = base.fork()
+        '''
+        if id_generator is None:
+            id_generator = copy.copy(self.id_generator)
+            
+        metamodel = MetaModel(id_generator, self.compact)
+        for ukind, metaclass in self.metaclasses.items():
+            metamodel.metaclasses[ukind] = metaclass._fork_class(metamodel)
+
+        for ass in self.associations:
+            source_link = ass.source_link
+            target_link = ass.target_link
+            other = metamodel.define_association(ass.rel_id,
+                                                 source_link.kind,
+                                                 ass.source_keys,
+                                                 source_link.many,
+                                                 source_link.conditional,
+                                                 target_link.phrase,
+                                                 target_link.kind,
+                                                 ass.target_keys,
+                                                 target_link.many,
+                                                 target_link.conditional,
+                                                 source_link.phrase)
+            if ass.formalized:
+                other.formalize()
+                
+        mapping = dict()
+        for ukind, metaclass in self.metaclasses.items():
+            metaclass._fork_instances(metamodel.metaclasses[ukind], mapping)
+
+        for ukind, metaclass in self.metaclasses.items():
+            other_metaclass = metamodel.metaclasses[ukind]
+            for key, link in metaclass.links.items():
+                other_link = other_metaclass.links.get(key)
+                if other_link is None:
+                    to_metaclass = metamodel.metaclasses[key[0]]
+                    other_link = other_metaclass.add_link(to_metaclass,
+                                                          link.rel_id,
+                                                          link.phrase,
+                                                          link.conditional,
+                                                          link.many)
+                    other_link.key_map = dict(link.key_map)
+                    
+                for inst, others in link.items():
+                    other_link[mapping[inst]] = xtuml.OrderedSet([mapping[o]
+                                                                  for o in others])
+        return metamodel
+
+    def delete_many(self, instances, disconnect=True):
+        '''
+        Delete several *instances* from the metamodel and optionally
+        *disconnect* them from any links they might be connected to.
+        '''
+        for instance in list(instances):
+            delete(instance, disconnect)
             
     def define_association(self, rel_id, source_kind, source_keys, source_many,
                            source_conditional, source_phrase, target_kind, 
@@ -1239,6 +2372,11 @@ class MetaModel(object):
         target_link.key_map = dict(zip(target_keys, source_keys))
         
         self.associations.append(ass)
+        
+        for link, reverse in [(source_link, False), (target_link, True)]:
+            key = (link.from_metaclass.kind, link.to_metaclass.kind, rel_id,
+                   link.phrase)
+            self.link_index.setdefault(key, (ass, reverse))
 
         return ass
         
@@ -1297,4 +2435,48 @@ class MetaModel(object):
         
         return xtuml.check_uniqueness_constraint(self) == 0
 
+    def checkpoint(self):
+        '''
+        Start tracking changes to instances in the metamodel, unless already
+        tracked, and return a checkpoint that identifies the current state of
+        the instances. Changes made after a checkpoint may be persisted by
+        *xtuml.persist_delta()*.
+        
+        Usage example:
+        
+        >>> m = xtuml.load_metamodel('db.sql')
+        >>> checkpoint = m.checkpoint()
+        >>> m.new('X')
+        >>> xtuml.persist_delta(m, 'delta.sql', since=checkpoint)
+        '''
+        if self.changes is None:
+            self.changes = list()
+            
+        self.touched = set()
+        return len(self.changes)
+
+    def stop_tracking(self):
+        '''
+        Stop tracking changes to instances in the metamodel, and discard the
+        changes recorded so far. Checkpoints previously obtained from
+        *checkpoint()* are no longer valid.
+        '''
+        self.changes = None
+        self.touched = None
+    
+    def incremental_check(self):
+        '''
+        Check the metamodel for integrity violations, and return the number
+        of violations found. The first check covers the entire metamodel and
+        starts tracking changes in a *journal*. Subsequent checks only
+        re-validate instances and links affected by changes since the
+        previous check.
+        '''
+        if self.checker is None:
+            self.checker = xtuml.IncrementalChecker(self)
+        else:
+            self.checker.update()
+
+        return self.checker.violations
+
                 
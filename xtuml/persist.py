@@ -22,6 +22,8 @@ to disk.
 
 import uuid
 import logging
+import operator
+import multiprocessing
 
 import xtuml
 
@@ -29,67 +31,232 @@ import xtuml
 logger = logging.getLogger(__name__)
 
 
+_null_values = {
+    'BOOLEAN'   : False,
+    'INTEGER'   : 0,
+    'REAL'      : 0.0,
+    'STRING'    : '',
+    'UNIQUE_ID' : 0
+}
+
+
+def _serialize_unique_id(value):
+    '''
+    Serialize a unique id, an integer, in the canonical form of a uuid.
+    '''
+    if value.__class__ is not int or not 0 <= value < 1 << 128:
+        return '"%s"' % uuid.UUID(int=value)
+    
+    h = '%032x' % value
+    return '"%s-%s-%s-%s-%s"' % (h[:8], h[8:12], h[12:16], h[16:20], h[20:])
+
+
+_transfer_fns = {
+    'BOOLEAN'     : lambda v: '%d' % int(v),
+    'INTEGER'     : lambda v: '%d' % v,
+    'REAL'        : lambda v: '%f' % v,
+    'STRING'      : lambda v: "'%s'" % v.replace("'", "''"),
+    'UNIQUE_ID'   : _serialize_unique_id
+}
+
+
 def serialize_value(value, ty):
     '''
     Serialize a value from an xtuml metamodel instance.
     '''
     ty = ty.upper()
     
-    null_value = {
-        'BOOLEAN'   : False,
-        'INTEGER'   : 0,
-        'REAL'      : 0.0,
-        'STRING'    : '',
-        'UNIQUE_ID' : 0
-    }
+    if value is None:
+        value = _null_values[ty]
     
-    transfer_fn = {
-        'BOOLEAN'     : lambda v: '%d' % int(v),
-        'INTEGER'     : lambda v: '%d' % v,
-        'REAL'        : lambda v: '%f' % v,
-        'STRING'      : lambda v: "'%s'" % v.replace("'", "''"),
-        'UNIQUE_ID'   : lambda v: '"%s"' % uuid.UUID(int=v)
-    }
+    return _transfer_fns[ty](value)
 
-    if value is None:
-        value = null_value[ty]
+
+def _encoder(ty):
+    '''
+    Create a function that serializes values of some type, including None.
+    '''
+    ty = ty.upper()
+    fn = _transfer_fns[ty]
+    null = fn(_null_values[ty])
+    return lambda value: null if value is None else fn(value)
+
+
+def _compile_format(kind, attributes):
+    '''
+    Compile a format string for rows of instances of a class of some *kind*
+    with a list of *attributes*, and one encoder per attribute.
+    '''
+    encoders = tuple([_encoder(ty) for _, ty in attributes])
+    escape = lambda s: str(s).replace('%', '%%')
+    
+    fmt = ['INSERT INTO %s VALUES (' % escape(kind)]
+    last = len(attributes) - 1
+    for idx, (name, ty) in enumerate(attributes):
+        if idx < last:
+            fmt.append('\n    %%s, -- %s : %s' % (escape(name), escape(ty)))
+        else:
+            fmt.append('\n    %%s -- %s : %s' % (escape(name), escape(ty)))
+    fmt.append('\n);\n')
+
+    return ''.join(fmt), encoders
+
+
+def _row_getter(names):
+    '''
+    Create a function that obtain the values of attributes with some *names*
+    from an instance, as a tuple.
+    '''
+    if len(names) == 1:
+        getter = operator.attrgetter(*names)
+        return lambda inst: (getter(inst),)
     
-    return transfer_fn[ty](value)
+    if names and not any('.' in name for name in names):
+        return operator.attrgetter(*names)
     
+    return lambda inst: tuple([getattr(inst, name) for name in names])
+
+
+def compile_row_formatter(metaclass):
+    '''
+    Compile a function that serializes instances of a *metaclass*. The row
+    is formatted by a format string, with values serialized by one encoder
+    per attribute.
+    '''
+    names = [name for name, _ in metaclass.attributes]
+    fmt, encoders = _compile_format(metaclass.kind, metaclass.attributes)
+
+    if len(names) == 1:
+        encoder = encoders[0]
+        getter = operator.attrgetter(*names)
+        return lambda inst: fmt % encoder(getter(inst))
     
+    getter = _row_getter(names)
+    return lambda inst: fmt % tuple([encoder(value) for encoder, value
+                                     in zip(encoders, getter(inst))])
+
+
+def row_formatter(metaclass):
+    '''
+    Obtain a function that serializes instances of a *metaclass*. The
+    function is compiled once, and kept until the attributes of the
+    metaclass change.
+    '''
+    fn = metaclass.row_formatter
+    if fn is None:
+        fn = metaclass.row_formatter = compile_row_formatter(metaclass)
+        
+    return fn
+
+
 def serialize_instance(instance):
     '''
     Serialize an *instance* from a metamodel.
     '''
-    attr_count = 0
-    metaclass = xtuml.get_metaclass(instance)
-    s = 'INSERT INTO %s VALUES (' % metaclass.kind
-    for name, ty in metaclass.attributes:
-        value = getattr(instance, name)
-            
-        s += '\n    '
-        s += serialize_value(value, ty)
+    return row_formatter(xtuml.get_metaclass(instance))(instance)
 
-        attr_count += 1
-        if attr_count < len(metaclass.attributes):
-            s += ', -- %s : %s' % (name, ty)
-        else:
-            s += ' -- %s : %s' % (name, ty)
 
-    s += '\n);\n'
+def iter_serialize_instances(metamodel):
+    '''
+    Serialize all instances in a *metamodel*, and yield them one at a time.
+    '''
+    for metaclass in metamodel.metaclasses.values():
+        if not metaclass.storage:
+            continue
+        
+        fn = row_formatter(metaclass)
+        for inst in metaclass.storage:
+            yield fn(inst)
 
-    return s
+
+_formats = dict()
+
+
+def _serialize_rows(task):
+    '''
+    Serialize *rows* of attribute values described by a *task*, i.e. a tuple
+    containing a class kind, its attributes and the rows. Used by worker
+    processes when instances are serialized in parallel.
+    '''
+    kind, attributes, rows = task
+    key = (kind, attributes)
+    entry = _formats.get(key)
+    if entry is None:
+        entry = _formats[key] = _compile_format(kind, attributes)
+
+    fmt, encoders = entry
+    return ''.join([fmt % tuple([encoder(value) for encoder, value
+                                 in zip(encoders, row)])
+                    for row in rows])
+
+
+def _iter_serialize_tasks(metamodel, chunk_size):
+    '''
+    Partition instances in a *metamodel* into tasks of at most *chunk_size*
+    rows of attribute values each, see *_serialize_rows()*.
+    '''
+    for metaclass in metamodel.metaclasses.values():
+        if not metaclass.storage:
+            continue
+
+        attributes = tuple([(str(name), str(ty))
+                            for name, ty in metaclass.attributes])
+        getter = _row_getter([name for name, _ in attributes])
+        rows = list()
+        for inst in metaclass.storage:
+            rows.append(getter(inst))
+            if len(rows) >= chunk_size:
+                yield metaclass.kind, attributes, rows
+                rows = list()
+
+        if rows:
+            yield metaclass.kind, attributes, rows
+
+
+def iter_serialize_instances_parallel(metamodel, processes=None,
+                                      chunk_size=5000):
+    '''
+    Serialize all instances in a *metamodel* in a number of worker
+    *processes*, by default one per core, and yield them in chunks. Instances
+    are partitioned into tasks of at most *chunk_size* instances of one
+    class, and the chunks are yielded in the same order as by
+    *iter_serialize_instances()*.
+    '''
+    processes = processes or multiprocessing.cpu_count()
+    if processes < 2:
+        for s in iter_serialize_instances(metamodel):
+            yield s
+        return
+    
+    pool = multiprocessing.Pool(processes)
+    try:
+        for s in pool.imap(_serialize_rows,
+                           _iter_serialize_tasks(metamodel, chunk_size)):
+            yield s
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _iter_instances(metamodel, processes):
+    '''
+    Serialize all instances in a *metamodel*, in a number of worker
+    *processes* unless only one is requested.
+    '''
+    if processes == 1:
+        return iter_serialize_instances(metamodel)
+
+    return iter_serialize_instances_parallel(metamodel, processes)
 
 
 def serialize_instances(metamodel):
     '''
     Serialize all instances in a *metamodel*.
     '''
-    s = ''
-    for inst in metamodel.instances:
-        s += serialize_instance(inst)
-    
-    return s
+    return ''.join(iter_serialize_instances(metamodel))
 
 
 def serialize_association(ass):
@@ -128,33 +295,64 @@ def serialize_class(Cls):
 
     return s
 
-def serialize_unique_identifiers(metamodel):
-    s = ''
-    
+
+def _serialize_indices(metaclass):
+    '''
+    Serialize the unique identifiers of a *metaclass*.
+    '''
+    s = list()
+    for index_name, attribute_names in metaclass.indices.items():
+        attribute_names = ', '.join(attribute_names)
+        s.append('CREATE UNIQUE INDEX %s ON %s (%s);\n' % (index_name,
+                                                           metaclass.kind,
+                                                           attribute_names))
+    return ''.join(s)
+
+
+def iter_serialize_unique_identifiers(metamodel):
+    '''
+    Serialize all unique identifiers in a *metamodel*, and yield them one
+    class at a time.
+    '''
     for metaclass in metamodel.metaclasses.values():
-        for index_name, attribute_names in metaclass.indices.items():
-            attribute_names = ', '.join(attribute_names)
-            s += 'CREATE UNIQUE INDEX %s ON %s (%s);\n' % (index_name,
-                                                          metaclass.kind,
-                                                          attribute_names)
-    return s
+        yield _serialize_indices(metaclass)
+
+        
+def serialize_unique_identifiers(metamodel):
+    return ''.join(iter_serialize_unique_identifiers(metamodel))
 
 
+def iter_serialize_classes(metamodel):
+    '''
+    Serialize all class definitions in a *metamodel*, and yield them one at
+    a time.
+    '''
+    for kind in sorted(metamodel.metaclasses.keys()):
+        yield serialize_class(metamodel.metaclasses[kind].clazz)
+
+        
 def serialize_classes(metamodel):
     '''
     Serialize all class definitions in a *metamodel*.
     '''
-    return ''.join([serialize_class(metamodel.metaclasses[kind].clazz)
-                    for kind in sorted(metamodel.metaclasses.keys())])
+    return ''.join(iter_serialize_classes(metamodel))
 
 
+def iter_serialize_associations(metamodel):
+    '''
+    Serialize all association definitions in a *metamodel*, and yield them
+    one at a time.
+    '''
+    orderby = lambda x: x.rel_id
+    for ass in sorted(metamodel.associations, key=orderby):
+        yield serialize_association(ass)
+
+        
 def serialize_associations(metamodel):
     '''
     Serialize all association definitions in a *metamodel*.
     '''
-    orderby = lambda x: x.rel_id
-    return ''.join([serialize_association(ass)
-                    for ass in sorted(metamodel.associations, key=orderby)])
+    return ''.join(iter_serialize_associations(metamodel))
 
 
 def serialize_schema(metamodel):
@@ -164,16 +362,50 @@ def serialize_schema(metamodel):
     return serialize_classes(metamodel) + serialize_associations(metamodel)
 
 
+def iter_serialize_database(metamodel):
+    '''
+    Serialize all class definitions, association definitions, instances and
+    unique identifiers in a *metamodel*, and yield them in chunks.
+    '''
+    for s in iter_serialize_classes(metamodel):
+        yield s
+        
+    for s in iter_serialize_associations(metamodel):
+        yield s
+        
+    for s in iter_serialize_instances(metamodel):
+        yield s
+        
+    for s in iter_serialize_unique_identifiers(metamodel):
+        yield s
+
+
 def serialize_database(metamodel):
     '''
     Serialize all instances, class definitions, association definitions, and
     unique identifiers  in a *metamodel*.
     '''
-    schema = serialize_schema(metamodel)
-    instances = serialize_instances(metamodel)
-    identifiers = serialize_unique_identifiers(metamodel)
+    return ''.join(iter_serialize_database(metamodel))
+
+
+def iter_serialize(resource):
+    '''
+    Serialize some xtuml *resource*, e.g. an instance or a complete metamodel,
+    and yield the result in chunks rather than as one single string.
+    
+    Usage example:
+    
+    >>> for s in xtuml.iter_serialize(m):
+    ...     sys.stdout.write(s)
+    '''
+    if isinstance(resource, xtuml.MetaModel):
+        return iter_serialize_database(resource)
+
+    s = serialize(resource)
+    if s is None:
+        return iter(())
     
-    return ''.join([schema, instances, identifiers])
+    return iter([s])
 
 
 def serialize(resource):
@@ -193,15 +425,50 @@ def serialize(resource):
         return serialize_instance(resource)
 
 
-def persist_instances(metamodel, path, mode='w'):
+def write_chunks(stream, chunks, buffer_size=1 << 16):
+    '''
+    Write *chunks* of serialized text to a *stream*. Chunks are buffered, and
+    written to the stream when at least *buffer_size* characters have
+    accumulated.
+    '''
+    buf = list()
+    size = 0
+    for s in chunks:
+        buf.append(s)
+        size += len(s)
+        if size >= buffer_size:
+            stream.write(''.join(buf))
+            del buf[:]
+            size = 0
+
+    if buf:
+        stream.write(''.join(buf))
+
+
+def serialize_to(stream, resource, buffer_size=1 << 16):
+    '''
+    Serialize some xtuml *resource*, e.g. an instance or a complete metamodel,
+    and write it to a *stream*, e.g. a file opened in text mode. The complete
+    serialization is never kept in memory at once.
+    
+    Usage example:
+    
+    >>> with open('db.sql', 'w') as f:
+    ...     xtuml.serialize_to(f, m)
+    '''
+    write_chunks(stream, iter_serialize(resource), buffer_size)
+
+
+def persist_instances(metamodel, path, mode='w', processes=1):
     '''
     Persist all instances in a *metamodel* by serializing them and saving to a 
-    *path* on disk.
+    *path* on disk. Optionally, serialize instances in a number of worker
+    *processes*, or one per core if None is given. The result is the same
+    regardless of the number of processes.
     '''
+    xtuml.release_mapped_file(path)
     with open(path, mode) as f:
-        for inst in metamodel.instances:
-            s = serialize_instance(inst)
-            f.write(s)
+        write_chunks(f, _iter_instances(metamodel, processes))
 
 
 def persist_schema(metamodel, path, mode='w'):
@@ -209,14 +476,10 @@ def persist_schema(metamodel, path, mode='w'):
     Persist all class and association definitions in a *metamodel* by 
     serializing them and saving to a *path* on disk.
     '''
+    xtuml.release_mapped_file(path)
     with open(path, mode) as f:
-        for kind in sorted(metamodel.metaclasses.keys()):
-            s = serialize_class(metamodel.metaclasses[kind].clazz)
-            f.write(s)
-            
-        for ass in sorted(metamodel.associations, key=lambda x: x.rel_id):
-            s = serialize_association(ass)
-            f.write(s)
+        write_chunks(f, iter_serialize_classes(metamodel))
+        write_chunks(f, iter_serialize_associations(metamodel))
 
 
 def persist_unique_identifiers(metamodel, path, mode='w'):
@@ -224,39 +487,108 @@ def persist_unique_identifiers(metamodel, path, mode='w'):
     Persist all unique identifiers in a *metamodel* by serializing them and
     saving to a *path* on disk.
     '''
+    xtuml.release_mapped_file(path)
     with open(path, mode) as f:
-        for metaclass in metamodel.metaclasses.values():
-            for index_name, attribute_names in metaclass.indices.items():
-                attribute_names = ', '.join(attribute_names)
-                s = 'CREATE UNIQUE INDEX %s ON %s (%s);\n' % (index_name,
-                                                              metaclass.kind,
-                                                              attribute_names)
-                f.write(s)
+        write_chunks(f, iter_serialize_unique_identifiers(metamodel))
 
 
-def persist_database(metamodel, path, mode='w'):
+def _iter_persist_database(metamodel, processes=1):
+    '''
+    Serialize a *metamodel* in the order in which *persist_database()* saves
+    it, i.e. each class definition followed by its unique identifiers, then
+    association definitions and instances. Instances are serialized in a
+    number of worker *processes* unless only one is requested.
+    '''
+    for kind in sorted(metamodel.metaclasses.keys()):
+        metaclass = metamodel.metaclasses[kind]
+        yield serialize_class(metaclass.clazz)
+        yield _serialize_indices(metaclass)
+        
+    for s in iter_serialize_associations(metamodel):
+        yield s
+        
+    for s in _iter_instances(metamodel, processes):
+        yield s
+
+        
+def persist_database(metamodel, path, mode='w', processes=1):
     '''
     Persist all instances, class definitions and association definitions in a
     *metamodel* by serializing them and saving to a *path* on disk.
+    Optionally, serialize instances in a number of worker *processes*, see
+    *persist_instances()*.
     '''
+    xtuml.release_mapped_file(path)
     with open(path, mode) as f:
-        for kind in sorted(metamodel.metaclasses.keys()):
-            metaclass = metamodel.metaclasses[kind]
-            s = serialize_class(metaclass.clazz)
-            f.write(s)
+        write_chunks(f, _iter_persist_database(metamodel, processes))
+
+
+def iter_serialize_delta(metamodel, since=None):
+    '''
+    Serialize changes to instances in a *metamodel* since a checkpoint, see
+    *xtuml.MetaModel.checkpoint()*, and yield them in chunks. By default,
+    changes since tracking started are serialized.
+
+    Instances that were deleted or changed are named by DELETE FROM
+    statements, with values as they were at the checkpoint, followed by
+    INSERT INTO statements for instances that were created or changed.
+    '''
+    if metamodel.changes is None:
+        raise xtuml.MetaModelException('Changes are not being tracked')
+    
+    instances = list()
+    rows = dict()
+    for inst, row in metamodel.changes[since or 0:]:
+        if inst not in rows:
+            instances.append(inst)
+            rows[inst] = row
+
+    prefix = len('INSERT INTO')
+    inserts = list()
+    for inst in instances:
+        metaclass = xtuml.get_metaclass(inst)
+        if inst in metaclass.storage:
+            current = row_formatter(metaclass)(inst)
+        else:
+            current = None
             
-            for index_name, attribute_names in metaclass.indices.items():
-                attribute_names = ', '.join(attribute_names)
-                s = 'CREATE UNIQUE INDEX %s ON %s (%s);\n' % (index_name,
-                                                              metaclass.kind,
-                                                              attribute_names)
-                f.write(s)
-                
-        for ass in sorted(metamodel.associations, key=lambda x: x.rel_id):
-            s = serialize_association(ass)
-            f.write(s)
-
-        for inst in metamodel.instances:
-            s = serialize_instance(inst)
-            f.write(s)
+        row = rows[inst]
+        if row == current:
+            continue
+        
+        if row is not None:
+            yield 'DELETE FROM' + row[prefix:]
+
+        if current is not None:
+            inserts.append(current)
+
+    for s in inserts:
+        yield s
+
+
+def serialize_delta(metamodel, since=None):
+    '''
+    Serialize changes to instances in a *metamodel* since a checkpoint, see
+    *iter_serialize_delta()*.
+    '''
+    return ''.join(iter_serialize_delta(metamodel, since))
 
+
+def persist_delta(metamodel, path, since=None, mode='w'):
+    '''
+    Persist changes to instances in a *metamodel* since a checkpoint by
+    serializing them and saving to a *path* on disk. The changes may be
+    applied to the metamodel as it was at the checkpoint, or to a metamodel
+    loaded from a file persisted at the checkpoint, see *xtuml.load_delta()*.
+    
+    Usage example:
+    
+    >>> checkpoint = m.checkpoint()
+    >>> xtuml.persist_database(m, 'db.sql')
+    >>> m.new('X')
+    >>> xtuml.persist_delta(m, 'delta.sql', since=checkpoint)
+    >>> m = xtuml.load_metamodel(['db.sql', 'delta.sql'])
+    '''
+    xtuml.release_mapped_file(path)
+    with open(path, mode) as f:
+        write_chunks(f, iter_serialize_delta(metamodel, since))
@@ -131,7 +131,8 @@ class OrderedSet(collections.MutableSet):
     def __init__(self, iterable=None):
         self.end = end = [] 
         end += [None, end, end]         # sentinel node for doubly linked list
-        self.map = {}                   # key --> [key, prev, next]
+        self.map = {}                   # key --> [key, prev, next, position]
+        self.insertions = 0
         if iterable is not None:
             self |= iterable
 
@@ -139,11 +140,13 @@ class OrderedSet(collections.MutableSet):
         if key not in self.map:
             end = self.end
             curr = end[1]
-            curr[2] = end[1] = self.map[key] = [key, curr, end]
+            curr[2] = end[1] = self.map[key] = [key, curr, end,
+                                                self.insertions]
+            self.insertions += 1
 
     def discard(self, key):
         if key in self.map:        
-            key, prev, next_ = self.map.pop(key)
+            key, prev, next_, _ = self.map.pop(key)
             prev[2] = next_
             next_[1] = prev
 
@@ -159,6 +162,14 @@ class OrderedSet(collections.MutableSet):
         self.discard(key)
         return key
     
+    def position(self, key):
+        '''
+        Obtain the position of a *key* in the order in which keys were added.
+        Positions are not renumbered when keys are discarded, so they are
+        only meaningful relative to each other.
+        '''
+        return self.map[key][3]
+    
     def __len__(self):
         return len(self.map)
 